@@ -3,6 +3,12 @@
 # Version of the dvgutils package
 __version__ = "0.1.2"
 
-from .logger import setup_logger
-from .config import load_config, overwrite_config
 from .colors import colors
+from .helpers.lazy_import import lazy_import
+
+# Import logger and config helpers (YAML, tqdm) on first use
+__getattr__, __dir__ = lazy_import(__name__, {
+    "setup_logger": ".logger",
+    "load_config": ".config",
+    "overwrite_config": ".config",
+})
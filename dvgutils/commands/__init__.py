@@ -1,3 +1,8 @@
-from .images_to_video import images_to_video
-from .video_to_images import video_to_images
-from .plot_metrics import plot_metrics
+from ..helpers.lazy_import import lazy_import
+
+# Import commands on first use
+__getattr__, __dir__ = lazy_import(__name__, {
+    "images_to_video": ".images_to_video",
+    "video_to_images": ".video_to_images",
+    "plot_metrics": ".plot_metrics",
+})
@@ -1,33 +1,139 @@
+import logging
+
 import numpy as np
 
+from dvgutils.helpers.histogram import Histogram
+from dvgutils.modules.metrics import load_metrics
+
+# Number of iterations processed at once (memory-mapped metrics are read block by block)
+BLOCK_SIZE = 1 << 20
+
+
+def _chart_blocks(metrics, chart, bucket):
+    """Yields the chart values of the consecutive blocks of the metrics"""
+    block_size = max(BLOCK_SIZE // bucket, 1) * bucket
+    elapsed = 0.0
+    for start in range(0, len(metrics), block_size):
+        block = np.asarray(metrics[start:start + block_size], dtype=np.float64)
+        if block.ndim == 2:
+            # Text metrics with the iteration time, iterations per second and seconds per iteration columns
+            column = {"iter": 0, "ips": 1, "spi": 2}[chart]
+            values = block[:, column]
+            yield block[:, 0], values if chart == "ips" else values * 1000
+            continue
+
+        if chart == "iter":
+            yield block, block * 1000
+        else:
+            # Elapsed time and the number of iterations before each iteration
+            before = elapsed + np.cumsum(block) - block
+            iterations = np.arange(start, start + len(block))
+            values = np.zeros(len(block))
+            if chart == "ips":
+                np.divide(iterations, before, out=values, where=before > 0)
+            else:
+                np.divide(before * 1000, iterations, out=values, where=before > 0)
+            elapsed = before[-1] + block[-1]
+            yield block, values
+
+
+def _decimate(values, bucket):
+    """Keeps the min and max of every bucket of values (in the order of iterations)"""
+    num_full = len(values) // bucket * bucket
+    parts = [values[:num_full].reshape(-1, bucket)]
+    if num_full < len(values):
+        parts.append(values[num_full:][None])
+
+    xs, ys = [], []
+    offset = 0
+    for part in parts:
+        rows = np.arange(len(part))[:, None]
+        idx = np.sort(np.stack((part.argmin(axis=1), part.argmax(axis=1)), axis=1), axis=1)
+        xs.append((idx + rows * part.shape[1] + offset).ravel())
+        ys.append(part[rows, idx].ravel())
+        offset += part.size
+
+    return np.concatenate(xs), np.concatenate(ys)
+
+
+def load_chart(metrics, chart, points=2000):
+    """Calculates the decimated chart and the iteration time statistics of the metrics.
+
+    Every bucket of iterations is reduced to its min and max values, so spikes are preserved
+    at the resolution of the plot.
+
+    :param numpy.ndarray metrics: iteration times (N,) or text metrics (N, 3) (see `load_metrics`)
+    :param str chart: iter, ips or spi
+    :param int points: number of buckets
+
+    :returns: iterations (1-based), chart values and the iteration time statistics (with the mean of the chart values)
+    :rtype: (numpy.ndarray, numpy.ndarray, dict[str, float])
+    """
+    bucket = max(-(-len(metrics) // points), 1)
+    histogram = Histogram()
+    iter_max = 0.0
+    values_sum = 0.0
+    xs, ys = [], []
+    offset = 0
+    for times, values in _chart_blocks(metrics, chart, bucket):
+        histogram.add_array(times)
+        iter_max = max(iter_max, float(times.max()))
+        values_sum += float(values.sum())
+        x, y = _decimate(values, bucket)
+        xs.append(x + offset + 1)
+        ys.append(y)
+        offset += len(values)
+
+    p95, p99 = histogram.quantiles(0.95, 0.99)
+    stats = {
+        "iterations": histogram.count,
+        "mean": histogram.sum / histogram.count if histogram.count else np.nan,
+        "p95": p95,
+        "p99": p99,
+        "max": iter_max if histogram.count else np.nan,
+        "chart_mean": values_sum / histogram.count if histogram.count else np.nan
+    }
+
+    if not xs:
+        return np.empty(0, dtype=np.int64), np.empty(0), stats
+
+    return np.concatenate(xs), np.concatenate(ys), stats
+
 
 def plot_metrics(args):
     from matplotlib import pyplot as plt
 
+    logger = logging.getLogger(__name__)
+
     # Plot metrics
     fig, ax = plt.subplots(dpi=128, figsize=(10, 6))
     color_idx = np.linspace(0, 1, len(args["input"]))
     title = None
     ylabel = None
+    max_iterations = 1
     for i, metrics_file in zip(color_idx, args["input"]):
-        metrics = np.loadtxt(metrics_file)
-        iterations = np.arange(1, len(metrics) + 1)
+        metrics = load_metrics(metrics_file)
+        iterations, values, stats = load_chart(metrics, args["chart"], args["points"])
         if args["chart"] == "iter":
-            metrics = metrics[:, 0] * 1000
             title = "Iteration execution time"
             ylabel = "[ms]"
         elif args["chart"] == "ips":
-            metrics = metrics[:, 1]
             title = "Averaged iterations per second"
             ylabel = "[it/s]"
         elif args["chart"] == "spi":
-            metrics = metrics[:, 2] * 1000
             title = "Averaged milliseconds per iteration"
             ylabel = "[ms/it]"
-        mean = [np.mean(metrics)] * len(metrics)
-        ax.plot(iterations, metrics, label=f"{metrics_file} data", color=plt.cm.cool(i))
-        ax.plot(iterations, mean, label=f"{metrics_file} mean", linestyle="--", color=plt.cm.cool(i))
-        ax.set_xlim(1, len(metrics) + 1)
+
+        logger.info(f"{metrics_file}: {stats['iterations']} it, "
+                    f"mean {stats['mean'] * 1000:.3f} ms, "
+                    f"p95 {stats['p95'] * 1000:.3f} ms, "
+                    f"p99 {stats['p99'] * 1000:.3f} ms, "
+                    f"max {stats['max'] * 1000:.3f} ms")
+
+        ax.plot(iterations, values, label=f"{metrics_file} data", color=plt.cm.cool(i))
+        ax.axhline(stats["chart_mean"], label=f"{metrics_file} mean", linestyle="--", color=plt.cm.cool(i))
+        max_iterations = max(max_iterations, len(metrics))
+    ax.set_xlim(1, max_iterations + 1)
 
     # Format Plot
     plt.grid(True)
@@ -1,2 +1,6 @@
 from .observable import Observable
-from .timeit import timeit
\ No newline at end of file
+from .timeit import timeit
+from .lazy_import import lazy_import
+from .histogram import Histogram
+from .sampling_profiler import SamplingProfiler
+from .memory_tracker import MemoryTracker
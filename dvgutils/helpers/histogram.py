@@ -0,0 +1,103 @@
+import bisect
+import itertools
+import math
+
+
+class Histogram:
+    """Streaming histogram with logarithmic buckets.
+
+    Keeps the distribution of positive values (e.g. latencies in seconds) in bounded memory
+    with O(1) updates. Quantiles are estimated with the relative error given by the bucket growth factor.
+
+    :param float min_value: lower bound of the first bucket (smaller values fall into the underflow bucket)
+    :param float max_value: upper bound of the last bucket (larger values fall into the overflow bucket)
+    :param float growth: ratio of the bucket bounds
+    """
+    def __init__(self, min_value=1e-6, max_value=1e3, growth=1.02):
+        self.min_value = min_value
+        self.max_value = max_value
+        self.growth = growth
+
+        self._log_min = math.log(min_value)
+        self._log_growth = math.log(growth)
+        num_buckets = int(math.ceil((math.log(max_value) - self._log_min) / self._log_growth))
+        # Underflow bucket, logarithmic buckets and overflow bucket
+        self.bounds = [min_value * growth ** i for i in range(num_buckets + 1)] + [math.inf]
+        self.counts = [0] * len(self.bounds)
+        self.count = 0
+        self.sum = 0.0
+
+    def add(self, value):
+        """Add the value to the histogram.
+
+        :param float value: value to add
+        """
+        if value <= self.min_value:
+            idx = 0
+        else:
+            idx = min(int((math.log(value) - self._log_min) / self._log_growth) + 1, len(self.counts) - 1)
+        self.counts[idx] += 1
+        self.count += 1
+        self.sum += value
+
+    def add_array(self, values):
+        """Add the array of values to the histogram.
+
+        :param numpy.ndarray values: values to add
+        """
+        import numpy as np
+
+        values = np.asarray(values, dtype=np.float64).ravel()
+        with np.errstate(divide="ignore", invalid="ignore"):
+            idx = np.floor((np.log(values) - self._log_min) / self._log_growth) + 1
+        idx = np.clip(np.where(values <= self.min_value, 0, idx), 0, len(self.counts) - 1).astype(np.intp)
+        counts = np.bincount(idx, minlength=len(self.counts))
+        self.counts = [a + int(b) for a, b in zip(self.counts, counts)]
+        self.count += len(values)
+        self.sum += float(values.sum())
+
+    def quantiles(self, *qs):
+        """Estimate the quantiles of the values.
+
+        :param float qs: quantiles (0 - 1) to estimate
+
+        :returns: estimated quantiles (geometric middle of the bucket the quantile falls into)
+        :rtype: list[float]
+        """
+        if self.count == 0:
+            return [math.nan] * len(qs)
+
+        cumulative = list(itertools.accumulate(self.counts))
+        values = []
+        for q in qs:
+            idx = bisect.bisect_left(cumulative, max(q * self.count, 1))
+            if idx == 0:
+                values.append(self.min_value)
+            elif idx == len(self.counts) - 1:
+                values.append(self.max_value)
+            else:
+                values.append(math.sqrt(self.bounds[idx - 1] * self.bounds[idx]))
+
+        return values
+
+    def quantile(self, q):
+        """Estimate the quantile of the values.
+
+        :param float q: quantile (0 - 1) to estimate
+        :rtype: float
+        """
+        return self.quantiles(q)[0]
+
+    def merge(self, other):
+        """Add the counts of the other histogram with the same buckets.
+
+        :param Histogram other: histogram to merge
+        """
+        if other.bounds != self.bounds:
+            raise ValueError("Cannot merge histograms with different buckets")
+
+        self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+        self.count += other.count
+        self.sum += other.sum
+
+        return self
@@ -0,0 +1,55 @@
+import importlib
+import importlib.util
+import types
+
+
+def lazy_import(package, imports):
+    """Create module level __getattr__ and __dir__ functions importing package attributes on first access.
+
+    Importing a package stays cheap as the heavy dependencies (OpenCV, NumPy, YAML, ...) are imported
+    only when an attribute using them is accessed.
+
+    An attribute can have the same name as the submodule it is imported from (e.g. the commands).
+    Importing the submodule binds it to the package attribute, so the package module keeps the attribute
+    of the submodule instead (whichever is imported first, the attribute or the submodule).
+
+    Example usage (in the package __init__.py)::
+
+        from ..helpers.lazy_import import lazy_import
+
+        __getattr__, __dir__ = lazy_import(__name__, {
+            "VideoCapture": ".video_capture",
+        })
+
+    :param str package: name of the package
+    :param dict[str, str] imports: attribute name to (relative) module name it is imported from
+
+    :returns: __getattr__ and __dir__ functions
+    :rtype: (callable, callable)
+    """
+    module = importlib.import_module(package)
+
+    class LazyModule(types.ModuleType):
+        def __setattr__(self, name, value):
+            # Replace the submodule bound by the import system with its attribute of the same name
+            if name in imports and isinstance(value, types.ModuleType) and \
+                    value.__name__ == importlib.util.resolve_name(imports[name], package):
+                value = getattr(value, name)
+            super().__setattr__(name, value)
+
+    module.__class__ = LazyModule
+
+    def __getattr__(name):
+        if name not in imports:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+        value = getattr(importlib.import_module(imports[name], package), name)
+        # Cache the attribute so __getattr__ is not called anymore
+        setattr(module, name, value)
+
+        return value
+
+    def __dir__():
+        return sorted(set(vars(module)) | set(imports))
+
+    return __getattr__, __dir__
@@ -0,0 +1,195 @@
+import dis
+import logging
+import os
+import threading
+import tracemalloc
+from collections import namedtuple
+
+from .sampling_profiler import pipe_code_objects
+
+MemorySample = namedtuple("MemorySample", "rss, traced, pipes")
+
+
+def rss():
+    """Returns the resident set size of the process [B] (peak RSS if the current one is not available).
+
+    :rtype: int | None
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        pass
+
+    try:
+        import resource
+        import sys
+    except ImportError:
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+def _format_size(size):
+    for unit in ("B", "KiB", "MiB"):
+        if abs(size) < 1024:
+            return f"{size:.1f} {unit}" if unit != "B" else f"{size} B"
+        size /= 1024
+
+    return f"{size:.1f} GiB"
+
+
+class MemoryTracker:
+    """Periodic memory accounting of the pipes.
+
+    A background thread takes tracemalloc snapshots and the process RSS every `interval` seconds.
+    The memory still allocated at the snapshot is attributed to the pipe which code is the innermost
+    one in the allocation traceback. Pipes which memory grows in each of the last `growth_samples`
+    samples are flagged as growing (possible leaks).
+
+    :param float interval: sampling interval [s]
+    :param int nframes: number of frames stored in the allocation tracebacks
+    :param int growth_samples: number of consecutive growths flagging the pipe
+    :param int top: number of the top allocation sites in the report
+    """
+    def __init__(self, interval=10.0, nframes=25, growth_samples=5, top=10):
+        self.logger = logging.getLogger(__name__)
+
+        self.interval = interval
+        self.nframes = nframes
+        self.growth_samples = growth_samples
+        self.top = top
+
+        self.samples = []
+        self.first_snapshot = None
+        self.last_snapshot = None
+
+        self._pipe_lines = {}
+        self._pipe_names = []
+        self._started_tracing = False
+        self._thread = None
+        self._stopped = threading.Event()
+
+    def add_pipe(self, pipe, name):
+        """Attribute the memory allocated in the code of the pipe to the pipe name.
+
+        :param pipe: pipe function or object
+        :param str name: pipe name
+        """
+        for code in pipe_code_objects(pipe):
+            lines = [line for _, line in dis.findlinestarts(code) if line is not None]
+            if lines:
+                self._pipe_lines.setdefault(code.co_filename, []).append((min(lines), max(lines), name))
+        self._pipe_names.append(name)
+
+    def _pipe(self, traceback):
+        # Innermost pipe frame of the allocation traceback (frames are sorted from the oldest one)
+        for frame in reversed(traceback):
+            for first_line, last_line, name in self._pipe_lines.get(frame.filename, ()):
+                if first_line <= frame.lineno <= last_line:
+                    return name
+
+        return None
+
+    def _snapshot(self):
+        return tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            tracemalloc.Filter(False, "<unknown>")
+        ))
+
+    def sample(self):
+        """Take the snapshot and attribute the allocated memory to the pipes"""
+        snapshot = self._snapshot()
+        pipes = dict.fromkeys(self._pipe_names, 0)
+        traced = 0
+        for statistic in snapshot.statistics("traceback"):
+            pipe = self._pipe(statistic.traceback)
+            if pipe is not None:
+                pipes[pipe] += statistic.size
+            traced += statistic.size
+
+        self.samples.append(MemorySample(rss(), traced, pipes))
+        if self.first_snapshot is None:
+            self.first_snapshot = snapshot
+        self.last_snapshot = snapshot
+
+    def _run(self):
+        while not self._stopped.wait(self.interval):
+            self.sample()
+
+    def start(self):
+        """Start tracing (if not already tracing) and sampling.
+
+        :returns: self
+        """
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.nframes)
+            self._started_tracing = True
+        self.sample()
+
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name="MemoryTracker", daemon=True)
+        self._thread.start()
+
+        return self
+
+    def stop(self):
+        """Stop sampling (the last sample is taken) and tracing started by the tracker"""
+        if self._thread is None:
+            return
+
+        self._stopped.set()
+        self._thread.join()
+        self._thread = None
+        self.sample()
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def growing(self):
+        """Returns the pipes (and "rss") which memory grew in each of the last `growth_samples` samples.
+
+        :rtype: list[str]
+        """
+        if len(self.samples) <= self.growth_samples:
+            return []
+
+        last_samples = self.samples[-self.growth_samples - 1:]
+        series = {name: [sample.pipes[name] for sample in last_samples] for name in self._pipe_names}
+        if all(sample.rss is not None for sample in last_samples):
+            series["rss"] = [sample.rss for sample in last_samples]
+
+        return [name for name, sizes in series.items() if all(a < b for a, b in zip(sizes, sizes[1:]))]
+
+    def report(self):
+        """Returns the report of the memory of the pipes and the top allocation sites.
+
+        :rtype: str
+        """
+        if not self.samples:
+            return "No memory samples"
+
+        first, last = self.samples[0], self.samples[-1]
+        growing = self.growing()
+        width = max([len(name) for name in self._pipe_names] + [4])
+        lines = [f"{'pipe':<{width}} {'first':>12} {'last':>12} {'growth':>12}"]
+        for name in self._pipe_names:
+            lines.append(f"{name:<{width}} {_format_size(first.pipes[name]):>12} {_format_size(last.pipes[name]):>12} "
+                         f"{_format_size(last.pipes[name] - first.pipes[name]):>12}"
+                         f"{'  GROWING' if name in growing else ''}")
+        lines.append(f"{'traced':<{width}} {_format_size(first.traced):>12} {_format_size(last.traced):>12} "
+                     f"{_format_size(last.traced - first.traced):>12}")
+        if first.rss is not None and last.rss is not None:
+            lines.append(f"{'rss':<{width}} {_format_size(first.rss):>12} {_format_size(last.rss):>12} "
+                         f"{_format_size(last.rss - first.rss):>12}{'  GROWING' if 'rss' in growing else ''}")
+
+        if self.first_snapshot is not self.last_snapshot:
+            lines.append(f"Top {self.top} allocation sites by growth:")
+            for statistic in self.last_snapshot.compare_to(self.first_snapshot, "lineno")[:self.top]:
+                frame = statistic.traceback[-1]
+                lines.append(f"  {frame.filename}:{frame.lineno}: {_format_size(statistic.size_diff)} "
+                             f"({statistic.count_diff:+d} blocks, {_format_size(statistic.size)} total)")
+
+        return "\n".join(lines)
@@ -0,0 +1,126 @@
+import os
+import sys
+import threading
+import types
+from collections import Counter
+
+
+def pipe_code_objects(pipe):
+    """Returns the code objects of the pipe function or of the methods of the pipe class"""
+    if isinstance(pipe, (types.FunctionType, types.MethodType)):
+        return [pipe.__code__]
+
+    codes = []
+    for cls in type(pipe).__mro__[:-1]:
+        for value in vars(cls).values():
+            if isinstance(value, (staticmethod, classmethod)):
+                value = value.__func__
+            if isinstance(value, types.FunctionType):
+                codes.append(value.__code__)
+
+    return codes
+
+
+class SamplingProfiler:
+    """Statistical profiler sampling the stacks of the running threads.
+
+    A background thread samples the stacks of all other threads every `interval` seconds and counts
+    the samples of the same stacks. Samples are attributed to the pipe which code is the innermost
+    one on the stack, so the processing threads are not instrumented. The samples are saved
+    in the collapsed stack format (`thread;pipe;frame;...;frame count`) of the flame graph tools.
+
+    :param float interval: sampling interval [s]
+    """
+    def __init__(self, interval=0.01):
+        self.interval = interval
+        self.samples = Counter()
+        self.num_samples = 0
+
+        self._code_pipes = {}
+        self._labels = {}
+        self._thread = None
+        self._stopped = threading.Event()
+
+    def add_pipe(self, pipe, name):
+        """Attribute the samples in the code of the pipe to the pipe name.
+
+        :param pipe: pipe function or object
+        :param str name: pipe name
+        """
+        for code in pipe_code_objects(pipe):
+            self._code_pipes.setdefault(code, name)
+
+    def _label(self, code):
+        label = self._labels.get(code)
+        if label is None:
+            label = self._labels[code] = \
+                f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+        return label
+
+    def sample(self):
+        """Sample the stacks of all threads except the profiler thread"""
+        thread_names = {thread.ident: thread.name for thread in threading.enumerate()}
+        own_ident = threading.get_ident()
+        for ident, frame in sys._current_frames().items():
+            if ident == own_ident:
+                continue
+
+            pipe = None
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                if pipe is None:
+                    pipe = self._code_pipes.get(code)
+                stack.append(self._label(code))
+                frame = frame.f_back
+            stack.reverse()
+
+            self.samples[(thread_names.get(ident, str(ident)), pipe, tuple(stack))] += 1
+        self.num_samples += 1
+
+    def _run(self):
+        while not self._stopped.wait(self.interval):
+            self.sample()
+
+    def start(self):
+        """Start sampling.
+
+        :returns: self
+        """
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name="SamplingProfiler", daemon=True)
+        self._thread.start()
+
+        return self
+
+    def stop(self):
+        """Stop sampling"""
+        if self._thread is not None:
+            self._stopped.set()
+            self._thread.join()
+            self._thread = None
+
+    def pipe_samples(self):
+        """Returns the number of samples of the pipes (samples outside of the pipes are counted as None).
+
+        :rtype: collections.Counter
+        """
+        counter = Counter()
+        for (thread, pipe, stack), count in self.samples.items():
+            counter[pipe] += count
+
+        return counter
+
+    def save(self, filename):
+        """Save the samples in the collapsed stack format (e.g. for flamegraph.pl or speedscope).
+
+        :param str filename: output file path
+        """
+        dirname = os.path.dirname(os.path.abspath(filename))
+        os.makedirs(dirname, exist_ok=True)
+
+        with open(filename, "w") as f:
+            for (thread, pipe, stack), count in sorted(self.samples.items(), key=lambda item: -item[1]):
+                frames = [thread] + ([f"[{pipe}]"] if pipe else []) + list(stack)
+                f.write(f"{';'.join(frame.replace(';', ':') for frame in frames)} {count}\n")
@@ -1,29 +1,229 @@
+import atexit
+import contextlib
 import logging
+import os
 import time
 import functools
 
+from .histogram import Histogram
+
+# Environment variable selecting the timeit mode: log (default), aggregate or off
+TIMEIT_ENV = "DVG_TIMEIT"
+TIMEIT_MODES = ("log", "aggregate", "off")
+
+_mode = os.environ.get(TIMEIT_ENV, "log")
+if _mode not in TIMEIT_MODES:
+    _mode = "log"
+_report_at_exit = False
+
+# Aggregated execution times of the decorated functions
+registry = {}
+
+
+class TimeitStats:
+    """Aggregated execution times of the function.
+
+    The execution times [ns] are kept in the logarithmic histogram with about 6% resolution.
+
+    :param str name: function name
+    """
+    __slots__ = ("name", "min", "max", "histogram")
+
+    def __init__(self, name):
+        self.name = name
+        self.reset()
+
+    def reset(self):
+        self.min = 1 << 64
+        self.max = 0
+        self.histogram = Histogram(min_value=1, max_value=1e13, growth=1.06)
+
+    @property
+    def count(self):
+        return self.histogram.count
+
+    @property
+    def total(self):
+        """Total execution time [ns]"""
+        return self.histogram.sum
+
+    def add(self, elapsed_ns):
+        """Add the execution time.
+
+        :param int elapsed_ns: execution time [ns]
+        """
+        if elapsed_ns < self.min:
+            self.min = elapsed_ns
+        if elapsed_ns > self.max:
+            self.max = elapsed_ns
+        self.histogram.add(elapsed_ns)
+
+    def quantile(self, q):
+        """Estimate the quantile of the execution time.
+
+        :param float q: quantile (0 - 1)
+
+        :returns: execution time [ns]
+        :rtype: float
+        """
+        if self.count == 0:
+            return float("nan")
+
+        # The estimate within the observed range
+        return min(max(self.histogram.quantile(q), self.min), self.max)
+
+    def __repr__(self):
+        return f"TimeitStats(name={self.name!r}, count={self.count}, total={self.total})"
+
+
+def set_mode(mode):
+    """Set the global timeit mode.
+
+    * log - log the execution time of every call (debug level)
+    * aggregate - aggregate the execution times in the registry (see `report`), the report is logged at exit
+    * off - call the functions without measuring
+
+    :param str mode: log, aggregate or off
+
+    :returns: previous mode
+    :rtype: str
+    """
+    global _mode, _report_at_exit
+
+    if mode not in TIMEIT_MODES:
+        raise ValueError(f"Unsupported timeit mode: {mode}")
+
+    previous, _mode = _mode, mode
+    if mode == "aggregate" and not _report_at_exit:
+        _report_at_exit = True
+        atexit.register(_log_report)
+
+    return previous
+
+
+def get_mode():
+    return _mode
+
+
+def reset():
+    """Clear the aggregated execution times"""
+    for stats in registry.values():
+        stats.reset()
+
+
+def report(sort="total"):
+    """Returns the table of the aggregated execution times.
+
+    :param str sort: column to sort by (descending): total, count, mean, max or name (ascending)
+
+    :rtype: str
+    """
+    rows = [stats for stats in registry.values() if stats.count]
+    if sort == "name":
+        rows.sort(key=lambda stats: stats.name)
+    else:
+        key = {
+            "total": lambda stats: stats.total,
+            "count": lambda stats: stats.count,
+            "mean": lambda stats: stats.total / stats.count,
+            "max": lambda stats: stats.max
+        }[sort]
+        rows.sort(key=key, reverse=True)
+
+    width = max([len(stats.name) for stats in rows] + [8])
+    lines = [f"{'function':<{width}} {'count':>10} {'total ms':>12} {'mean ms':>10} {'min ms':>10} "
+             f"{'p50 ms':>10} {'p95 ms':>10} {'p99 ms':>10} {'max ms':>10}"]
+    for stats in rows:
+        p50, p95, p99 = (stats.quantile(q) / 1e6 for q in (0.5, 0.95, 0.99))
+        lines.append(f"{stats.name:<{width}} {stats.count:>10} {stats.total / 1e6:>12.3f} "
+                     f"{stats.total / stats.count / 1e6:>10.4f} {stats.min / 1e6:>10.4f} {p50:>10.4f} "
+                     f"{p95:>10.4f} {p99:>10.4f} {stats.max / 1e6:>10.4f}")
+
+    return "\n".join(lines)
+
+
+def _log_report():
+    if any(stats.count for stats in registry.values()):
+        logging.getLogger(__name__).info("Execution times:\n" + report())
+
+
+@contextlib.contextmanager
+def aggregate(log_report=True, sort="total"):
+    """Context manager aggregating the execution times of the decorated functions.
+
+    Example usage::
+
+        from dvgutils.helpers import timeit
+
+        with timeit.aggregate():
+            pipeline.run()
+
+    :param bool log_report: log the report on exit
+    :param str sort: report column to sort by (see `report`)
+    """
+    global _mode
+
+    previous, _mode = _mode, "aggregate"
+    try:
+        yield registry
+    finally:
+        _mode = previous
+        if log_report:
+            logging.getLogger(__name__).info("Execution times:\n" + report(sort))
+
 
 def timeit(func):
     """Python decorator to measure the execution time of methods.
 
+    Depending on the global mode (see `set_mode` and the DVG_TIMEIT environment variable) the execution
+    time of every call is logged (default), aggregated in the registry or not measured.
+
     Example usage::
 
-        from dvgutils import timeit
+        from dvgutils.helpers import timeit
 
         @timeit
         def my_method():
             ...
 
     """
+    # The qualified name tells apart the methods of the same name in the module
+    name = f"{func.__module__}.{func.__qualname__}"
+    logger = logging.getLogger(name)
+    stats = registry.get(name)
+    if stats is None:
+        stats = registry[name] = TimeitStats(name)
+
     @functools.wraps(func)
     def wrapper(*args, **kw):
+        if _mode == "aggregate":
+            start_time = time.perf_counter_ns()
+            result = func(*args, **kw)
+            stats.add(time.perf_counter_ns() - start_time)
+            return result
+        if _mode == "off" or not logger.isEnabledFor(logging.DEBUG):
+            return func(*args, **kw)
+
         start_time = time.perf_counter()
         result = func(*args, **kw)
         end_time = time.perf_counter()
         elapsed_time = (end_time - start_time) * 1000.0
 
-        logging.getLogger(f"{func.__module__}.{func.__name__}").debug(f"{func.__module__}.{func.__name__} execution time: {elapsed_time:0.4f} ms")
+        logger.debug(f"{name} execution time: {elapsed_time:0.4f} ms")
 
         return result
 
     return wrapper
+
+
+# Attach the mode and report API to the decorator (`timeit.aggregate()`, `timeit.report()`, ...)
+timeit.set_mode = set_mode
+timeit.get_mode = get_mode
+timeit.reset = reset
+timeit.report = report
+timeit.aggregate = aggregate
+timeit.registry = registry
+timeit.Stats = TimeitStats
+
+if _mode == "aggregate":
+    set_mode(_mode)
@@ -1,7 +1,13 @@
-from .video_capture import VideoCapture
-from .image_capture import ImageCapture
-from .metrics import Metrics
-from .progress import Progress
-from .show_image import ShowImage
-from .save_image import SaveImage
-from .save_video import SaveVideo
+from ..helpers.lazy_import import lazy_import
+
+# Import modules (OpenCV, tqdm, capture backends) on first use
+__getattr__, __dir__ = lazy_import(__name__, {
+    "VideoCapture": ".video_capture.video_capture",
+    "ImageCapture": ".image_capture",
+    "Metrics": ".metrics",
+    "MetricsExporter": ".metrics_exporter",
+    "Progress": ".progress",
+    "ShowImage": ".show_image",
+    "SaveImage": ".save_image",
+    "SaveVideo": ".save_video",
+})
@@ -1,14 +1,132 @@
+import math
 import os
 import time
+from collections import deque
 
 import numpy as np
 
+from ..helpers.histogram import Histogram
+
+# Fixed size of the .npy header of the metrics log (the shape is rewritten in place)
+LOG_HEADER_SIZE = 128
+
+
+class MetricsLog:
+    """Append-only binary log of iteration times.
+
+    The log is a float64 .npy file written while running. Its header is rewritten on every flush,
+    and `load_metrics` recovers the length of the log from the file size, so the log can be read
+    (memory-mapped) during the run or after a crash.
+
+    :param str filename: log file path (.npy)
+    """
+    def __init__(self, filename):
+        dirname = os.path.dirname(os.path.abspath(filename))
+        os.makedirs(dirname, exist_ok=True)
+
+        self.filename = filename
+        self._file = open(filename, "wb")
+        self._count = 0
+        self._write_header()
+
+    def _write_header(self):
+        header = "{" + f"'descr': '<f8', 'fortran_order': False, 'shape': ({self._count},), " + "}"
+        header = header.ljust(LOG_HEADER_SIZE - 10 - 1) + "\n"
+        self._file.seek(0)
+        self._file.write(b"\x93NUMPY\x01\x00" + len(header).to_bytes(2, "little") + header.encode("latin1"))
+        self._file.seek(0, os.SEEK_END)
+
+    def append(self, values):
+        """Append iteration times to the log.
+
+        :param numpy.ndarray values: iteration times
+        """
+        self._file.write(np.ascontiguousarray(values, dtype="<f8").tobytes())
+        self._count += len(values)
+
+    def flush(self):
+        self._write_header()
+        self._file.flush()
+
+    def close(self):
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+    def __len__(self):
+        return self._count
+
+
+def load_metrics(filename):
+    """Load saved metrics.
+
+    Binary metrics (.npy iteration times) are memory-mapped, so only the parts being read are loaded.
+    Text metrics are loaded as the iteration time, iterations per second and seconds per iteration columns.
+
+    :param str filename: metrics file path
+
+    :returns: iteration times (N,) or text metrics (N, 3)
+    :rtype: numpy.ndarray
+    """
+    if not filename.endswith(".npy"):
+        return np.loadtxt(filename, ndmin=2)
+
+    with open(filename, "rb") as f:
+        version = np.lib.format.read_magic(f)
+        if version == (1, 0):
+            shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(f)
+        else:
+            shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(f)
+        offset = f.tell()
+
+    # The length of the log being written may be ahead of its header
+    row_size = dtype.itemsize * int(np.prod(shape[1:]))
+    count = (os.path.getsize(filename) - offset) // row_size
+    if count == 0:
+        return np.empty((0,) + shape[1:], dtype=dtype)
+
+    return np.memmap(filename, dtype=dtype, mode="r", offset=offset, shape=(count,) + shape[1:])
+
 
 class Metrics:
-    def __init__(self):
+    """Iteration time metrics with streaming statistics.
+
+    Iteration times are stored in preallocated chunks or, in the bounded-memory mode for unbounded
+    streams, in a fixed-size ring buffer keeping only the last `capacity` iterations. Mean, variance,
+    min/max and quantiles (logarithmic histogram) are updated in O(1) over all iterations.
+
+    :param int | None capacity: keep only the last `capacity` iteration times (None keeps all of them)
+    :param int | None window: number of the last iterations for the rolling iterations per second
+    :param int chunk_size: size of the preallocated chunks when keeping all iteration times
+    :param str | None log: file path of the binary log (.npy) the iteration times are appended to while running
+    """
+    def __init__(self, capacity=None, window=None, chunk_size=4096, log=None):
+        self.capacity = capacity
+        self.window = window
+        self.chunk_size = capacity if capacity else chunk_size
+
         self._start_time = None
         self._end_time = None
-        self._metrics = []
+        self._count = 0
+
+        # Iteration times storage
+        self._chunks = []
+        self._pos = self.chunk_size
+
+        # Binary log of the iteration times (the current chunk is appended when full)
+        self.log = MetricsLog(log) if log else None
+        self._log_pos = 0
+
+        # Streaming statistics
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._min = math.inf
+        self._max = -math.inf
+        self.histogram = Histogram()
+
+        # Rolling window
+        self._window_times = deque(maxlen=window) if window else None
+        self._window_sum = 0.0
 
     def start(self):
         self._start_time = time.perf_counter()
@@ -17,9 +135,41 @@ class Metrics:
 
     def update(self):
         now = time.perf_counter()
-        self._metrics.append((now - self._end_time, self.iter_per_sec(), self.sec_per_iter()))
+        iter_time = now - self._end_time
         self._end_time = now
 
+        self._store(iter_time)
+        self._count += 1
+
+        # Welford's running mean and variance
+        delta = iter_time - self._mean
+        self._mean += delta / self._count
+        self._m2 += delta * (iter_time - self._mean)
+        if iter_time < self._min:
+            self._min = iter_time
+        if iter_time > self._max:
+            self._max = iter_time
+        self.histogram.add(iter_time)
+
+        if self._window_times is not None:
+            if len(self._window_times) == self.window:
+                self._window_sum -= self._window_times[0]
+            self._window_times.append(iter_time)
+            self._window_sum += iter_time
+
+    def _store(self, iter_time):
+        if self._pos == self.chunk_size:
+            if self.log is not None and self._chunks:
+                self.log.append(self._chunks[-1][self._log_pos:])
+                self._log_pos = 0
+            if not self.capacity or not self._chunks:
+                self._chunks.append(np.empty(self.chunk_size))
+            # Start the new chunk or wrap around the ring buffer
+            self._pos = 0
+
+        self._chunks[-1][self._pos] = iter_time
+        self._pos += 1
+
     def elapsed(self):
         return self._end_time - self._start_time
 
@@ -30,20 +180,122 @@ class Metrics:
         return len(self) / self.elapsed()
 
     def sec_per_iter(self):
+        """Calculates approximate seconds per iteration"""
         if self._end_time == self._start_time:
             return 0
-        """Calculates approximate seconds per iteration"""
         return self.elapsed() / len(self)
 
+    def rolling_iter_per_sec(self):
+        """Calculates iterations per second over the last `window` iterations"""
+        if not self._window_times or self._window_sum <= 0:
+            return 0
+        return len(self._window_times) / self._window_sum
+
+    def mean(self):
+        """Mean iteration time"""
+        return self._mean if self._count else math.nan
+
+    def std(self):
+        """Standard deviation of the iteration time"""
+        return math.sqrt(self._m2 / self._count) if self._count else math.nan
+
+    def min(self):
+        """Minimal iteration time"""
+        return self._min if self._count else math.nan
+
+    def max(self):
+        """Maximal iteration time"""
+        return self._max if self._count else math.nan
+
+    def quantiles(self, *qs):
+        """Estimated quantiles of the iteration time (e.g. quantiles(0.5, 0.95, 0.99)),
+        clipped to the exact minimal and maximal iteration time"""
+        if not self._count:
+            return self.histogram.quantiles(*qs)
+        return [min(max(value, self._min), self._max) for value in self.histogram.quantiles(*qs)]
+
+    def summary(self):
+        """Returns iteration time statistics.
+
+        :rtype: dict[str, float]
+        """
+        p50, p95, p99 = self.quantiles(0.5, 0.95, 0.99)
+
+        return {
+            "iterations": len(self),
+            "elapsed": self.elapsed(),
+            "iter_per_sec": self.iter_per_sec(),
+            "rolling_iter_per_sec": self.rolling_iter_per_sec(),
+            "mean": self.mean(),
+            "std": self.std(),
+            "min": self.min(),
+            "max": self.max(),
+            "p50": p50,
+            "p95": p95,
+            "p99": p99
+        }
+
     def __len__(self):
-        return len(self._metrics)
+        return self._count
+
+    def times(self):
+        """Returns the stored iteration times in the order of iterations.
+
+        :rtype: numpy.ndarray
+        """
+        if not self._chunks:
+            return np.empty(0)
+
+        if self.capacity:
+            ring = self._chunks[0]
+            if self._count <= self.capacity:
+                return ring[:self._count].copy()
+            return np.concatenate((ring[self._pos:], ring[:self._pos]))
+
+        return np.concatenate(self._chunks[:-1] + [self._chunks[-1][:self._pos]])
 
     def get(self):
-        return self._metrics
+        """Returns stored metrics: iteration time, averaged iterations per second and seconds per iteration
+        (averaged up to the given iteration).
+
+        :rtype: numpy.ndarray
+        """
+        times = self.times()
+
+        # Elapsed time and the number of iterations before each of the stored iterations
+        elapsed = np.maximum(self.elapsed() - times.sum() + np.concatenate(([0.0], np.cumsum(times)[:-1])), 0)
+        iterations = np.arange(len(self) - len(times), len(self))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            iter_per_sec = np.where(elapsed > 0, iterations / elapsed, 0)
+            sec_per_iter = np.where(elapsed > 0, elapsed / iterations, 0)
+
+        return np.column_stack((times, iter_per_sec, sec_per_iter))
+
+    def flush(self):
+        """Append the pending iteration times to the binary log"""
+        if self.log is not None:
+            if self._chunks:
+                self.log.append(self._chunks[-1][self._log_pos:self._pos])
+                self._log_pos = self._pos
+            self.log.flush()
+
+    def close(self):
+        if self.log is not None:
+            self.flush()
+            self.log.close()
 
     def save(self, filename):
+        """Save the stored metrics.
+
+        Files with the .npy extension store the iteration times in the binary format (see `load_metrics`),
+        other files store the iteration time, iterations per second and seconds per iteration columns as text.
+
+        :param str filename: metrics file path
+        """
         dirname = os.path.dirname(os.path.abspath(filename))
         os.makedirs(dirname, exist_ok=True)
 
-        np.savetxt(filename, self._metrics)
-
+        if filename.endswith(".npy"):
+            np.save(filename, self.times())
+        else:
+            np.savetxt(filename, self.get())
@@ -0,0 +1,183 @@
+import logging
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _labels(**labels):
+    return "{" + ",".join(f'{key}="{value}"' for key, value in labels.items()) + "}"
+
+
+class MetricsExporter:
+    """Export live metrics of the running pipeline in the Prometheus text format.
+
+    Metrics are served over HTTP (`port`) and/or periodically written to a text file (`textfile`,
+    e.g. for the node exporter textfile collector). The exporter only reads snapshots of the counters
+    updated by the pipeline, so the processing threads are never blocked.
+
+    Exported metrics:
+
+    * dvg_pipe_latency_seconds (histogram), dvg_pipe_frames_in_total, dvg_pipe_frames_out_total per pipe
+      of the pipeline created with `stats=True`
+    * dvg_capture_frames_total, dvg_capture_dropped_frames_total, dvg_capture_queue_depth and
+      dvg_capture_queue_size per threaded video capture (captures of the pipeline pipes are found automatically)
+    * dvg_iterations_total, dvg_fps and dvg_fps_average of the metrics
+
+    :param pipeline.Pipeline | None pipeline: pipeline to export
+    :param modules.metrics.Metrics | None metrics: iteration metrics (fps is the rolling iterations per second
+        if the metrics have a window)
+    :param list | None captures: additional video captures with the `stats` method
+    :param int | None port: port of the HTTP endpoint
+    :param str host: address of the HTTP endpoint
+    :param str | None textfile: path of the text file
+    :param float interval: interval of writing the text file [s]
+    """
+    def __init__(self, pipeline=None, metrics=None, captures=None, port=None, host="127.0.0.1", textfile=None,
+                 interval=5.0):
+        self.logger = logging.getLogger(__name__)
+
+        self.pipeline = pipeline
+        self.metrics = metrics
+        self.captures = list(captures) if captures else []
+        self.port = port
+        self.host = host
+        self.textfile = textfile
+        self.interval = interval
+
+        self._server = None
+        self._threads = []
+        self._stopped = threading.Event()
+
+    def _find_captures(self):
+        captures = list(self.captures)
+        if self.pipeline is not None:
+            for pipe in self.pipeline.pipes:
+                video_capture = getattr(pipe, "video_capture", None)
+                if video_capture is not None and hasattr(video_capture, "stats"):
+                    captures.append(video_capture)
+
+        return captures
+
+    def render(self):
+        """Returns the current metrics in the Prometheus text format.
+
+        :rtype: str
+        """
+        lines = []
+
+        snapshots = self.pipeline.snapshot() if self.pipeline is not None else []
+        if snapshots:
+            lines += ["# HELP dvg_pipe_latency_seconds Processing latency of the pipe.",
+                      "# TYPE dvg_pipe_latency_seconds histogram"]
+            for snapshot in snapshots:
+                labels = _labels(pipe=snapshot.name)
+                bounds = self.pipeline.stats[snapshot.name].bounds
+                cumulative = 0
+                for bound, count in zip(bounds, snapshot.buckets):
+                    cumulative += count
+                    lines.append(f"dvg_pipe_latency_seconds_bucket{_labels(pipe=snapshot.name, le=f'{bound:g}')} "
+                                 f"{cumulative}")
+                count = sum(snapshot.buckets)
+                lines.append(f"dvg_pipe_latency_seconds_bucket{_labels(pipe=snapshot.name, le='+Inf')} {count}")
+                lines.append(f"dvg_pipe_latency_seconds_sum{labels} {snapshot.latency_sum}")
+                lines.append(f"dvg_pipe_latency_seconds_count{labels} {count}")
+            for metric, field, description in (
+                    ("dvg_pipe_frames_in_total", "frames_in", "Frames received by the pipe."),
+                    ("dvg_pipe_frames_out_total", "frames_out", "Frames passed on by the pipe.")):
+                lines += [f"# HELP {metric} {description}", f"# TYPE {metric} counter"]
+                lines += [f"{metric}{_labels(pipe=snapshot.name)} {getattr(snapshot, field)}"
+                          for snapshot in snapshots]
+
+        # Label the captures with the class of the capture backend
+        captures = [(f"{type(getattr(capture, 'cap', capture)).__name__}_{i}", capture.stats())
+                    for i, capture in enumerate(self._find_captures())]
+        captures = [(name, stats) for name, stats in captures if stats is not None]
+        if captures:
+            for metric, field, metric_type, description in (
+                    ("dvg_capture_frames_total", "frames", "counter", "Frames queued by the threaded capture."),
+                    ("dvg_capture_dropped_frames_total", "dropped", "counter", "Frames dropped on the full queue."),
+                    ("dvg_capture_queue_depth", "queue_depth", "gauge", "Frames waiting in the capture queue."),
+                    ("dvg_capture_queue_size", "queue_size", "gauge", "Size of the capture queue.")):
+                lines += [f"# HELP {metric} {description}", f"# TYPE {metric} {metric_type}"]
+                lines += [f"{metric}{_labels(capture=name)} {stats[field]}" for name, stats in captures]
+
+        if self.metrics is not None:
+            fps = self.metrics.rolling_iter_per_sec() if self.metrics.window else self.metrics.iter_per_sec()
+            lines += ["# HELP dvg_iterations_total Processed iterations.",
+                      "# TYPE dvg_iterations_total counter",
+                      f"dvg_iterations_total {len(self.metrics)}",
+                      "# HELP dvg_fps Current iterations per second.",
+                      "# TYPE dvg_fps gauge",
+                      f"dvg_fps {fps}",
+                      "# HELP dvg_fps_average Iterations per second averaged over the run.",
+                      "# TYPE dvg_fps_average gauge",
+                      f"dvg_fps_average {self.metrics.iter_per_sec()}"]
+
+        return "\n".join(lines) + "\n"
+
+    def write_textfile(self):
+        """Write the current metrics to the text file (replaced atomically)"""
+        tmp_filename = f"{self.textfile}.{os.getpid()}.tmp"
+        with open(tmp_filename, "w") as f:
+            f.write(self.render())
+        os.replace(tmp_filename, self.textfile)
+
+    def _write_textfile_loop(self):
+        while not self._stopped.wait(self.interval):
+            self.write_textfile()
+
+    def start(self):
+        """Start the HTTP endpoint and/or the text file writer.
+
+        :returns: self
+        """
+        if self.port is not None:
+            exporter = self
+
+            class Handler(BaseHTTPRequestHandler):
+                def do_GET(self):
+                    if self.path not in ("/", "/metrics"):
+                        self.send_error(404)
+                        return
+                    body = exporter.render().encode("utf-8")
+                    self.send_response(200)
+                    self.send_header("Content-Type", CONTENT_TYPE)
+                    self.send_header("Content-Length", str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+
+                def log_message(self, format, *args):
+                    exporter.logger.debug(format % args)
+
+            self._server = ThreadingHTTPServer((self.host, self.port), Handler)
+            self._server.daemon_threads = True
+            self.port = self._server.server_address[1]
+            self._threads.append(threading.Thread(target=self._server.serve_forever, name="MetricsExporterHTTP",
+                                                  daemon=True))
+            self.logger.info(f"Serving metrics on http://{self.host}:{self.port}/metrics")
+
+        if self.textfile:
+            dirname = os.path.dirname(os.path.abspath(self.textfile))
+            os.makedirs(dirname, exist_ok=True)
+            self._threads.append(threading.Thread(target=self._write_textfile_loop, name="MetricsExporterTextfile",
+                                                  daemon=True))
+            self.logger.info(f"Writing metrics to {self.textfile}")
+
+        for thread in self._threads:
+            thread.start()
+
+        return self
+
+    def close(self):
+        """Stop the exporter (the text file is written for the last time)"""
+        self._stopped.set()
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+        if self.textfile:
+            self.write_textfile()
@@ -1,14 +1,17 @@
 import cv2
-from ..vis import resize
+from ..vis import Resizer
 
 
 class Transform:
     def __init__(self, conf):
         self.conf = conf
 
+        # Resizer keeps the resize plan (and optional output buffers) between frames
+        self.resizer = Resizer(**self.conf["resize"]) if "resize" in self.conf else None
+
     def __call__(self, image):
-        if "resize" in self.conf:
-            image = resize(image, **self.conf["resize"])
+        if self.resizer:
+            image = self.resizer(image)
         if "flip" in self.conf:
             image = cv2.flip(image, self.conf["flip"])
 
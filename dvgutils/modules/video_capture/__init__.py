@@ -1,5 +1,14 @@
-from .file_video_capture import FileVideoCapture, FileVideoCaptureThreaded
-from .camera_video_capture import CameraVideoCapture, CameraVideoCaptureThreaded
-from .pi_camera_video_capture import PiCameraVideoCapture, PiCameraVideoCaptureThreaded
-from .stream_video_capture import StreamVideoCapture, StreamVideoCaptureThreaded
-from .video_capture import VideoCapture
+from ...helpers.lazy_import import lazy_import
+
+# Import capture backends on first use
+__getattr__, __dir__ = lazy_import(__name__, {
+    "FileVideoCapture": ".file_video_capture",
+    "FileVideoCaptureThreaded": ".file_video_capture",
+    "CameraVideoCapture": ".camera_video_capture",
+    "CameraVideoCaptureThreaded": ".camera_video_capture",
+    "PiCameraVideoCapture": ".pi_camera_video_capture",
+    "PiCameraVideoCaptureThreaded": ".pi_camera_video_capture",
+    "StreamVideoCapture": ".stream_video_capture",
+    "StreamVideoCaptureThreaded": ".stream_video_capture",
+    "VideoCapture": ".video_capture",
+})
@@ -79,6 +79,10 @@ class PiCameraVideoCaptureThreaded(PiCameraVideoCapture):
         self.thread.daemon = True
         self.stopped = None
 
+        # Counters of the queued and dropped (queue full) frames
+        self.frames = 0
+        self.dropped = 0
+
     def open(self):
         super().open()
 
@@ -97,12 +101,26 @@ class PiCameraVideoCaptureThreaded(PiCameraVideoCapture):
             if not self.queue.full():
                 # add the frames to the queue
                 self.queue.put(frame)
+                self.frames += frame is not None
 
                 if frame is None:
                     break
             else:
+                self.dropped += 1
                 time.sleep(0.01)  # Rest for 1ms, we have a full queue
 
+    def stats(self):
+        """Returns capture counters: queued and dropped frames, queue depth and size.
+
+        :rtype: dict[str, int]
+        """
+        return {
+            "frames": self.frames,
+            "dropped": self.dropped,
+            "queue_depth": self.queue.qsize(),
+            "queue_size": self.queue.maxsize
+        }
+
     def read(self):
         # return next frame in the queue
         return self.queue.get()
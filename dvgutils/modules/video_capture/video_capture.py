@@ -77,5 +77,9 @@ class VideoCapture:
     def read(self):
         return self.cap.read()
 
+    def stats(self):
+        """Returns the counters of the threaded capture (None otherwise)"""
+        return self.cap.stats() if hasattr(self.cap, "stats") else None
+
     def close(self):
         self.cap.close()
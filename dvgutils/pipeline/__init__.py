@@ -1,9 +1,14 @@
-from .pipeline import Pipeline
-from .metrics_pipe import MetricsPipe
-from .show_image_pipe import ShowImagePipe
-from .capture_video_pipe import CaptureVideoPipe
-from .capture_image_pipe import CaptureImagePipe
-from .save_image_pipe import SaveImagePipe
-from .save_video_pipe import SaveVideoPipe
-from .progress_pipe import ProgressPipe
+from ..helpers.lazy_import import lazy_import
 from .observable import observable
+
+# Import pipes (and modules they use) on first use
+__getattr__, __dir__ = lazy_import(__name__, {
+    "Pipeline": ".pipeline",
+    "MetricsPipe": ".metrics_pipe",
+    "ShowImagePipe": ".show_image_pipe",
+    "CaptureVideoPipe": ".capture_video_pipe",
+    "CaptureImagePipe": ".capture_image_pipe",
+    "SaveImagePipe": ".save_image_pipe",
+    "SaveVideoPipe": ".save_video_pipe",
+    "ProgressPipe": ".progress_pipe",
+})
@@ -2,8 +2,8 @@ from ..modules import Metrics
 
 
 class MetricsPipe:
-    def __init__(self):
-        self.metrics = Metrics().start()
+    def __init__(self, **kwargs):
+        self.metrics = Metrics(**kwargs).start()
 
     def __call__(self, data):
         return self.update(data)
@@ -12,3 +12,6 @@ class MetricsPipe:
         self.metrics.update()
 
         return data
+
+    def close(self):
+        self.metrics.close()
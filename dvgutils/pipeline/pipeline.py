@@ -1,38 +1,205 @@
+import bisect
+import logging
+import time
+from collections import namedtuple
+
+from ..helpers.memory_tracker import MemoryTracker
+from ..helpers.sampling_profiler import SamplingProfiler
+
+# Upper bounds of the pipe latency histogram buckets [s]
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+PipeSnapshot = namedtuple("PipeSnapshot", "name, frames_in, frames_out, buckets, latency_sum")
+
+
+class PipeStats:
+    """Frame counters and latency histogram of the pipe.
+
+    Stats are updated without locking by the pipeline thread only. The version counter is odd
+    while an update is in progress, so readers from other threads (see `snapshot`) retry
+    until they copy a consistent state.
+
+    :param str name: pipe name
+    :param tuple[float] bounds: upper bounds of the latency histogram buckets
+    """
+    def __init__(self, name, bounds=LATENCY_BUCKETS):
+        self.name = name
+        self.bounds = bounds
+        self.frames_in = 0
+        self.frames_out = 0
+        self.buckets = [0] * (len(bounds) + 1)
+        self.latency_sum = 0.0
+        self._version = 0
+
+    def record(self, latency, frames_in=1, frames_out=1):
+        self._version += 1
+        self.frames_in += frames_in
+        self.frames_out += frames_out
+        self.buckets[bisect.bisect_left(self.bounds, latency)] += 1
+        self.latency_sum += latency
+        self._version += 1
+
+    def snapshot(self):
+        """Returns a consistent copy of the stats.
+
+        :rtype: PipeSnapshot
+        """
+        while True:
+            version = self._version
+            if version % 2 == 0:
+                snapshot = PipeSnapshot(self.name, self.frames_in, self.frames_out, tuple(self.buckets),
+                                        self.latency_sum)
+                if self._version == version:
+                    return snapshot
+            time.sleep(0)
+
+
+def _pipe_name(pipe):
+    return pipe.__name__ if hasattr(pipe, "__name__") else type(pipe).__name__
+
+
 class Pipeline:
-    def __init__(self, iterable):
+    """Pipeline of the data processing pipes.
+
+    :param iterable: source of the pipeline data
+    :param bool stats: collect frame counters and latency histograms of the pipes (see `PipeStats`)
+    :param str | None profile: sample the stacks of the threads while the pipeline runs (see `run`)
+        and save them in the collapsed stack format to the file on close
+    :param float profile_interval: sampling interval of the profiler [s]
+    :param bool memory: sample the memory attributed to the pipes while the pipeline runs (see `run`)
+        and log the report of the growing pipes and the top allocation sites on close
+    :param float memory_interval: sampling interval of the memory tracker [s]
+    """
+    def __init__(self, iterable, stats=False, profile=None, profile_interval=0.01, memory=False,
+                 memory_interval=10.0):
+        self.logger = logging.getLogger(__name__)
+
         self.pipes = []
-        self.pipeline = iterable
-        self.pipes.append(iterable)
+        self.names = []
+        self.stats = {} if stats else None
+        self.profile = profile
+        self.profiler = SamplingProfiler(profile_interval) if profile else None
+        self.memory_tracker = MemoryTracker(memory_interval) if memory else None
+
+        name = self._add_pipe(iterable)
+        self.pipeline = self._timed_iter(iterable, self._add_stats(name)) if stats else iterable
 
     def __iter__(self):
         return self.pipeline
 
+    def _add_pipe(self, pipe):
+        name = _pipe_name(pipe)
+        if name in self.names:
+            name = f"{name}_{len(self.pipes)}"
+        self.pipes.append(pipe)
+        self.names.append(name)
+        if self.profiler:
+            self.profiler.add_pipe(pipe, name)
+        if self.memory_tracker:
+            self.memory_tracker.add_pipe(pipe, name)
+
+        return name
+
+    def _add_stats(self, name):
+        self.stats[name] = PipeStats(name)
+
+        return self.stats[name]
+
+    @staticmethod
+    def _timed_map(pipe, stats):
+        def timed(data):
+            start = time.perf_counter()
+            data = pipe(data)
+            stats.record(time.perf_counter() - start)
+            return data
+
+        return timed
+
+    @staticmethod
+    def _timed_filter(pipe, stats):
+        def timed(data):
+            start = time.perf_counter()
+            passed = pipe(data)
+            stats.record(time.perf_counter() - start, frames_out=int(bool(passed)))
+            return passed
+
+        return timed
+
+    @staticmethod
+    def _timed_iter(iterable, stats):
+        # Latency of the iterator pipes (and the source) includes the upstream pipes they pull the data from
+        iterator = iter(iterable)
+        while True:
+            start = time.perf_counter()
+            try:
+                data = next(iterator)
+            except StopIteration:
+                return
+            stats.record(time.perf_counter() - start, frames_in=0)
+            yield data
+
     def map(self, pipe):
         if pipe:
-            self.pipeline = map(pipe, self.pipeline)
-            self.pipes.append(pipe)
+            name = self._add_pipe(pipe)
+            if self.stats is not None:
+                self.pipeline = map(self._timed_map(pipe, self._add_stats(name)), self.pipeline)
+            else:
+                self.pipeline = map(pipe, self.pipeline)
 
         return self
 
     def filter(self, pipe):
         if pipe:
-            self.pipeline = filter(pipe, self.pipeline)
-            self.pipes.append(pipe)
+            name = self._add_pipe(pipe)
+            if self.stats is not None:
+                self.pipeline = filter(self._timed_filter(pipe, self._add_stats(name)), self.pipeline)
+            else:
+                self.pipeline = filter(pipe, self.pipeline)
 
         return self
 
     def iter(self, pipe):
         if pipe:
-            self.pipeline = pipe(self.pipeline)
-            self.pipes.append(pipe)
+            name = self._add_pipe(pipe)
+            if self.stats is not None:
+                self.pipeline = self._timed_iter(pipe(self.pipeline), self._add_stats(name))
+            else:
+                self.pipeline = pipe(self.pipeline)
 
         return self
 
+    def snapshot(self):
+        """Returns consistent copies of the pipe stats.
+
+        :rtype: list[PipeSnapshot]
+        """
+        return [stats.snapshot() for stats in list(self.stats.values())] if self.stats else []
+
     def run(self):
-        for _ in self.pipeline:
-            pass
+        monitors = [monitor for monitor in (self.memory_tracker, self.profiler) if monitor]
+        for monitor in monitors:
+            monitor.start()
+        try:
+            for _ in self.pipeline:
+                pass
+        finally:
+            for monitor in reversed(monitors):
+                monitor.stop()
 
     def close(self):
         for pipe in reversed(self.pipes):
             if "close" in dir(pipe):
                 pipe.close()
+
+        if self.profiler and self.profiler.num_samples:
+            self.profiler.save(self.profile)
+            pipe_samples = self.profiler.pipe_samples()
+            total = sum(pipe_samples.values())
+            summary = ", ".join(f"{name}: {count / total:.1%}" for name, count in pipe_samples.most_common() if name)
+            self.logger.info(f"Profile saved to {self.profile} ({self.profiler.num_samples} samples; {summary})")
+
+        if self.memory_tracker and self.memory_tracker.samples:
+            growing = self.memory_tracker.growing()
+            if growing:
+                self.logger.warning(f"Memory growing in: {', '.join(growing)}")
+            self.logger.info(f"Memory usage:\n{self.memory_tracker.report()}")
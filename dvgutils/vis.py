@@ -1,9 +1,223 @@
 """Visual helpers utilizing and extending OpenCV library"""
 
+import functools
+from collections import namedtuple, OrderedDict
+
 import cv2
 import numpy as np
 
-from .misc import clip_points
+from .misc import clip_points  # noqa: F401 (re-exported, used to be imported from here)
+
+
+ResizePlan = namedtuple("ResizePlan", "width, height, new_w, new_h, interp, pad_top, pad_left")
+
+
+@functools.lru_cache(maxsize=128)
+def _resize_plan(src_h, src_w, width=None, height=None, interp=None, pad=False):
+    """Compute (and memoize) the resize plan for the given input shape and target size.
+
+    :returns: resize plan or None if the image size does not change
+    :rtype: ResizePlan | None
+    """
+    if width is None and height is None:
+        # No size specified - nothing to do
+        return None
+
+    if width is None:
+        # Calculate the ratio of the height and construct the dimensions
+        width = int(src_w * height / float(src_h))
+
+    if height is None:
+        # Calculate the ratio of the width and construct the dimensions
+        height = int(src_h * width / float(src_w))
+
+    if width == src_w and height == src_h:
+        # There is no change in size
+        return None
+
+    # Select best interpolation method if not specified
+    if interp is None:
+        if src_h > height or src_w > width:  # Shrinking image
+            interp = cv2.INTER_AREA
+        else:  # Stretching image
+            interp = cv2.INTER_CUBIC
+
+    if pad and src_w != src_h and width != height:
+        # Scale to fit into the target size preserving the aspect ratio and center the result
+        scale = min(width / src_w, height / src_h)
+        new_w = min(width, int(round(src_w * scale)))
+        new_h = min(height, int(round(src_h * scale)))
+        pad_top, pad_left = (height - new_h) // 2, (width - new_w) // 2
+    else:
+        # Square source or target image is stretched to the target size without padding
+        new_w, new_h = width, height
+        pad_top, pad_left = 0, 0
+
+    return ResizePlan(width, height, new_w, new_h, interp, pad_top, pad_left)
+
+
+def _pad_fill_color(pad_color, image):
+    """Returns the pad color matching the channels of the image (as the border of cv2.copyMakeBorder).
+
+    A single value is the RGB color of the color images and the missing channels (e.g. alpha) are zero.
+    """
+    if image.ndim == 2:
+        # Gray image - take the first component of the pad color
+        return pad_color[0] if isinstance(pad_color, (list, tuple, np.ndarray)) else pad_color
+
+    if not isinstance(pad_color, (list, tuple, np.ndarray)):
+        # Color image - set pad color as RGB
+        pad_color = [pad_color] * 3
+    channels = image.shape[2]
+
+    return (list(pad_color) + [0] * channels)[:channels]
+
+
+class Resizer:
+    """Resize images down to or up to the specified size.
+
+    The resize plan (output size, interpolation and padding) is computed once per input shape and
+    the output can be written into reusable preallocated buffers. Padding is done by resizing
+    directly into the center of a canvas pre-filled with the pad color.
+
+    Buffers are rotated between calls so the returned image is overwritten after `buffers`
+    subsequent calls. Use it only when the consumer does not hold more frames than that
+    (e.g. take the queue size of a threaded capture into account).
+
+    :param int width: output image width
+    :param int height: output image height
+    :param int interp: interpolation used to resize the image
+    :param bool pad: pad image with borders to preserve aspect ration
+    :param (int, int, int) pad_color: pad borders color
+    :param int buffers: number of reusable output buffers (0 allocates a new output on every call)
+    """
+    def __init__(self, width=None, height=None, interp=None, pad=False, pad_color=0, buffers=0):
+        self.width = width
+        self.height = height
+        self.interp = interp
+        self.pad = pad
+        self.pad_color = pad_color
+        self.buffers = buffers
+
+        self._key = None
+        self._plan = None
+        self._buffers = []
+        self._buffer_idx = 0
+
+    def __call__(self, image):
+        return self.resize(image)
+
+    def plan(self, image):
+        """Returns the resize plan for the image (None if the image size does not change).
+
+        :param numpy.ndarray image: input image
+        :rtype: ResizePlan | None
+        """
+        key = (image.shape, image.dtype)
+        if key != self._key:
+            self._key = key
+            self._plan = _resize_plan(image.shape[0], image.shape[1], self.width, self.height, self.interp,
+                                      self.pad)
+            # Buffers of the previous input shape are not valid anymore
+            self._buffers = []
+            self._buffer_idx = 0
+
+        return self._plan
+
+    def output(self, image, plan):
+        """Returns the output buffer for the image, already filled with the pad color if padding.
+
+        :param numpy.ndarray image: input image
+        :param ResizePlan plan: resize plan of the image
+        :rtype: numpy.ndarray
+        """
+        if self._buffer_idx < len(self._buffers):
+            output = self._buffers[self._buffer_idx]
+        else:
+            output = np.empty((plan.height, plan.width) + image.shape[2:], dtype=image.dtype)
+            if plan.new_w != plan.width or plan.new_h != plan.height:
+                output[...] = _pad_fill_color(self.pad_color, image)
+
+            if self.buffers > 0:
+                self._buffers.append(output)
+
+        if self.buffers > 0:
+            self._buffer_idx = (self._buffer_idx + 1) % self.buffers
+
+        return output
+
+    def resize(self, image, output=None):
+        """Resize the image.
+
+        :param numpy.ndarray image: input image
+        :param numpy.ndarray output: optional output image (already filled with the pad color if padding)
+
+        :returns: output image
+        :rtype: numpy.ndarray
+        """
+        plan = self.plan(image)
+        if plan is None:
+            # No size specified or no change in size - return original image
+            return image
+
+        if output is None:
+            output = self.output(image, plan)
+
+        # Resize image directly into the (padded) output
+        dst = output[plan.pad_top:plan.pad_top + plan.new_h, plan.pad_left:plan.pad_left + plan.new_w]
+        cv2.resize(image, (plan.new_w, plan.new_h), dst=dst, interpolation=plan.interp)
+
+        return output
+
+    def resize_batch(self, images, output=None, executor=None):
+        """Resize a batch of images of the same shape into one contiguous block.
+
+        The output can be passed directly to :func:`cv2.dnn.blobFromImages`.
+
+        :param list[numpy.ndarray] | numpy.ndarray images: list of images or stacked (N, H, W, C) array
+        :param numpy.ndarray output: optional (N, h, w, C) output block (already filled with the pad color
+            if padding)
+        :param concurrent.futures.Executor executor: optional executor (e.g. thread pool) to resize
+            the images concurrently
+
+        :returns: (N, h, w, C) output block
+        :rtype: numpy.ndarray
+
+        :raises ValueError: if the images differ in shape or type
+        """
+        if len(images) == 0:
+            raise ValueError("Empty batch of images")
+
+        image = images[0]
+        if not isinstance(images, np.ndarray) and \
+                any(img.shape != image.shape or img.dtype != image.dtype for img in images):
+            raise ValueError("All images in the batch must have the same shape and type")
+
+        plan = self.plan(image)
+
+        if output is None:
+            height, width = (plan.height, plan.width) if plan else image.shape[:2]
+            output = np.empty((len(images), height, width) + image.shape[2:], dtype=image.dtype)
+            if plan and (plan.new_w != plan.width or plan.new_h != plan.height):
+                output[...] = _pad_fill_color(self.pad_color, image)
+
+        def resize_one(i):
+            if plan is None:
+                # No change in size - just copy the image into the block
+                output[i] = images[i]
+            else:
+                dst = output[i, plan.pad_top:plan.pad_top + plan.new_h, plan.pad_left:plan.pad_left + plan.new_w]
+                cv2.resize(images[i], (plan.new_w, plan.new_h), dst=dst, interpolation=plan.interp)
+
+        if executor:
+            # OpenCV releases the GIL so the images can be resized in parallel
+            for _ in executor.map(resize_one, range(len(images))):
+                pass
+        else:
+            for i in range(len(images)):
+                resize_one(i)
+
+        return output
 
 
 def resize(image, width=None, height=None, interp=None, pad=False, pad_color=0):
@@ -11,8 +225,9 @@ def resize(image, width=None, height=None, interp=None, pad=False, pad_color=0):
 
     Specify width or height for the image size if you want to preserve the aspect ratio of the image.
     You can pad your image with additional border to preserve the aspect ration if needed for custom
-    width and height.
+    width and height (square images and square sizes are stretched without padding).
 
+    Use :class:`Resizer` to resize a stream of images into reusable output buffers.
 
     :param numpy.ndarray image: input image
     :param int width: output image width
@@ -24,75 +239,50 @@ def resize(image, width=None, height=None, interp=None, pad=False, pad_color=0):
     :returns: output image
     :rtype: numpy.ndarray
     """
-    src_h, src_w = image.shape[:2]
+    return Resizer(width, height, interp, pad, pad_color).resize(image)
 
-    if width is None and height is None:
-        # No size specified - return original image
-        return image
 
-    if width is None:
-        # Calculate the ratio of the height and construct the dimensions
-        ratio = height / float(src_h)
-        width = int(src_w * ratio)
+def resize_batch(images, width=None, height=None, interp=None, pad=False, pad_color=0, output=None,
+                 executor=None):
+    """Resize a batch of images of the same shape into one contiguous (N, h, w, C) block.
 
-    if height is None:
-        # Calculate the ratio of the width and construct the dimensions
-        ratio = width / float(src_w)
-        height = int(src_h * ratio)
+    The images share one resize plan (see :func:`resize` for the sizing rules) and the output
+    can be passed directly to :func:`cv2.dnn.blobFromImages`.
 
-    if width == src_w and height == src_h:
-        # There is no change in size - return original image
-        return image
+    :param list[numpy.ndarray] | numpy.ndarray images: list of images or stacked (N, H, W, C) array
+    :param int width: output image width
+    :param int height: output image height
+    :param int interp: interpolation used to resize the image
+    :param bool pad: pad image with borders to preserve aspect ration
+    :param (int, int, int) pad_color: pad borders color
+    :param numpy.ndarray output: optional preallocated output block
+    :param concurrent.futures.Executor executor: optional executor to resize the images concurrently
 
-    # Select best interpolation method if not specified
-    if interp is None:
-        if src_h > height or src_w > width:  # Shrinking image
-            interp = cv2.INTER_AREA
-        else:  # Stretching image
-            interp = cv2.INTER_CUBIC
+    :returns: output images block
+    :rtype: numpy.ndarray
+    """
+    return Resizer(width, height, interp, pad, pad_color).resize_batch(images, output, executor)
 
-    src_aspect = src_w / src_h  # Aspect ratio of the source image
-    aspect = width / height  # Aspect ratio of the new image
-
-    # Compute scaling
-    if src_aspect > 1 and aspect < 1 or src_aspect < 1 and aspect < 1:
-        new_w = width
-        new_h = np.round(new_w / src_aspect).astype(int) if pad else height
-    elif src_aspect > 1 and aspect > 1 or src_aspect < 1 and aspect > 1:
-        new_h = height
-        new_w = np.round(new_h * src_aspect).astype(int) if pad else width
-    else:  # Square image
-        new_h, new_w = height, width
-
-    # Resize image
-    image = cv2.resize(image, (new_w, new_h), interpolation=interp)
-
-    if pad:
-        if len(image.shape) is 3 and not isinstance(pad_color, (list, tuple, np.ndarray)):
-            # Color image - set pad color as RGB
-            pad_color = [pad_color] * 3
-
-        if aspect > 1:
-            pad_horz = (width - new_w) / 2
-            pad_left, pad_right = np.floor(pad_horz).astype(int), np.ceil(pad_horz).astype(int)
-            pad_top, pad_bot = 0, 0
-        elif aspect < 1:
-            pad_vert = (height - new_h) / 2
-            pad_top, pad_bot = np.floor(pad_vert).astype(int), np.ceil(pad_vert).astype(int)
-            pad_left, pad_right = 0, 0
-        else:
-            pad_left, pad_right, pad_top, pad_bot = 0, 0, 0, 0
 
-        # Pad the image with borders
-        image = cv2.copyMakeBorder(image, pad_top, pad_bot, pad_left, pad_right,
-                                   borderType=cv2.BORDER_CONSTANT, value=pad_color)
+@functools.lru_cache(maxsize=256)
+def _blend_matrix(color, alpha, channels):
+    """Color transformation matrix blending the constant color into the image: (1 - alpha) * image + alpha * color
 
-    return image
+    :rtype: numpy.ndarray
+    """
+    color = np.broadcast_to(np.atleast_1d(np.asarray(color, dtype=np.float64))[:channels], (channels,))
+    m = np.zeros((channels, channels + 1))
+    m[:, :channels] = np.eye(channels) * (1 - alpha)
+    m[:, channels] = color * alpha
+
+    return m
 
 
 def rectangle_overlay(image, pt1, pt2, color, alpha):
     """Renders the rectangular overlay on the image.
 
+    The constant color is blended into the image region in place without allocating a color image.
+
     :param numpy.ndarray image: input image
     :param (int, int) pt1: bottom-left corner of the rectangle
     :param (int, int) pt2: top-right corner of the rectangle
@@ -100,17 +290,182 @@ def rectangle_overlay(image, pt1, pt2, color, alpha):
     :param float alpha: alpha for overlay transparency
     """
     h, w = image.shape[:2]
-    pt1, pt2 = clip_points([pt1, pt2], w, h)
+    x1, y1 = min(max(int(pt1[0]), 0), w), min(max(int(pt1[1]), 0), h)
+    x2, y2 = min(max(int(pt2[0]), 0), w), min(max(int(pt2[1]), 0), h)
+    if x2 <= x1 or y2 <= y1:
+        # Nothing to draw
+        return
+
+    if isinstance(color, (list, np.ndarray)):
+        # Make the color hashable for the blend matrix cache
+        color = tuple(np.ravel(color).tolist())
+
+    roi = image[y1:y2, x1:x2]
+    cv2.transform(roi, _blend_matrix(color, alpha, 1 if image.ndim == 2 else image.shape[2]), dst=roi)
+
+
+def rectangle_overlays(image, boxes, colors, alphas):
+    """Renders many rectangular overlays on the image in one call.
+
+    Overlapping rectangles are blended in the given order.
+
+    :param numpy.ndarray image: input image
+    :param list[(int, int, int, int)] | numpy.ndarray boxes: (N, 4) array of (start_x, start_y, end_x, end_y)
+    :param (int, int, int) | numpy.ndarray colors: a single color or (N, 3) array of colors
+    :param float | numpy.ndarray alphas: a single alpha or (N,) array of alphas for overlay transparency
+    """
+    boxes = np.asarray(boxes, dtype=int).reshape(-1, 4)
+    n = len(boxes)
+    if n == 0:
+        return
+
+    h, w = image.shape[:2]
+    channels = 1 if image.ndim == 2 else image.shape[2]
+    boxes = np.clip(boxes, 0, (w, h, w, h))
+
+    colors = np.asarray(colors, dtype=np.float64)
+    if colors.ndim < 2:
+        # A single color for all rectangles
+        colors = colors.reshape(1, -1)
+    colors = np.broadcast_to(colors[:, :channels], (n, channels))
+    alphas = np.broadcast_to(np.asarray(alphas, dtype=np.float64), (n,))
+
+    # Build blend matrices of all rectangles at once
+    m = np.zeros((n, channels, channels + 1))
+    m[:, np.arange(channels), np.arange(channels)] = (1 - alphas)[:, None]
+    m[:, :, channels] = colors * alphas[:, None]
+
+    for (x1, y1, x2, y2), blend_m in zip(boxes.tolist(), m):
+        if x2 > x1 and y2 > y1:
+            roi = image[y1:y2, x1:x2]
+            cv2.transform(roi, blend_m, dst=roi)
+
+
+TextCacheInfo = namedtuple("TextCacheInfo", "hits, misses, maxsize, currsize")
+# Pre-rendered image with its transparency (255 - alpha) and premultiplied color (uint8, None if opaque)
+Sprite = namedtuple("Sprite", "image, inv_alpha, premultiplied")
+
+
+class TextCache:
+    """Bounded LRU cache of measured text sizes and pre-rendered text label sprites.
+
+    Labels drawn on video frames usually come from a small repeating set, so there is no need to
+    measure and rasterize them on every frame. Use :meth:`info` to size the cache.
+
+    :param int maxsize: maximum number of cached entries
+    """
+    def __init__(self, maxsize=512):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def _get(self, key, factory):
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            entry = factory()
+            self._entries[key] = entry
+            while len(self._entries) > self.maxsize:
+                # Evict the least recently used entry
+                self._entries.popitem(last=False)
+        else:
+            self.hits += 1
+            self._entries.move_to_end(key)
+
+        return entry
+
+    def text_size(self, text, font_face, font_scale, thickness):
+        """Returns the cached result of :func:`cv2.getTextSize`.
+
+        :returns: ((text width, text height), baseline)
+        :rtype: ((int, int), int)
+        """
+        return self._get(("size", text, font_face, font_scale, thickness),
+                         lambda: cv2.getTextSize(text, font_face, font_scale, thickness))
+
+    def label_sprite(self, text, font_face, font_scale, color, bg_color, bg_alpha, thickness, line_type, padding):
+        """Returns the cached text label sprite (text rendered on its background box with an alpha mask).
+
+        :rtype: Sprite
+        """
+        key = ("sprite", text, font_face, font_scale, tuple(color), tuple(bg_color) if bg_color else None,
+               bg_alpha, thickness, line_type, padding)
+
+        return self._get(key, lambda: self._render_label(text, font_face, font_scale, color, bg_color, bg_alpha,
+                                                          thickness, line_type, padding))
+
+    def _render_label(self, text, font_face, font_scale, color, bg_color, bg_alpha, thickness, line_type, padding):
+        (text_w, text_h), baseline = self.text_size(text, font_face, font_scale, thickness)
+        box_h, box_w = text_h + baseline + 2 * padding, text_w + 2 * padding
+        text_org = (padding, text_h + padding)
+
+        # Render the text on its background box
+        image = np.zeros((box_h, box_w, 3), dtype=np.uint8)
+        if bg_color:
+            image[...] = bg_color
+        cv2.putText(image, text, text_org, font_face, font_scale, color, thickness, line_type)
+
+        # Render the text coverage to build the alpha mask
+        coverage = np.zeros((box_h, box_w), dtype=np.uint8)
+        cv2.putText(coverage, text, text_org, font_face, font_scale, 255, thickness, line_type)
+        coverage = (coverage.astype(np.float32) / 255)[..., None]
+
+        # Composite the text over the background box over the image:
+        # image * (1 - bg_alpha) * (1 - coverage) + bg_color * bg_alpha * (1 - coverage) + color * coverage
+        bg_alpha = bg_alpha if bg_color else 0
+        inv_alpha = (1 - bg_alpha) * (1 - coverage)
+        if inv_alpha.max() <= 0:
+            # Opaque label - just copy it onto the image
+            return Sprite(image, None, None)
+
+        bg = np.asarray(bg_color if bg_color else 0, dtype=np.float32)
+        premultiplied = bg * bg_alpha * (1 - coverage) + np.asarray(color, dtype=np.float32) * coverage
+
+        return Sprite(image, np.round(np.repeat(inv_alpha, 3, axis=2) * 255).astype(np.uint8),
+                      np.round(premultiplied).astype(np.uint8))
+
+    def info(self):
+        """Returns cache statistics.
+
+        :rtype: TextCacheInfo
+        """
+        return TextCacheInfo(self.hits, self.misses, self.maxsize, len(self._entries))
+
+    def clear(self):
+        """Clear the cache and its statistics"""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+# Text cache used by put_text
+text_cache = TextCache()
+
+
+def _blit_sprite(image, sprite, pt):
+    """Blit the sprite onto the image at the top-left corner pt (clipped to the image)."""
+    h, w = image.shape[:2]
+    box_h, box_w = sprite.image.shape[:2]
+    x, y = pt
+    x1, y1, x2, y2 = max(x, 0), max(y, 0), min(x + box_w, w), min(y + box_h, h)
+    if x2 <= x1 or y2 <= y1:
+        # Sprite is out of the image
+        return
 
-    roi = image[pt1[1]:pt2[1], pt1[0]:pt2[0]]
-    rect = np.zeros(roi.shape, dtype=np.uint8)
-    rect[::] = color
-    cv2.addWeighted(rect, alpha, roi, 1 - alpha, 0, roi)
+    roi = image[y1:y2, x1:x2]
+    sprite_roi = (slice(y1 - y, y2 - y), slice(x1 - x, x2 - x))
+    if sprite.inv_alpha is None:
+        roi[...] = sprite.image[sprite_roi]
+    else:
+        # image * (1 - alpha) + premultiplied color
+        cv2.multiply(roi, sprite.inv_alpha[sprite_roi], dst=roi, scale=1 / 255)
+        cv2.add(roi, sprite.premultiplied[sprite_roi], dst=roi)
 
 
 def put_text(image, text, org, font_face=cv2.FONT_HERSHEY_SIMPLEX, font_scale=0.5,
              color=(0, 0, 0), bg_color=None, bg_alpha=1, thickness=1, line_type=cv2.LINE_AA,
-             org_pos="tl", padding=2):
+             org_pos="tl", padding=2, sprite=False):
     """Renders the specified text string in the image.
 
     :param numpy.ndarray image: input image
@@ -127,9 +482,10 @@ def put_text(image, text, org, font_face=cv2.FONT_HERSHEY_SIMPLEX, font_scale=0.
     :param str org_pos: corner position (org):
         'tl' - top-left, 'tr' - top-right, 'bl' - bottom-left, 'br' - bottom-right
     :param int padding: text padding
+    :param bool sprite: draw the label from a cached pre-rendered sprite (use it for the repeating labels)
     """
     x, y = org
-    ret, baseline = cv2.getTextSize(text, font_face, font_scale, thickness)
+    ret, baseline = text_cache.text_size(text, font_face, font_scale, thickness)
 
     # Calculate text and background box coordinates
     if org_pos == "tl":  # top-left origin
@@ -149,6 +505,14 @@ def put_text(image, text, org, font_face=cv2.FONT_HERSHEY_SIMPLEX, font_scale=0.
         bg_rect_pt2 = (x, y)
         text_org = (x - ret[0] - padding, y - baseline - padding)
 
+    if sprite and image.ndim == 3 and image.shape[2] == 3:
+        # Blit the cached label (background box and text)
+        label_sprite = text_cache.label_sprite(text, font_face, font_scale, color, bg_color, bg_alpha, thickness,
+                                               line_type, padding)
+        _blit_sprite(image, label_sprite, bg_rect_pt1)
+
+        return bg_rect_pt1, bg_rect_pt2
+
     if bg_color:
         # Draw background box
         rectangle_overlay(image, bg_rect_pt1, bg_rect_pt2, bg_color, bg_alpha)
@@ -163,3 +527,169 @@ def put_text(image, text, org, font_face=cv2.FONT_HERSHEY_SIMPLEX, font_scale=0.
                 lineType=line_type)
 
     return bg_rect_pt1, bg_rect_pt2
+
+
+class Layer:
+    """Static overlay layer (e.g. counting lines, legends) composited onto the frames.
+
+    The layer is rendered once into cached sprites and re-rendered only when the frame size or its
+    inputs change. Compositing is limited to the regions covered by the layer (split into bands
+    of `tile_size` rows, so sparse layers like lines and labels composite only a few pixels).
+
+    The render function draws the layer just like on the frame (translucent overlays included)
+    as the layer is rendered on a black and on a white canvas to recover its colors and alpha.
+    The layer inputs must be comparable values (numbers, strings, tuples, lists).
+
+    Example usage::
+
+        counter_layer = Layer(visualize_object_counter)
+        ...
+        counter_layer.draw(vis_image, crossed_in_out, line)
+
+    :param callable render: function render(image, *args) drawing the layer on the image
+    :param int tile_size: height of the bands and the minimal gap between the composited regions
+    """
+    def __init__(self, render, tile_size=32):
+        self.render = render
+        self.tile_size = tile_size
+        self.renders = 0
+
+        self._key = None
+        self._tiles = []
+
+    def __call__(self, image, *args):
+        return self.draw(image, *args)
+
+    def draw(self, image, *args):
+        """Composite the layer onto the image (re-render it first if its inputs changed).
+
+        :param numpy.ndarray image: input image
+        :param args: layer inputs passed to the render function
+        """
+        key = (image.shape, image.dtype, args)
+        if self._key is None or key != self._key:
+            self._tiles = self._render(image.shape, image.dtype, args)
+            self._key = key
+            self.renders += 1
+
+        for sprite, org in self._tiles:
+            _blit_sprite(image, sprite, org)
+
+    def _render(self, shape, dtype, args):
+        black = np.zeros(shape, dtype=dtype)
+        white = np.full(shape, 255, dtype=dtype)
+        self.render(black, *args)
+        self.render(white, *args)
+
+        # Over black the layer is its premultiplied color, over white it is also lightened by its transparency
+        inv_alpha = cv2.subtract(white, black)
+        covered = inv_alpha.min(axis=2) < 255 if inv_alpha.ndim == 3 else inv_alpha < 255
+
+        tiles = []
+        for y1 in range(0, shape[0], self.tile_size):
+            y2 = min(y1 + self.tile_size, shape[0])
+            cols = np.flatnonzero(covered[y1:y2].any(axis=0))
+            if len(cols) == 0:
+                continue
+
+            # Split the band into the covered column runs (merging the runs with small gaps)
+            splits = np.flatnonzero(np.diff(cols) > self.tile_size) + 1
+            for run in np.split(cols, splits):
+                x1, x2 = run[0], run[-1] + 1
+                tile_image = black[y1:y2, x1:x2].copy()
+                tile_inv_alpha = inv_alpha[y1:y2, x1:x2].copy()
+                if tile_inv_alpha.max() == 0:
+                    # Opaque tile - just copy it onto the image
+                    tiles.append((Sprite(tile_image, None, None), (x1, y1)))
+                else:
+                    tiles.append((Sprite(tile_image, tile_inv_alpha, tile_image), (x1, y1)))
+
+        return tiles
+
+
+def _color_groups(colors, n):
+    """Group item indices by their color.
+
+    :param (int, int, int) | numpy.ndarray colors: a single color or (N, 3) array of colors
+    :param int n: number of items
+    :returns: list of (color, indices)
+    :rtype: list[((int, int, int), numpy.ndarray)]
+    """
+    colors = np.asarray(colors)
+    if colors.ndim < 2:
+        # A single color for all items
+        return [(tuple(colors.tolist()), np.arange(n))]
+
+    unique_colors, inverse = np.unique(colors.reshape(n, -1), axis=0, return_inverse=True)
+    inverse = inverse.ravel()
+
+    return [(tuple(color), np.flatnonzero(inverse == i)) for i, color in enumerate(unique_colors.tolist())]
+
+
+def draw_boxes(image, boxes, colors, thickness=2, alpha=None, labels=None, label_color=(0, 0, 0),
+               font_scale=0.5):
+    """Draws many bounding boxes with optional translucent fill and labels.
+
+    Box outlines of the same color are drawn with a single :func:`cv2.polylines` call and the fills
+    are blended with :func:`rectangle_overlays`.
+
+    :param numpy.ndarray image: input image
+    :param list[(int, int, int, int)] | numpy.ndarray boxes: (N, 4) array of (start_x, start_y, end_x, end_y)
+    :param (int, int, int) | numpy.ndarray colors: a single color or (N, 3) array of colors
+    :param int thickness: thickness of the box lines (no outline if 0)
+    :param float | numpy.ndarray | None alpha: alpha(s) of the translucent box fill (no fill if None)
+    :param list[str] | None labels: box labels drawn above the top-left corner on the box color background
+    :param (int, int, int) label_color: label text color
+    :param float font_scale: label font scale factor
+    """
+    boxes = np.round(np.asarray(boxes, dtype=np.float64)).astype(np.int32).reshape(-1, 4)
+    n = len(boxes)
+    if n == 0:
+        return
+
+    if alpha is not None:
+        rectangle_overlays(image, boxes, colors, alpha)
+
+    if thickness > 0:
+        # Box corners as closed polygons
+        corners = boxes[:, [0, 1, 2, 1, 2, 3, 0, 3]].reshape(n, 4, 2)
+        for color, idxs in _color_groups(colors, n):
+            cv2.polylines(image, corners[idxs], True, color, thickness)
+
+    if labels is not None:
+        colors = np.broadcast_to(np.asarray(colors), (n, 3)).tolist()
+        for label, (start_x, start_y, _, _), color in zip(labels, boxes.tolist(), colors):
+            put_text(image, label, (start_x - 1, start_y - 1), org_pos="bl", color=label_color,
+                     bg_color=tuple(color), font_scale=font_scale, sprite=True)
+
+
+def draw_trails(image, trails, colors, thickness=2):
+    """Draws many polyline trails (e.g. object tracks).
+
+    Trails of the same color are drawn with a single :func:`cv2.polylines` call.
+
+    :param numpy.ndarray image: input image
+    :param list[numpy.ndarray] trails: list of (K, 2) arrays of trail points
+    :param (int, int, int) | numpy.ndarray colors: a single color or (N, 3) array of colors
+    :param int thickness: thickness of the trail lines
+    """
+    trails = [np.round(np.asarray(trail, dtype=np.float64)).astype(np.int32).reshape(-1, 2) for trail in trails]
+    for color, idxs in _color_groups(colors, len(trails)):
+        pts = [trails[i] for i in idxs if len(trails[i]) > 1]
+        if pts:
+            cv2.polylines(image, pts, False, color, thickness)
+
+
+def draw_points(image, points, colors, radius=4, thickness=-1):
+    """Draws many points (e.g. object centroids) as circles.
+
+    :param numpy.ndarray image: input image
+    :param list[(int, int)] | numpy.ndarray points: (N, 2) array of points
+    :param (int, int, int) | numpy.ndarray colors: a single color or (N, 3) array of colors
+    :param int radius: circle radius
+    :param int thickness: circle thickness (filled if negative)
+    """
+    points = np.round(np.asarray(points, dtype=np.float64)).astype(int).reshape(-1, 2)
+    colors = np.broadcast_to(np.asarray(colors), (len(points), 3)).tolist()
+    for point, color in zip(points.tolist(), colors):
+        cv2.circle(image, tuple(point), radius, color, thickness)
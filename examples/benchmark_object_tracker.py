@@ -0,0 +1,80 @@
+import itertools
+import logging
+import time
+
+import numpy as np
+
+from dvgutils import setup_logger
+
+from modules.object_tracker.centroid_tracker import CentroidTracker
+
+
+def parse_args():
+    import argparse
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", "--objects", nargs="+", type=int, default=[10, 100, 300, 1000],
+                        help="numbers of the simulated objects (default: 10 100 300 1000)")
+    parser.add_argument("-f", "--frames", type=int, default=100,
+                        help="number of the simulated frames (default: 100)")
+    parser.add_argument("-a", "--assignment", nargs="+", default=["greedy", "hungarian"],
+                        help="centroid tracker assignments to benchmark (default: greedy hungarian)")
+    parser.add_argument("-i", "--index", nargs="+", default=["dense", "grid"],
+                        help="centroid tracker indexes to benchmark (default: dense grid)")
+    parser.add_argument("-m", "--motion", nargs="+", default=["none"],
+                        help="centroid tracker motion models to benchmark: none, kalman (default: none)")
+    parser.add_argument("-s", "--skip", type=int, default=1,
+                        help="associate the detections only every skip frames, the objects coast in between "
+                             "(default: 1)")
+    parser.add_argument("--speed", type=float, default=3,
+                        help="standard deviation of the object velocities [px/frame] (default: 3)")
+    parser.add_argument("--seed", type=int, default=0)
+
+    return vars(parser.parse_args())
+
+
+def simulate_rects(num_objects, num_frames, seed=0, speed=3):
+    """Yields the bounding boxes of the objects walking in the scene (scaled with the number of objects)"""
+    rng = np.random.RandomState(seed)
+    size = int(200 * np.sqrt(num_objects))
+    positions = rng.uniform(0, size, (num_objects, 2))
+    velocities = rng.normal(0, speed, (num_objects, 2))
+    dims = rng.randint(20, 60, (num_objects, 2))
+    for _ in range(num_frames):
+        positions = (positions + velocities) % size
+        # Miss some of the detections
+        detected = rng.uniform(size=num_objects) > 0.05
+        start = positions[detected].astype(int)
+        yield np.hstack((start, start + dims[detected]))
+
+
+def benchmark(args):
+    logger = logging.getLogger(__name__)
+
+    # The number of the registered object IDs above the number of the objects measures the fragmentation
+    # of the tracks (lost and reregistered objects)
+    logger.info(f"{'objects':>8} {'assignment':>10} {'index':>6} {'motion':>6} {'ms/frame':>10} {'tracked':>8} "
+                f"{'ids':>8}")
+    for num_objects in args["objects"]:
+        frames = list(simulate_rects(num_objects, args["frames"], args["seed"], args["speed"]))
+        for assignment, index, motion in itertools.product(args["assignment"], args["index"], args["motion"]):
+            centroid_tracker = CentroidTracker(max_disappeared=20, max_distance=80, assignment=assignment,
+                                               index=index, motion=None if motion == "none" else motion)
+            start_time = time.perf_counter()
+            for frame_idx, rects in enumerate(frames):
+                if frame_idx % args["skip"] == 0:
+                    centroid_tracker.update(rects)
+                else:
+                    centroid_tracker.update([], coast=True)
+            elapsed = time.perf_counter() - start_time
+
+            logger.info(f"{num_objects:>8} {assignment:>10} {index:>6} {motion:>6} "
+                        f"{elapsed / len(frames) * 1000:>10.3f} {len(centroid_tracker.ids):>8} "
+                        f"{centroid_tracker.next_object_id:>8}")
+
+
+if __name__ == "__main__":
+    setup_logger()
+
+    args = parse_args()
+    benchmark(args)
@@ -1,12 +1,13 @@
 import logging
 
 from dvgutils import setup_logger, load_config
+from dvgutils.vis import Layer
 from dvgutils.pipeline import CaptureVideoPipe, MetricsPipe, Pipeline, ShowImagePipe, SaveVideoPipe, ProgressPipe
 
 from utils.vis import visualize_frame_info, visualize_object_counter, visualize_tracked_object_locations
 from pipeline.count_object_pipe import CountObjectPipe
 from pipeline.track_object_pipe import TrackObjectPipe
-from pipeline.detect_object_pipe import DetectObjectPipe
+from pipeline.detect_object_pipe import DetectObjectPipe, DetectObjectAsyncPipe, DetectObjectGatedPipe
 
 
 def parse_args():
@@ -23,22 +24,28 @@ def parse_args():
     parser.add_argument("--no-progress", dest="progress", action="store_false",
                         help="don't display progress")
     parser.add_argument("--metrics", type=str,
-                        help="metrics file name")
+                        help="metrics file name (.npy for the binary format)")
     parser.add_argument("--fps", type=int,
                         help="output video fps")
+    parser.add_argument("--memory", action="store_true",
+                        help="report the memory growth of the pipes and the top allocation sites")
 
     return vars(parser.parse_args())
 
 
 class VisualizeDataPipe:
-    def __init__(self, image_key="vis_image"):
+    def __init__(self, image_key="vis_image", copy=True):
         self.image_key = image_key
+        # Draw on a copy of the captured image or directly on it
+        self.copy = copy
+        # Object counter is static between the crossings so render it once as an overlay layer
+        self.object_counter_layer = Layer(visualize_object_counter)
 
     def __call__(self, data):
         return self.visualize(data)
 
     def visualize(self, data):
-        vis_image = data["image"].copy()
+        vis_image = data["image"].copy() if self.copy else data["image"]
         data[self.image_key] = vis_image
 
         self.visualize_frame_info(data)
@@ -57,9 +64,9 @@ class VisualizeDataPipe:
     def visualize_object_counter(self, data):
         vis_image = data[self.image_key]
         crossed_in_out = data["crossed_in_out"]
-        lines = data["line"]
+        zones = data["zones"]
 
-        visualize_object_counter(vis_image, crossed_in_out, lines)
+        self.object_counter_layer.draw(vis_image, crossed_in_out, zones)
 
     def visualize_tracked_object_locations(self, data):
         vis_image = data[self.image_key]
@@ -74,10 +81,17 @@ def count_object(args):
 
     # Setup pipeline steps
     capture_video_pipe = CaptureVideoPipe(conf["videoCapture"])
-    object_detector_pipe = DetectObjectPipe(conf["objectDetector"])
+    # Detect objects in-line every frame_skip frames, on a worker whenever it is idle or only on motion
+    if conf["objectDetector"].get("asynchronous", False):
+        object_detector_pipe = DetectObjectAsyncPipe(conf["objectDetector"])
+    elif conf["objectDetector"].get("motionGate"):
+        object_detector_pipe = DetectObjectGatedPipe(conf["objectDetector"])
+    else:
+        object_detector_pipe = DetectObjectPipe(conf["objectDetector"])
     track_object_pipe = TrackObjectPipe(conf["objectTracker"])
     count_object_pipe = CountObjectPipe(conf["objectCounter"])
-    visualize_data_pipe = VisualizeDataPipe("vis_image")
+    # The captured image is not used after visualization so we can draw on it directly
+    visualize_data_pipe = VisualizeDataPipe("vis_image", copy=False)
     video_fps = args["fps"] if args["fps"] is not None else capture_video_pipe.video_capture.fps
     save_video_pipe = SaveVideoPipe("vis_image", args["output"], fps=video_fps) if args["output"] else None
     show_image_pipe = ShowImagePipe("vis_image", "Video") if args["display"] else None
@@ -85,7 +99,7 @@ def count_object(args):
     progress_pipe = ProgressPipe(disable=not args["progress"])
 
     # Create pipeline
-    pipeline = Pipeline(capture_video_pipe)
+    pipeline = Pipeline(capture_video_pipe, memory=args["memory"])
     pipeline.map(object_detector_pipe)
     pipeline.map(track_object_pipe)
     pipeline.map(count_object_pipe)
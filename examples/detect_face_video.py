@@ -26,7 +26,7 @@ def parse_args():
     parser.add_argument("--pipeline", action="store_true",
                         help="run as pipeline")
     parser.add_argument("--metrics", type=str,
-                        help="metrics file name")
+                        help="metrics file name (.npy for the binary format)")
     parser.add_argument("--fps", type=int,
                         help="output video fps")
 
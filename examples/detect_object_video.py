@@ -1,10 +1,11 @@
 import logging
 
 from dvgutils import setup_logger, load_config
+from dvgutils.modules import MetricsExporter
 from dvgutils.pipeline import CaptureVideoPipe, MetricsPipe, Pipeline, ShowImagePipe, SaveVideoPipe, ProgressPipe
 
 from utils.vis import visualize_frame_info, visualize_object_locations
-from pipeline.detect_object_pipe import DetectObjectPipe
+from pipeline.detect_object_pipe import DetectObjectPipe, DetectObjectBatchPipe
 
 
 def parse_args():
@@ -21,9 +22,15 @@ def parse_args():
     parser.add_argument("--no-progress", dest="progress", action="store_false",
                         help="don't display progress")
     parser.add_argument("--metrics", type=str,
-                        help="metrics file name")
+                        help="metrics file name (.npy for the binary format)")
     parser.add_argument("--fps", type=int,
                         help="output video fps")
+    parser.add_argument("--metrics-port", type=int,
+                        help="serve live metrics (Prometheus text format) on the localhost port")
+    parser.add_argument("--metrics-textfile", type=str,
+                        help="periodically write live metrics (Prometheus text format) to the file")
+    parser.add_argument("--profile", type=str,
+                        help="sample the pipeline threads and save the collapsed stacks (flame graph) to the file")
 
     return vars(parser.parse_args())
 
@@ -64,23 +71,34 @@ def detect_object(args):
 
     # Setup pipeline steps
     capture_video_pipe = CaptureVideoPipe(conf["videoCapture"])
-    detect_object_pipe = DetectObjectPipe(conf["objectDetector"])
+    # Detect objects in the batches of the frames
+    batch_detection = conf["objectDetector"].get("batch_size", 1) > 1
+    detect_object_pipe = DetectObjectBatchPipe(conf["objectDetector"]) if batch_detection \
+        else DetectObjectPipe(conf["objectDetector"])
     visualize_data_pipe = VisualizeDataPipe("vis_image")
     video_fps = args["fps"] if args["fps"] is not None else capture_video_pipe.video_capture.fps
     save_video_pipe = SaveVideoPipe("vis_image", args["output"], fps=video_fps) if args["output"] else None
     show_image_pipe = ShowImagePipe("vis_image", "Video") if args["display"] else None
-    metrics_pipe = MetricsPipe()
+    metrics_pipe = MetricsPipe(window=30)
     progress_pipe = ProgressPipe(disable=not args["progress"])
 
     # Create pipeline
-    pipeline = Pipeline(capture_video_pipe)
-    pipeline.map(detect_object_pipe)
+    export_metrics = args["metrics_port"] is not None or args["metrics_textfile"]
+    pipeline = Pipeline(capture_video_pipe, stats=export_metrics, profile=args["profile"])
+    if batch_detection:
+        pipeline.iter(detect_object_pipe)
+    else:
+        pipeline.map(detect_object_pipe)
     pipeline.map(visualize_data_pipe)
     pipeline.map(save_video_pipe)
     pipeline.map(show_image_pipe)
     pipeline.map(metrics_pipe)
     pipeline.map(progress_pipe)
 
+    # Export live metrics
+    metrics_exporter = MetricsExporter(pipeline, metrics_pipe.metrics, port=args["metrics_port"],
+                                       textfile=args["metrics_textfile"]).start() if export_metrics else None
+
     # Process pipeline
     try:
         logger.info("Capturing...")
@@ -98,6 +116,8 @@ def detect_object(args):
         logger.warning("Got Ctrl+C!")
     finally:
         # Cleanup pipeline resources
+        if metrics_exporter:
+            metrics_exporter.close()
         pipeline.close()
 
 
@@ -0,0 +1,106 @@
+import numpy as np
+
+# Detected objects: bounding box (start_x, start_y, end_x, end_y), class id, class label and confidence
+DETECTION_DTYPE = np.dtype([
+    ("box", np.int32, (4,)),
+    ("class_id", np.int32),
+    ("label", "U16"),
+    ("confidence", np.float32)
+])
+
+
+def make_detections(boxes, class_ids=0, labels="", confidences=1.0):
+    """Create the structured array of the detections.
+
+    :param list | numpy.ndarray boxes: (N, 4) bounding boxes (start_x, start_y, end_x, end_y)
+    :param int | numpy.ndarray class_ids: class ids of the detections
+    :param str | numpy.ndarray labels: class labels of the detections
+    :param float | numpy.ndarray confidences: confidences of the detections
+
+    :returns: (N,) detections
+    :rtype: numpy.ndarray
+    """
+    boxes = np.asarray(boxes).reshape(-1, 4)
+    detections = np.empty(len(boxes), dtype=DETECTION_DTYPE)
+    detections["box"] = boxes
+    detections["class_id"] = class_ids
+    detections["label"] = labels
+    detections["confidence"] = confidences
+
+    return detections
+
+
+def nms(boxes, scores, threshold, class_ids=None):
+    """Greedy non-maximum suppression of the bounding boxes.
+
+    The boxes of different classes don't suppress each other if the class ids are given (they are moved
+    apart by an offset per class, so the boxes of all classes are suppressed in one pass).
+
+    :param numpy.ndarray boxes: (N, 4) bounding boxes (start_x, start_y, end_x, end_y)
+    :param numpy.ndarray scores: (N,) scores of the boxes
+    :param float threshold: boxes overlapping a box with a higher score more than the threshold (IoU) are suppressed
+    :param numpy.ndarray | None class_ids: (N,) class ids of the boxes
+
+    :returns: indexes of the kept boxes ordered by the decreasing score
+    :rtype: numpy.ndarray
+    """
+    boxes = np.asarray(boxes, dtype=np.float64)
+    if class_ids is not None and len(boxes):
+        boxes = boxes + (np.asarray(class_ids) * (boxes.max() - boxes.min() + 1))[:, None]
+
+    (x1, y1, x2, y2) = boxes.T
+    areas = np.maximum(x2 - x1, 0) * np.maximum(y2 - y1, 0)
+
+    order = np.argsort(-np.asarray(scores), kind="stable")
+    keep = []
+    while len(order):
+        i, rest = order[0], order[1:]
+        keep.append(i)
+
+        # Drop the boxes overlapping the kept one
+        w = np.maximum(np.minimum(x2[i], x2[rest]) - np.maximum(x1[i], x1[rest]), 0)
+        h = np.maximum(np.minimum(y2[i], y2[rest]) - np.maximum(y1[i], y1[rest]), 0)
+        intersection = w * h
+        union = areas[i] + areas[rest] - intersection
+        overlap = np.divide(intersection, union, out=np.zeros_like(intersection), where=union > 0)
+        order = rest[overlap <= threshold]
+
+    return np.array(keep, dtype=np.intp)
+
+
+def postprocess_ssd(detections, w, h, confidence=0.5, class_ids=None, class_names=None, nms_threshold=None):
+    """Vectorized post-processing of the SSD network detections.
+
+    Detections are filtered by the confidence and the class ids, their boxes are scaled to the image size
+    and clipped to the image in one pass, optionally followed by the class-aware non-maximum suppression.
+
+    :param numpy.ndarray detections: (K, 7) detections of the SSD detection output layer
+        (image id, class id, confidence, start_x, start_y, end_x, end_y relative to the image size)
+    :param int w: image width
+    :param int h: image height
+    :param float confidence: minimum confidence of the detections
+    :param list[int] | None class_ids: ids of the detected classes (all classes if None)
+    :param numpy.ndarray | None class_names: class labels by the class id
+    :param float | None nms_threshold: IoU threshold of the non-maximum suppression (no suppression if None)
+
+    :returns: (N,) detections (see DETECTION_DTYPE)
+    :rtype: numpy.ndarray
+    """
+    detections = detections[detections[:, 2] > confidence]
+    ids = detections[:, 1].astype(np.int32)
+    if class_ids is not None:
+        mask = np.isin(ids, class_ids)
+        detections, ids = detections[mask], ids[mask]
+
+    # Scale the relative coordinates to the image and clip them (sometimes the values get out of the image)
+    boxes = (detections[:, 3:7] * np.array([w, h, w, h], dtype=np.float32)).astype(np.int32)
+    np.clip(boxes, 0, np.array([w, h, w, h], dtype=np.int32), out=boxes)
+    confidences = detections[:, 2]
+
+    if nms_threshold is not None:
+        keep = nms(boxes, confidences, nms_threshold, ids)
+        boxes, ids, confidences = boxes[keep], ids[keep], confidences[keep]
+
+    labels = class_names[ids] if class_names is not None else ""
+
+    return make_detections(boxes, ids, labels, confidences)
@@ -1,15 +1,17 @@
 import numpy as np
 import cv2
 
-from dvgutils.misc import clip_points
+from ..detections import postprocess_ssd
 
 
 class CaffeFaceDetector:
 
-    def __init__(self, prototxt, model, confidence=0.5):
+    def __init__(self, prototxt, model, confidence=0.5, nms_threshold=None):
         self.detector = cv2.dnn.readNetFromCaffe(prototxt, model)
         #self.detector.setPreferableTarget(cv2.dnn.DNN_TARGET_MYRIAD)
         self.confidence = confidence
+        self.nms_threshold = nms_threshold
+        self.class_names = np.array(["background", "face"])
 
     def preprocess(self, image):
         # Construct an input blob for the image by resizing to a fixed 300x300 pixels
@@ -30,25 +32,8 @@ class CaffeFaceDetector:
         # faces in the input image
         self.detector.setInput(image_blob)
         detections = self.detector.forward()
-        locations = []
 
-        # Loop over the detections
-        for i in range(0, detections.shape[2]):
-            # Extract the confidence (i.e., probability) associated with the prediction
-            confidence = detections[0, 0, i, 2]
-
-            if confidence > self.confidence:
-                # Compute the (x, y)-coordinates of the bounding box for the object
-                box = detections[0, 0, i, 3:7] * np.array([w, h, w, h])
-                (start_x, start_y, end_x, end_y) = box.astype("int")
-
-                # top, right, bottom, left order + confidence
-                locations.append((start_x, start_y, end_x, end_y, confidence))
-
-        # Sometimes the values get negative, we need to clip them out
-        locations = np.array(locations, dtype=int)
-        if len(locations) > 0:
-            locations[:, :2] = clip_points(locations[:, :2], w, h)
-            locations[:, 2:4] = clip_points(locations[:, 2:4], w, h)
-
-        return locations
+        # Filter out weak detections, scale the bounding boxes to the image and clip them
+        # (sometimes the values get negative)
+        return postprocess_ssd(detections[0, 0], w, h, self.confidence, class_names=self.class_names,
+                               nms_threshold=self.nms_threshold)
@@ -3,7 +3,9 @@ import os
 import cv2
 import numpy as np
 
-from dvgutils.vis import clip_points
+from dvgutils.misc import clip_points
+
+from ..detections import make_detections
 
 
 class CascadeFaceDetector:
@@ -31,4 +33,4 @@ class CascadeFaceDetector:
             locations[:, :2] = clip_points(locations[:, :2], w, h)
             locations[:, 2:4] = clip_points(locations[:, 2:4], w, h)
 
-        return locations
+        return make_detections(locations, labels="face")
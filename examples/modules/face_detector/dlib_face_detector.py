@@ -2,6 +2,8 @@ import numpy as np
 import cv2
 import dlib
 
+from ..detections import make_detections
+
 
 class DlibFaceDetector:
     def __init__(self):
@@ -22,4 +24,4 @@ class DlibFaceDetector:
             end_y = detection.bottom()  # bottom point
             locations.append((start_x, start_y, end_x, end_y))
 
-        return np.array(locations, dtype=int)
+        return make_detections(np.array(locations, dtype=int), labels="face")
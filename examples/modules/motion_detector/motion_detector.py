@@ -1,65 +1,169 @@
-import cv2
+import math
 
-from dvgutils.vis import resize
+import cv2
+import numpy as np
 
 
 class MotionDetector:
+    """Detects the moving regions against the running average of the frames (background).
+
+    The frames are downscaled by a power of two factor picked from the frame width (to at most `max_width`
+    pixels, halving the frame repeatedly is the fast path of the area interpolation), blurred and compared
+    to the float32 running average. The working images are kept in reusable buffers allocated on the first
+    frame (and again when the frame size changes). The sizes (`min_area`, `blur_size`) are given for
+    the frames of 500 pixels width and scaled to the processed frames.
+
+    The static mask (polygons of the ignored regions like sky or timestamps) is never processed: the frames
+    are cropped to the bounding box of the unmasked area and the masked pixels inside of it are ignored.
+
+    If no pixel changed, the contour extraction is skipped (`has_motion` is the cheaper test of the motion
+    without the contours at all).
+
+    :param int min_area: minimum area of the moving region
+    :param int delta_thresh: minimum difference of the moving pixels from the background
+    :param int max_width: maximum width of the processed frames
+    :param str | None blur: blur of the frames: gaussian, box or None
+    :param int blur_size: size of the blur kernel
+    :param float alpha: weight of the frame in the running average
+    :param list | None mask: polygons [[x, y], ...] of the ignored regions (in the frame coordinates)
+    """
+    REFERENCE_WIDTH = 500
+
+    def __init__(self, min_area=500, delta_thresh=5, max_width=500, blur="gaussian", blur_size=21, alpha=0.5,
+                 mask=None):
+        if blur not in (None, "gaussian", "box"):
+            raise RuntimeError(f"Unknown blur {blur}!")
 
-    def __init__(self, min_area=500, delta_thresh=5):
         self.min_area = min_area
         self.delta_thresh = delta_thresh
+        self.max_width = max_width
+        self.blur = blur
+        self.blur_size = blur_size
+        self.alpha = alpha
+        self.mask = mask
+
+        self.avg_frame = None
+        self.frame_shape = None
+
+    def setup(self, frame):
+        """Set up the processing of the frames of the size and allocate the buffers"""
+        (h, w) = frame.shape[:2]
+        self.frame_shape = frame.shape
+
+        # Crop to the unmasked area of the frame
+        self.crop = (0, 0, w, h)
+        mask = None
+        if self.mask:
+            mask = np.full((h, w), 255, dtype=np.uint8)
+            cv2.fillPoly(mask, [np.array(polygon, dtype=np.int32) for polygon in self.mask], 0)
+            (x, y, crop_w, crop_h) = cv2.boundingRect(mask)
+            self.crop = (x, y, x + crop_w, y + crop_h)
+        (x1, y1, x2, y2) = self.crop
+
+        # Downscale by the power of two factor (crop the frame to the multiple of it)
+        self.factor = 2 ** max(0, math.ceil(math.log2(w / self.max_width)))
+        size = (max(1, (x2 - x1) // self.factor), max(1, (y2 - y1) // self.factor))
+        self.crop = (x1, y1, x1 + size[0] * self.factor, y1 + size[1] * self.factor)
+        (x1, y1, x2, y2) = self.crop
+
+        # Scale the sizes to the processed frames
+        scale = w / self.factor / self.REFERENCE_WIDTH
+        self.scaled_min_area = self.min_area * scale ** 2
+        self.scaled_blur_size = max(1, round(self.blur_size * scale)) | 1
+
+        self.scaled_mask = None
+        if mask is not None and not mask[y1:y2, x1:x2].all():
+            self.scaled_mask = cv2.resize(mask[y1:y2, x1:x2], size, interpolation=cv2.INTER_NEAREST)
+
+        # Buffers of the processed images (the halved frames down to the processed size)
+        self.halves = [np.empty(((y2 - y1) // 2 ** i, (x2 - x1) // 2 ** i) + frame.shape[2:], dtype=np.uint8)
+                       for i in range(1, int(math.log2(self.factor)) + 1)]
+        self.gray = np.empty((size[1], size[0]), dtype=np.uint8)
+        self.blurred = np.empty_like(self.gray)
+        self.background = np.empty_like(self.gray)
+        self.delta = np.empty_like(self.gray)
+        self.thresh = np.empty_like(self.gray)
+        self.dilated = np.empty_like(self.gray)
         self.avg_frame = None
-        self.scale_h = None
-        self.scale_w = None
 
     def preprocess(self, image):
-        # Resize the frame, convert it to grayscale, and blur it
-        image = resize(image, width=500)
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-        gray = cv2.GaussianBlur(gray, (21, 21), 0)
+        # Crop the frame to the unmasked area, downscale it, convert it to grayscale, and blur it
+        (x1, y1, x2, y2) = self.crop
+        image = image[y1:y2, x1:x2]
+        for half in self.halves:
+            cv2.resize(image, half.shape[1::-1], dst=half, interpolation=cv2.INTER_AREA)
+            image = half
+        cv2.cvtColor(image, cv2.COLOR_BGR2GRAY, dst=self.gray)
+        if self.blur == "gaussian":
+            cv2.GaussianBlur(self.gray, (self.scaled_blur_size, self.scaled_blur_size), 0, dst=self.blurred)
+        elif self.blur == "box":
+            cv2.blur(self.gray, (self.scaled_blur_size, self.scaled_blur_size), dst=self.blurred)
+        else:
+            return self.gray
 
-        return gray
+        return self.blurred
 
-    def get_scale(self, img_dest, img_scaled):
-        h_dest, w_dest = img_dest.shape[:2]
-        h_scaled, w_scaled = img_scaled.shape[:2]
+    def update(self, frame):
+        """Update the background with the frame and threshold the difference.
 
-        return h_dest / h_scaled, w_dest / w_scaled
+        :returns: thresholded difference of the frame from the background or None for the first frame
+        :rtype: numpy.ndarray | None
+        """
+        if self.frame_shape != frame.shape:
+            self.setup(frame)
 
-    def detect(self, frame):
-        locations = []
         gray = self.preprocess(frame)
 
         # If the first frame is None, initialize it
         if self.avg_frame is None:
-            self.avg_frame = gray.copy().astype("float")
-            self.scale_h, self.scale_w = self.get_scale(frame, gray)
-            return locations
+            self.avg_frame = gray.astype(np.float32)
+            return None
 
         # Accumulate the weighted average between the current frame and
         # previous frames, then compute the difference between the current
         # frame and running average
-        cv2.accumulateWeighted(gray, self.avg_frame, 0.5)
-        frame_delta = cv2.absdiff(gray, cv2.convertScaleAbs(self.avg_frame))
+        cv2.accumulateWeighted(gray, self.avg_frame, self.alpha)
+        cv2.convertScaleAbs(self.avg_frame, dst=self.background)
+        cv2.absdiff(gray, self.background, dst=self.delta)
+
+        # Threshold the delta image (ignoring the masked pixels)
+        cv2.threshold(self.delta, self.delta_thresh, 255, cv2.THRESH_BINARY, dst=self.thresh)
+        if self.scaled_mask is not None:
+            cv2.bitwise_and(self.thresh, self.scaled_mask, dst=self.thresh)
+
+        return self.thresh
+
+    def has_motion(self, frame):
+        """Fast test of the motion in the frame (the changed pixels cover at least the minimum area,
+        the pixels are not grouped into the regions).
+
+        :rtype: bool
+        """
+        thresh = self.update(frame)
+
+        return thresh is not None and cv2.countNonZero(thresh) >= self.scaled_min_area
+
+    def detect(self, frame):
+        locations = []
+        thresh = self.update(frame)
+        if thresh is None or not cv2.countNonZero(thresh):
+            return locations
 
-        # Threshold the delta image, dilate the thresholded image to fill
-        # in holes, then find contours on thresholded image
-        thresh = cv2.threshold(frame_delta, self.delta_thresh, 255,
-                               cv2.THRESH_BINARY)[1]
-        thresh = cv2.dilate(thresh, None, iterations=2)
-        cnts = cv2.findContours(thresh.copy(), cv2.RETR_EXTERNAL,
-                                cv2.CHAIN_APPROX_SIMPLE)[0]
+        # Dilate the thresholded image to fill in holes, then find contours on thresholded image
+        cv2.dilate(thresh, None, dst=self.dilated, iterations=2)
+        cnts = cv2.findContours(self.dilated, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)[0]
 
+        (x1, y1) = self.crop[:2]
         if cnts is not None:
             # Loop over the contours
             for c in cnts:
                 # If the contour is too small, ignore it
-                if cv2.contourArea(c) < self.min_area:
+                if cv2.contourArea(c) < self.scaled_min_area:
                     continue
 
                 # Compute the bounding box for the contour and append the location
                 (x, y, w, h) = cv2.boundingRect(c)
-                locations.append((round(self.scale_w * x), round(self.scale_h * y),
-                                  round(self.scale_w * (x + w)), round(self.scale_h * (y + h))))
+                locations.append((x1 + self.factor * x, y1 + self.factor * y,
+                                  x1 + self.factor * (x + w), y1 + self.factor * (y + h)))
 
         return locations
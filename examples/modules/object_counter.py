@@ -1,53 +1,171 @@
-import math
+import numpy as np
 
 
 class ObjectCounter:
+    """Counts the objects crossing the lines and entering/exiting the polygon zones.
+
+    All line segments and polygon edges are kept in arrays, so all (object, zone) pairs are tested at once
+    every frame. An object crosses a line when the last motion step of its track (from the previous
+    to the current centroid) intersects the line segment, it is counted in when it moves to the left
+    of the line direction (x1, y1) -> (x2, y2) in the image coordinates and out otherwise. An object is
+    counted in/out of a polygon zone when its centroid enters/exits the polygon.
+
+    The previous centroids and the polygon sides of the objects are kept in compact arrays sorted by the object
+    ID (the objects missing from the tracked objects are dropped), the tracked object dicts are left untouched.
+
+    Configuration::
+
+        line: [10, 220, 290, 120] # x1, y1, x2, y2
+        lines: # named lines
+          exit: [300, 120, 400, 220]
+        zones: # named polygons
+          parking: [[20, 20], [200, 20], [200, 100], [20, 100]]
+
+    :param dict conf: object counter configuration
+    """
     def __init__(self, conf):
-        line = conf["line"]
+        self.line = conf.get("line")
+
+        lines = dict(conf.get("lines") or {})
+        if self.line is not None:
+            lines = {"line": self.line, **lines}
+        zones = dict(conf.get("zones") or {})
+
+        self.names = list(lines) + list(zones)
+        self.segments = np.array(list(lines.values()), dtype=np.float64).reshape(-1, 4)
+        self.polygons = [np.array(polygon, dtype=np.float64).reshape(-1, 2) for polygon in zones.values()]
+
+        # Edges (x1, y1, x2, y2) of all polygons (closed) and the index of the first edge of each polygon
+        self.edges = np.concatenate([np.hstack((polygon, np.roll(polygon, -1, axis=0)))
+                                     for polygon in self.polygons] or [np.empty((0, 4))])
+        self.edge_starts = np.cumsum([0] + [len(polygon) for polygon in self.polygons[:-1]])
+
+        # Number of objects that have moved either in or out of each line and zone
+        self.counts = np.zeros((len(self.names), 2), dtype=np.int64)
+
+        # Tracked object IDs (sorted), their last centroids and the polygons they are inside of
+        self.ids = np.empty(0, dtype=np.int64)
+        self.points = np.empty((0, 2), dtype=np.float64)
+        self.inside = np.empty((0, len(self.polygons)), dtype=bool)
+
+    @property
+    def crossed_in(self):
+        return int(self.counts[:, 0].sum())
+
+    @property
+    def crossed_out(self):
+        return int(self.counts[:, 1].sum())
+
+    def zone_counts(self):
+        """Returns the number of objects that have moved in and out by the line or zone name.
+
+        :rtype: dict
+        """
+        return {name: (int(crossed_in), int(crossed_out)) for name, (crossed_in, crossed_out)
+                in zip(self.names, self.counts)}
+
+    def zones(self):
+        """Returns the lines and zones with their counts as comparable tuples (e.g. for the visualization layer).
+
+        :returns: (name, points, (crossed_in, crossed_out)) of the lines and then the polygon zones
+        :rtype: tuple
+        """
+        points = [tuple(map(tuple, segment.reshape(2, 2).astype(int).tolist())) for segment in self.segments] + \
+                 [tuple(map(tuple, polygon.astype(int).tolist())) for polygon in self.polygons]
+
+        return tuple((name, zone_points, (int(crossed_in), int(crossed_out))) for name, zone_points,
+                     (crossed_in, crossed_out) in zip(self.names, points, self.counts))
 
-        # Initialize total number of objects that have moved either in or out of the zone
-        self.crossed_in = 0
-        self.crossed_out = 0
+    def cross_lines(self, start, end):
+        """Test the motion steps of the objects for crossing the lines.
 
-        self.line = line
-        self.bbox = None
+        :param numpy.ndarray start: (K, 2) previous centroids
+        :param numpy.ndarray end: (K, 2) current centroids
 
-        self.bbox = [min(line[0], line[2]), min(line[1], line[3]), abs(line[0] - line[2]),
-                     abs(line[1] - line[3])]
+        :returns: (K, L) masks of the objects crossing in and out of the lines
+        :rtype: (numpy.ndarray, numpy.ndarray)
+        """
+        p1, p2 = self.segments[:, :2], self.segments[:, 2:]
+        direction = p2 - p1
+
+        # Sides of the step end points relative to the lines (positive on the left, "in" side)
+        def side(points):
+            offset = points[:, None, :] - p1
+            return direction[:, 0] * offset[..., 1] - direction[:, 1] * offset[..., 0]
+
+        side_start, side_end = side(start), side(end)
+
+        # Sides of the line end points relative to the steps, the step intersects the line segment
+        # if they are on the opposite sides (or on the step)
+        step = (end - start)[:, None, :]
+        offset_1, offset_2 = p1 - start[:, None, :], p2 - start[:, None, :]
+        straddle = (step[..., 0] * offset_1[..., 1] - step[..., 1] * offset_1[..., 0]) * \
+                   (step[..., 0] * offset_2[..., 1] - step[..., 1] * offset_2[..., 0]) <= 0
+
+        crossed_in = straddle & (side_start <= 0) & (side_end > 0)
+        crossed_out = straddle & (side_start > 0) & (side_end <= 0)
+
+        return crossed_in, crossed_out
+
+    def contains(self, points):
+        """Test the points for being inside of the polygons (even-odd rule).
+
+        :param numpy.ndarray points: (N, 2) points
+
+        :returns: (N, P) mask of the points inside of the polygons
+        :rtype: numpy.ndarray
+        """
+        if not len(self.polygons):
+            return np.empty((len(points), 0), dtype=bool)
+
+        x1, y1, x2, y2 = self.edges.T
+        px, py = points[:, 0:1], points[:, 1:2]
+
+        # Cast a ray from each point to the right and count the crossed edges of each polygon
+        spans = (y1 > py) != (y2 > py)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            x = x1 + (py - y1) * (x2 - x1) / (y2 - y1)
+        hits = spans & (px < x)
+
+        return np.add.reduceat(hits, self.edge_starts, axis=1) % 2 == 1
 
     def count(self, tracked_objects):
-        for tracked_object in tracked_objects:
-            if "counted" not in tracked_object:
-                tracked_object["counted"] = False
-                tracked_object["is_in"] = None
-
-            centroid = tracked_object["centroids"][-1]
-            point = (centroid[0], centroid[1])
-
-            if self.rect_contains(self.bbox, point):
-                v1 = (self.line[2] - self.line[0], self.line[3] - self.line[1])
-                v2 = (self.line[2] - point[0], self.line[3] - point[1])
-
-                cross_prod = v1[0] * v2[1] - v1[1] * v2[0]
-
-                # Check to see if the object has been counted or not
-                if not tracked_object["counted"]:
-                    if cross_prod < 0:
-                        tracked_object["is_in"] = True
-                    elif cross_prod >= 0:
-                        tracked_object["is_in"] = False
-
-                    tracked_object["counted"] = True
-
-                else:
-                    if tracked_object["is_in"] is True and cross_prod >= 0:
-                        self.crossed_out += 1
-                        tracked_object["is_in"] = False
-                    if tracked_object["is_in"] is False and cross_prod < 0:
-                        self.crossed_in += 1
-                        tracked_object["is_in"] = True
-        return (self.crossed_in, self.crossed_out), self.line
-
-    def rect_contains(self, rect, pt):
-        logic = rect[0] < pt[0] < rect[0] + rect[2] and rect[1] < pt[1] < rect[1] + rect[3]
-        return logic
+        """Count the tracked objects crossing the lines and entering/exiting the zones.
+
+        :param list[dict] tracked_objects: tracks of the current objects
+
+        :returns: total number of the objects that have moved in and out, and the lines and zones
+            with their counts (see `zones`)
+        :rtype: ((int, int), tuple)
+        """
+        ids = np.fromiter((tracked_object["object_id"] for tracked_object in tracked_objects), dtype=np.int64,
+                          count=len(tracked_objects))
+        points = np.array([tracked_object["centroids"][-1] for tracked_object in tracked_objects],
+                          dtype=np.float64).reshape(-1, 2)
+        order = ids.argsort()
+        ids, points = ids[order], points[order]
+        inside = self.contains(points)
+
+        # Find the objects tracked in the previous frame
+        if len(self.ids):
+            idx = np.minimum(np.searchsorted(self.ids, ids), len(self.ids) - 1)
+            known = self.ids[idx] == ids
+            idx = idx[known]
+        else:
+            known = np.zeros(len(ids), dtype=bool)
+            idx = np.empty(0, dtype=np.int64)
+
+        if len(idx):
+            num_lines = len(self.segments)
+            if num_lines:
+                crossed_in, crossed_out = self.cross_lines(self.points[idx], points[known])
+                self.counts[:num_lines, 0] += crossed_in.sum(axis=0)
+                self.counts[:num_lines, 1] += crossed_out.sum(axis=0)
+            if len(self.polygons):
+                was_inside, is_inside = self.inside[idx], inside[known]
+                self.counts[num_lines:, 0] += (is_inside & ~was_inside).sum(axis=0)
+                self.counts[num_lines:, 1] += (was_inside & ~is_inside).sum(axis=0)
+
+        self.ids, self.points, self.inside = ids, points, inside
+
+        return (self.crossed_in, self.crossed_out), self.zones()
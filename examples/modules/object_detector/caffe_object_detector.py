@@ -3,13 +3,18 @@ import cv2
 
 from dvgutils.vis import resize
 
+from ..detections import make_detections, postprocess_ssd
+
 
 class CaffeObjectDetector:
 
-    def __init__(self, prototxt, model, classes, frame_skip=None, confidence=0.5):
+    def __init__(self, prototxt, model, classes, frame_skip=None, confidence=0.5, nms_threshold=None):
         self.iteration = 0
         self.frame_skip = frame_skip
 
+        # Width of the network input (the frames are resized to it)
+        self.width = 500
+
         self.confidence = confidence
         self.classes = classes
 
@@ -21,29 +26,65 @@ class CaffeObjectDetector:
                         "bottle", "bus", "car", "cat", "chair", "cow", "diningtable",
                         "dog", "horse", "motorbike", "person", "pottedplant", "sheep",
                         "sofa", "train", "tvmonitor"]
+        self.class_names = np.array(self.CLASSES)
+        self.class_ids = [self.CLASSES.index(name) for name in classes]
+        self.nms_threshold = nms_threshold
 
-        # Initialize the frame dimensions (we'll set them as soon as we read the first frame from the video)
+        # Initialize the frame dimensions (we'll set them as soon as we read the frame)
         self.w = None
         self.h = None
 
+    def input_size(self, w, h, upscale=True):
+        """Returns the size of the network input of the image.
+
+        :param int w: image width
+        :param int h: image height
+        :param bool upscale: resize the images narrower than the network input up to its width
+
+        :returns: network input width and height
+        :rtype: (int, int)
+        """
+        width = self.width if upscale else min(self.width, w)
+
+        return width, int(h * width / float(w))
+
     def preprocess(self, image):
         # Convert the frame to a blob
         image_blob = cv2.dnn.blobFromImage(image, 0.007843, image.shape[:2][::-1], 127.5)
 
         return image_blob
 
-    def detect(self, image):
-        # Instantiate our coordinates array
-        locations = []
+    def preprocess_batch(self, images):
+        # Convert the frames of the same size to a blob of the batch
+        images_blob = cv2.dnn.blobFromImages(images, 0.007843, images[0].shape[:2][::-1], 127.5)
+
+        return images_blob
+
+    def postprocess(self, detections, w, h):
+        # Filter out weak detections and the detections of other classes, scale the bounding boxes to the image
+        return postprocess_ssd(detections, w, h, self.confidence, self.class_ids, self.class_names,
+                               self.nms_threshold)
 
-        # If the frame dimensions are empty, set them
-        if self.w is None or self.h is None:
-            (self.h, self.w) = image.shape[:2]
+    def detect(self, image, upscale=True):
+        """Detect the objects in the image.
+
+        :param numpy.ndarray image: input image
+        :param bool upscale: resize the images narrower than the network input up to its width
+            (e.g. not the small regions of interest)
+
+        :returns: object locations (see DETECTION_DTYPE)
+        :rtype: numpy.ndarray
+        """
+        # Instantiate our detections array
+        locations = make_detections([])
+
+        # Set the frame dimensions (of every frame, the frames may be cropped to the regions of interest)
+        (self.h, self.w) = image.shape[:2]
 
         if self.frame_skip is None or self.iteration % (self.frame_skip + 1) == 0:
             # Resize the frame to have a chosen max width pixels
             # (the less data we have, the faster we can process it)
-            frame = resize(image, 500)
+            frame = resize(image, self.input_size(self.w, self.h, upscale)[0])
 
             # Convert the frame to a blob and pass the blob through the network and obtain the detections
             image_blob = self.preprocess(frame)
@@ -51,26 +92,46 @@ class CaffeObjectDetector:
             self.detector.setInput(image_blob)
             detections = self.detector.forward()
 
-            # Loop over the detections
-            for i in np.arange(0, detections.shape[2]):
-                # Extract the confidence (i.e., probability) associated with the prediction
-                confidence = detections[0, 0, i, 2]
-
-                # Filter out weak detections by requiring a minimum confidence
-                if confidence > self.confidence:
-                    # Extract the index of the class label from the detections list
-                    idx = int(detections[0, 0, i, 1])
+            locations = self.postprocess(detections[0, 0], self.w, self.h)
 
-                    # If the class label is not a person, ignore it
-                    if self.CLASSES[idx] not in self.classes:
-                        continue
-
-                    # Compute the (x, y)-coordinates of the bounding box for the object
-                    box = detections[0, 0, i, 3:7] * np.array([self.w, self.h, self.w, self.h])
-                    (start_x, start_y, end_x, end_y) = box.astype("int")
+        self.iteration += 1
 
-                    locations.append((start_x, start_y, end_x, end_y, self.CLASSES[idx], confidence))
+        return locations
 
-        self.iteration += 1
+    def detect_batch(self, images):
+        """Detect the objects in many images (e.g. from several cameras) with one pass through the network.
+
+        The frames of the same size are stacked into one blob (frames of different sizes are passed
+        in separate blobs). The SSD detections of all the frames are returned together, tagged
+        with the index of the frame in the blob, and are split back to the images.
+
+        :param list[numpy.ndarray] images: input images
+
+        :returns: object locations of each image (see DETECTION_DTYPE)
+        :rtype: list[numpy.ndarray]
+        """
+        locations = [make_detections([]) for _ in images]
+
+        # Group the frames due for the detection by their size
+        batches = {}
+        for i, image in enumerate(images):
+            if self.frame_skip is None or self.iteration % (self.frame_skip + 1) == 0:
+                # Resize the frame to have a chosen max width pixels
+                # (the less data we have, the faster we can process it)
+                frame = resize(image, self.width)
+                batches.setdefault(frame.shape, []).append((i, frame))
+            self.iteration += 1
+
+        for batch in batches.values():
+            # Convert the frames to a blob and pass the blob through the network to obtain the detections
+            images_blob = self.preprocess_batch([frame for (_, frame) in batch])
+            self.detector.setInput(images_blob)
+            detections = self.detector.forward()[0, 0]
+
+            # Split the detections by the index of the frame in the batch
+            image_ids = detections[:, 0].astype(int)
+            for (j, (i, _)) in enumerate(batch):
+                (h, w) = images[i].shape[:2]
+                locations[i] = self.postprocess(detections[image_ids == j], w, h)
 
         return locations
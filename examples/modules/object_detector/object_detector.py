@@ -1,10 +1,24 @@
 class ObjectDetector:
     def __init__(self, conf):
+        self.model = conf["model"]
         if conf["model"] == "caffe":
             from .caffe_object_detector import CaffeObjectDetector
             self.detector = CaffeObjectDetector(**conf["caffe"])
         else:
             raise RuntimeError(f"ObjectDetector not initialized. Unknown model {conf['model']}!")
 
-    def detect(self, image):
-        return self.detector.detect(image)
+    def detect(self, image, upscale=True):
+        return self.detector.detect(image, upscale)
+
+    def input_size(self, w, h, upscale=True):
+        return self.detector.input_size(w, h, upscale)
+
+    @property
+    def batched(self):
+        """The detector detects the batches of the images (`detect_batch`)"""
+        return hasattr(self.detector, "detect_batch")
+
+    def detect_batch(self, images):
+        if not self.batched:
+            raise RuntimeError(f"Batch detection is not supported by the {self.model} model!")
+        return self.detector.detect_batch(images)
@@ -1,145 +1,312 @@
-from scipy.spatial import distance as dist
-from collections import OrderedDict
 import numpy as np
+from scipy.optimize import linear_sum_assignment
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
+from scipy.spatial import distance as dist
+
+from .kalman_filter import KalmanFilter
+
+ASSIGNMENTS = ("greedy", "hungarian")
+INDEXES = ("auto", "dense", "grid")
 
 
 class CentroidTracker:
-    def __init__(self, max_disappeared=20, max_distance=80):
-        # Initialize the next unique object ID along with three ordered dictionaries used to keep track of mapping
-        # a given object ID to its centroid, its bounding box dimensions and number of consecutive frames it has
-        # been marked as "disappeared", respectively
-        self.next_object_id = 0
-        self.objects = OrderedDict()
-        self.bbox_dims = OrderedDict()
-        self.disappeared = OrderedDict()
+    """Track objects by associating the centroids of the detected bounding boxes.
 
-        # Store the number of maximum consecutive frames a given object is allowed to be marked as "disappeared"
-        # until we need to deregister the object from tracking
-        self.max_disappeared = max_disappeared
+    The state of the tracked objects lives in contiguous arrays ordered by the registration: ids, centroids,
+    bounding box dimensions and numbers of consecutive frames the objects have been marked as "disappeared".
+    Detections are associated to the objects greedily (the closest pairs first) or optimally
+    with the Hungarian algorithm. Pairs further than `max_distance` are never associated.
+
+    As in the original tracker, the greedy association marks the unmatched objects as disappeared only
+    if there are at least as many objects as detections and registers the unmatched detections otherwise.
+    The Hungarian association does both in every frame.
+
+    The distances are computed for all pairs of the objects and detections (dense index) or, for many objects,
+    only for the pairs in the neighbouring cells of a uniform grid with the cell size `max_distance`
+    (grid index). The assignment is then solved on the sparse graph of the close pairs.
 
-        # Store the maximum distance between centroids to associate an object -- if the distance is larger than
-        # this maximum distance we'll start to mark the object as "disappeared"
+    With the Kalman motion model the positions of the objects are predicted every frame (constant velocity),
+    the detections are associated with the predicted positions and the unmatched objects move
+    to the predicted positions.
+
+    :param int max_disappeared: number of consecutive frames an object can be marked as disappeared
+        until it is deregistered
+    :param float max_distance: maximum distance between the centroids to associate an object
+    :param str assignment: greedy or hungarian
+    :param str index: dense, grid or auto (grid for more than `grid_min_pairs` object-detection pairs)
+    :param int grid_min_pairs: minimal number of the object-detection pairs to use the grid index in the auto mode
+    :param str | None motion: motion model: None (objects stay at the last position) or kalman
+    """
+    def __init__(self, max_disappeared=20, max_distance=80, assignment="greedy", index="auto", grid_min_pairs=250000,
+                 motion=None):
+        if assignment not in ASSIGNMENTS:
+            raise RuntimeError(f"Unknown assignment {assignment}!")
+        if index not in INDEXES:
+            raise RuntimeError(f"Unknown index {index}!")
+        if motion not in (None, "kalman"):
+            raise RuntimeError(f"Unknown motion model {motion}!")
+
+        self.max_disappeared = max_disappeared
         self.max_distance = max_distance
+        self.assignment = assignment
+        self.index = index
+        self.grid_min_pairs = grid_min_pairs
+        self.motion = KalmanFilter() if motion == "kalman" else None
+
+        # Initialize the next unique object ID along with the arrays of the tracked object IDs, centroids,
+        # bounding box dimensions and number of consecutive frames they have been marked as "disappeared"
+        self.next_object_id = 0
+        self.ids = np.empty(0, dtype=np.int64)
+        self.centroids = np.empty((0, 2), dtype=np.int64)
+        self.dims = np.empty((0, 2), dtype=np.int64)
+        self.missed = np.empty(0, dtype=np.int64)
+
+        # Object IDs of the bounding boxes of the last update (-1 for the boxes not associated nor registered)
+        self.rect_ids = np.empty(0, dtype=np.int64)
+
+    @property
+    def objects(self):
+        """Centroids of the tracked objects by the object ID"""
+        return dict(zip(self.ids.tolist(), self.centroids.copy()))
+
+    @property
+    def bbox_dims(self):
+        """Bounding box dimensions of the tracked objects by the object ID"""
+        return dict(zip(self.ids.tolist(), self.dims.copy()))
+
+    @property
+    def disappeared(self):
+        """Number of consecutive frames the tracked objects have been marked as disappeared by the object ID"""
+        return dict(zip(self.ids.tolist(), self.missed.tolist()))
+
+    def register(self, centroids, bbox_dims):
+        # Register the objects with the next available object IDs
+        centroids = np.asarray(centroids, dtype=np.int64).reshape(-1, 2)
+        bbox_dims = np.asarray(bbox_dims, dtype=np.int64).reshape(-1, 2)
+        ids = np.arange(self.next_object_id, self.next_object_id + len(centroids))
+
+        self.ids = np.concatenate((self.ids, ids))
+        self.centroids = np.concatenate((self.centroids, centroids))
+        self.dims = np.concatenate((self.dims, bbox_dims))
+        self.missed = np.concatenate((self.missed, np.zeros(len(centroids), dtype=np.int64)))
+        self.next_object_id += len(centroids)
+        if self.motion is not None:
+            self.motion.add(centroids)
+
+    def deregister(self, object_ids):
+        self._keep(~np.isin(self.ids, object_ids))
+
+    def _keep(self, keep):
+        self.ids = self.ids[keep]
+        self.centroids = self.centroids[keep]
+        self.dims = self.dims[keep]
+        self.missed = self.missed[keep]
+        if self.motion is not None:
+            self.motion.keep(keep)
+
+    def distances(self, centroids):
+        """Returns the distances between the tracked objects (rows) and the centroids (columns).
+
+        :param numpy.ndarray centroids: (M, 2) centroids
+
+        :rtype: numpy.ndarray
+        """
+        return dist.cdist(self.centroids, centroids)
+
+    def neighbours(self, centroids):
+        """Returns the pairs of the tracked objects and the centroids within `max_distance`.
+
+        Objects are bucketed into a uniform grid with the cell size `max_distance`, so only the objects
+        in the 3x3 neighbouring cells of every centroid are compared.
+
+        :param numpy.ndarray centroids: (M, 2) centroids
+
+        :returns: rows (objects), columns (centroids) and distances of the pairs
+        :rtype: (numpy.ndarray, numpy.ndarray, numpy.ndarray)
+        """
+        cell_size = max(float(self.max_distance), 1.0)
+        object_cells = np.floor(self.centroids / cell_size).astype(np.int64)
+        cells = np.floor(centroids / cell_size).astype(np.int64)
+
+        # Pack the cell coordinates (with a margin for the neighbours) into sortable keys
+        origin = np.minimum(object_cells.min(axis=0), cells.min(axis=0)) - 1
+        span = max(object_cells[:, 1].max(), cells[:, 1].max()) - origin[1] + 2
+        object_keys = (object_cells[:, 0] - origin[0]) * span + object_cells[:, 1] - origin[1]
+        keys = (cells[:, 0] - origin[0]) * span + cells[:, 1] - origin[1]
+        order = np.argsort(object_keys, kind="stable")
+        object_keys = object_keys[order]
+
+        rows, cols = [], []
+        for offset in (-span - 1, -span, -span + 1, -1, 0, 1, span - 1, span, span + 1):
+            # Range of the objects in the neighbouring cell of every centroid
+            left = np.searchsorted(object_keys, keys + offset, "left")
+            counts = np.searchsorted(object_keys, keys + offset, "right") - left
+            total = counts.sum()
+            if total == 0:
+                continue
+            ends = np.cumsum(counts)
+            rows.append(order[np.repeat(left - ends + counts, counts) + np.arange(total)])
+            cols.append(np.repeat(np.arange(len(keys)), counts))
+
+        if not rows:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64), np.empty(0)
+
+        rows, cols = np.concatenate(rows), np.concatenate(cols)
+        diff = (self.centroids[rows] - centroids[cols]).astype(np.float64)
+        d = np.sqrt((diff * diff).sum(axis=1))
+        close = d <= self.max_distance
+
+        return rows[close], cols[close], d[close]
+
+    def assign_sparse(self, rows, cols, d, shape):
+        """Associate the tracked objects with the detections on the sparse graph of the close pairs.
+
+        Gives the same associations as `assign` on the dense distances.
+
+        :param numpy.ndarray rows: objects of the pairs
+        :param numpy.ndarray cols: detections of the pairs
+        :param numpy.ndarray d: distances of the pairs
+        :param tuple[int] shape: number of the objects and detections
+
+        :returns: rows and columns of the associated pairs
+        :rtype: (numpy.ndarray, numpy.ndarray)
+        """
+        if len(rows) == 0:
+            return rows, cols
+
+        if self.assignment == "hungarian":
+            # Solve the assignment in every connected component of the graph
+            num_rows = shape[0]
+            graph = coo_matrix((np.ones(len(rows)), (rows, cols + num_rows)), shape=(num_rows + shape[1],) * 2)
+            _, labels = connected_components(graph, directed=False)
+            edge_labels = labels[rows]
+            order = np.argsort(edge_labels, kind="stable")
+            rows, cols, d, edge_labels = rows[order], cols[order], d[order], edge_labels[order]
+            starts = np.flatnonzero(np.r_[True, edge_labels[1:] != edge_labels[:-1]])
+            ends = np.r_[starts[1:], len(rows)]
+
+            # Components of a single pair are associated directly
+            single = ends - starts == 1
+            assigned_rows, assigned_cols = [rows[starts[single]]], [cols[starts[single]]]
+            for start, end in zip(starts[~single], ends[~single]):
+                component_rows, row_idx = np.unique(rows[start:end], return_inverse=True)
+                component_cols, col_idx = np.unique(cols[start:end], return_inverse=True)
+                gate_cost = self.max_distance * (min(len(component_rows), len(component_cols)) + 1) + 1
+                cost = np.full((len(component_rows), len(component_cols)), gate_cost, dtype=np.float64)
+                cost[row_idx, col_idx] = d[start:end]
+                row_ind, col_ind = linear_sum_assignment(cost)
+                valid = cost[row_ind, col_ind] < gate_cost
+                assigned_rows.append(component_rows[row_ind[valid]])
+                assigned_cols.append(component_cols[col_ind[valid]])
+
+            return np.concatenate(assigned_rows), np.concatenate(assigned_cols)
+
+        # The closest centroid (the first one on ties) of every row
+        order = np.lexsort((cols, d, rows))
+        rows, cols, d = rows[order], cols[order], d[order]
+        first = np.r_[True, rows[1:] != rows[:-1]]
+        rows, cols, d = rows[first], cols[first], d[first]
+
+        # Sort the rows by their smallest distance and keep the first row of every column
+        order = np.lexsort((rows, d))
+        rows, cols = rows[order], cols[order]
+        _, first = np.unique(cols, return_index=True)
+
+        return rows[first], cols[first]
+
+    def assign(self, d):
+        """Associate the tracked objects (rows) with the detections (columns).
+
+        :param numpy.ndarray d: (N, M) distances
+
+        :returns: rows and columns of the associated pairs
+        :rtype: (numpy.ndarray, numpy.ndarray)
+        """
+        if self.assignment == "hungarian":
+            # Gated pairs cost more than any set of the allowed pairs, so the number of associations is maximized
+            gated = d > self.max_distance
+            cost = np.where(gated, self.max_distance * (min(d.shape) + 1) + 1, d)
+            rows, cols = linear_sum_assignment(cost)
+            valid = ~gated[rows, cols]
+
+            return rows[valid], cols[valid]
+
+        # Sort the rows by their smallest distance, so the closest pairs are associated first, and keep
+        # the first row (if not too far) of every column
+        rows = d.min(axis=1).argsort(kind="stable")
+        cols = d.argmin(axis=1)[rows]
+        valid = d[rows, cols] <= self.max_distance
+        rows, cols = rows[valid], cols[valid]
+        _, first = np.unique(cols, return_index=True)
+
+        return rows[first], cols[first]
+
+    def update(self, rects, coast=False):
+        """Update the tracked objects with the bounding boxes detected in the frame.
+
+        :param list | numpy.ndarray rects: (M, 4) bounding boxes (start_x, start_y, end_x, end_y)
+        :param bool | list[int] | numpy.ndarray coast: the bounding boxes are from a part of the objects only,
+            so the unmatched objects (all of them or the ones with the given object IDs) are not marked as disappeared
+
+        :returns: centroids and bounding box dimensions of the tracked objects by the object ID
+        :rtype: (dict, dict)
+        """
+        rects = np.asarray(rects, dtype=np.int64).reshape(-1, 4)
+
+        # Move the objects to the predicted positions
+        if self.motion is not None and len(self.ids):
+            self.centroids = np.rint(self.motion.predict()).astype(np.int64)
+
+        # Derive the centroids and the bounding box dimensions of the rectangles
+        input_centroids = ((rects[:, :2] + rects[:, 2:]) / 2).astype(np.int64)
+        input_bbox_dims = rects[:, 2:] - rects[:, :2]
+
+        new = np.ones(len(rects), dtype=bool)
+        self.rect_ids = np.full(len(rects), -1, dtype=np.int64)
+        if len(self.ids):
+            matched = np.zeros(len(self.ids), dtype=bool)
+            if len(rects):
+                # Match the input centroids to the existing object centroids and update the matched objects
+                if self.index == "grid" or \
+                        (self.index == "auto" and len(self.ids) * len(rects) >= self.grid_min_pairs):
+                    rows, cols = self.assign_sparse(*self.neighbours(input_centroids), (len(self.ids), len(rects)))
+                else:
+                    rows, cols = self.assign(self.distances(input_centroids))
+                self.centroids[rows] = input_centroids[cols]
+                self.rect_ids[cols] = self.ids[rows]
+                self.dims[rows] = input_bbox_dims[cols]
+                matched[rows] = True
+                new[cols] = False
+                if self.motion is not None:
+                    self.motion.update(rows, input_centroids[cols])
+
+            # The greedy association keeps the semantics of the original tracker: the unmatched objects are marked
+            # as disappeared only if there are at least as many objects as detections, otherwise the unmatched
+            # detections are registered (the Hungarian association does both)
+            missing = coast is not True
+            if self.assignment == "greedy":
+                if len(self.ids) >= len(rects):
+                    new[:] = False
+                else:
+                    missing = False
+
+            # Mark the unmatched objects as disappeared and deregister the ones missing for too long
+            self.missed[matched] = 0
+            if missing:
+                disappeared = ~matched
+                if coast is not False:
+                    # The objects with the given IDs were not updated in the frame
+                    disappeared &= ~np.isin(self.ids, coast)
+                self.missed[disappeared] += 1
+                keep = self.missed <= self.max_disappeared
+                if not keep.all():
+                    self._keep(keep)
 
-    def register(self, centroid, bbox_dim):
-        # When registering an object we use the next available object ID to store the centroid and its bounding
-        # box dimensions
-        self.objects[self.next_object_id] = centroid
-        self.bbox_dims[self.next_object_id] = bbox_dim
-        self.disappeared[self.next_object_id] = 0
-        self.next_object_id += 1
-
-    def deregister(self, object_id):
-        # To deregister an object ID we delete the object ID from our respective dictionaries
-        del self.objects[object_id]
-        del self.bbox_dims[object_id]
-        del self.disappeared[object_id]
-
-    def update(self, rects):
-        # Check to see if the list of input bounding box rectangles is empty
-        if len(rects) == 0:
-            # Loop over any existing tracked objects and mark them as disappeared
-            for object_id in list(self.disappeared.keys()):
-                self.disappeared[object_id] += 1
-
-                # If we have reached a maximum number of consecutive frames where a given object has been marked as
-                # missing, deregister it
-                if self.disappeared[object_id] > self.max_disappeared:
-                    self.deregister(object_id)
-
-            # Return early as there are no centroids or tracking info to update
-            return self.objects, self.bbox_dims
-
-        # Initialize an array of input centroids and input bounding box dimensions for the current frame
-        input_centroids = np.zeros((len(rects), 2), dtype="int")
-        input_bbox_dims = np.zeros((len(rects), 2), dtype="int")
-
-        # Loop over the bounding box rectangles
-        for i, (start_x, start_y, end_x, end_y) in enumerate(rects):
-            # Use the bounding box coordinates to derive the centroid
-            cx = int((start_x + end_x) / 2.0)
-            cy = int((start_y + end_y) / 2.0)
-            input_centroids[i] = (cx, cy)
-
-            # Calculate bounding box dimensions for each rectangle
-            w, h = rects[i][2] - rects[i][0], rects[i][3] - rects[i][1]
-            input_bbox_dims[i] = (w, h)
-
-        # If we are currently not tracking any objects take the input centroids and register each of them
-        if len(self.objects) == 0:
-            for i in range(0, len(input_centroids)):
-                self.register(input_centroids[i], input_bbox_dims[i])
-
-        # Otherwise, are are currently tracking objects so we need to try to match the input centroids to
-        # existing object centroids
-        else:
-            # Grab the set of object IDs and corresponding centroids
-            object_ids = list(self.objects.keys())
-            object_centroids = list(self.objects.values())
-
-            # Compute the distance between each pair of object centroids and input centroids, respectively -- our
-            # goal will be to match an input centroid to an existing object centroid
-            d = dist.cdist(np.array(object_centroids), input_centroids)
-
-            # In order to perform this matching we must (1) find the smallest value in each row and then
-            # (2) sort the row indexes based on their minimum values so that the row with the smallest value as at the
-            # *front* of the index list
-            rows = d.min(axis=1).argsort()
-
-            # Next, we perform a similar process on the columns by finding the smallest value in each column and then
-            # sorting using the previously computed row index list
-            cols = d.argmin(axis=1)[rows]
-
-            # In order to determine if we need to update, register, or deregister an object we need to keep track
-            # of which of the rows and column indexes we have already examined
-            used_rows = set()
-            used_cols = set()
-
-            # Loop over the combination of the (row, column) index tuples
-            for (row, col) in zip(rows, cols):
-                # If we have already examined either the row or column value before, ignore it
-                if row in used_rows or col in used_cols:
-                    continue
-
-                # If the distance between centroids is greater than the maximum distance, do not associate the two
-                # centroids to the same object
-                if d[row, col] > self.max_distance:
-                    continue
-
-                # Otherwise, grab the object ID for the current row, set its new centroid, bounding box dimensions and
-                # reset the disappeared counter
-                object_id = object_ids[row]
-                self.objects[object_id] = input_centroids[col]
-                self.bbox_dims[object_id] = input_bbox_dims[col]
-                self.disappeared[object_id] = 0
-
-                # Indicate that we have examined each of the row and column indexes, respectively
-                used_rows.add(row)
-                used_cols.add(col)
-
-            # Compute both the row and column index we have NOT yet examined
-            unused_rows = set(range(0, d.shape[0])).difference(used_rows)
-            unused_cols = set(range(0, d.shape[1])).difference(used_cols)
-
-            # In the event that the number of object centroids is equal or greater than the number of input centroids
-            # we need to check and see if some of these objects have potentially disappeared
-            if d.shape[0] >= d.shape[1]:
-                # Loop over the unused row indexes
-                for row in unused_rows:
-                    # Grab the object ID for the corresponding row index and increment the disappeared counter
-                    object_id = object_ids[row]
-                    self.disappeared[object_id] += 1
-
-                    # Check to see if the number of consecutive frames the object has been marked "disappeared" for
-                    # warrants deregistering the object
-                    if self.disappeared[object_id] > self.max_disappeared:
-                        self.deregister(object_id)
-
-            # Otherwise, if the number of input centroids is greater than the number of existing object centroids
-            # we need to register each new input centroid as a trackable object
-            else:
-                for col in unused_cols:
-                    self.register(input_centroids[col], input_bbox_dims[col])
+        # Register the unmatched input centroids as new objects
+        if new.any():
+            self.rect_ids[new] = np.arange(self.next_object_id, self.next_object_id + new.sum())
+            self.register(input_centroids[new], input_bbox_dims[new])
 
         # Return the set of trackable objects and their bounding box dimensions
         return self.objects, self.bbox_dims
@@ -1,21 +1,43 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import cv2
 
 import dlib
 from .centroid_tracker import CentroidTracker
+from .track_history import update_object_tracks
 
 
 class DlibObjectTracker:
-    def __init__(self, max_disappeared=20, max_distance=80):
+    def __init__(self, max_disappeared=20, max_distance=80, history=64, archive=None, assignment="greedy",
+                 index="auto", motion=None, appearance_interval=1, workers=1):
         # Initialize the frame dimensions (we'll set them as soon as we read the first frame from the video)
         self.w = None
         self.h = None
 
         # Instantiate our centroid tracker, then initialize a list to store each of our dlib correlation trackers,
         # followed by a dictionary to map each unique object ID to a TrackableObject
-        self.centroid_tracker = CentroidTracker(max_disappeared, max_distance)
+        self.centroid_tracker = CentroidTracker(max_disappeared, max_distance, assignment, index, motion=motion)
         self.trackers = []
         self.object_tracks = {}
 
+        # Object IDs of the correlation trackers (of the detections they were started on)
+        self.tracker_ids = []
+
+        # Number of the kept centroids of the object tracks and the optional sink of the tracks
+        # of the deregistered objects (evicted from the object tracks)
+        self.history = history
+        self.archive = archive
+
+        # Update every correlation tracker only every `appearance_interval` frames between the detections
+        # (staggered over the trackers), the objects without the update move by the motion model
+        self.appearance_interval = appearance_interval
+        self.frame_idx = 0
+
+        # Start and update the correlation trackers concurrently on the shared (read only) frame with the pool
+        # of `workers` threads (dlib releases the GIL), the results are kept in the order of the trackers
+        self.executor = ThreadPoolExecutor(workers, thread_name_prefix="DlibObjectTracker") if workers > 1 else None
+        self.map = self.executor.map if self.executor else map
+
     def track(self, frame, object_locations):
         # Convert the frame from BGR to RGB for dlib
         rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
@@ -24,69 +46,62 @@ class DlibObjectTracker:
         if self.w is None or self.h is None:
             (self.h, self.w) = frame.shape[:2]
 
-        # Initialize  our list of bounding box rectangles returned by either
+        # Our list of bounding box rectangles is returned by either
         # (1) our object detector or
         # (2) the correlation trackers
-        rects = []
 
         # Check to see if there are detected object locations from object detector to aid our tracker
-        if object_locations:
-            # Initialize our new set of object trackers
-            self.trackers = []
-
-            # Loop over the detections
-            for detection in object_locations:
-                (start_x, start_y, end_x, end_y) = detection[0:4]
-
-                # Construct a dlib rectangle object from the bounding box coordinates and
-                # then start the dlib correlation tracker
-                tracker = dlib.correlation_tracker()
-                rect = dlib.rectangle(start_x, start_y, end_x, end_y)
-                tracker.start_track(rgb, rect)
-
-                # Add the tracker to our list of trackers so we can utilize it during skip frames
-                self.trackers.append(tracker)
+        if len(object_locations):
+            # Initialize our new set of object trackers, one for each detection
+            # (we'll utilize them during skip frames)
+            self.trackers = list(self.map(lambda detection: self.start_tracker(rgb, detection), object_locations))
+            rects = object_locations["box"]
+            coast = False
         else:
-            # Loop over the trackers
-            for tracker in self.trackers:
-                # Update the tracker and grab the updated position
-                confidence = tracker.update(rgb)
-                pos = tracker.get_position()
-
-                # Unpack the position object
-                start_x = int(pos.left())
-                start_y = int(pos.top())
-                end_x = int(pos.right())
-                end_y = int(pos.bottom())
-
-                # Add the bounding box coordinates to the rectangles list
-                rects.append((start_x, start_y, end_x, end_y))
+            # Update the trackers due for the update
+            due = [(self.frame_idx + i) % self.appearance_interval == 0 for i in range(len(self.trackers))]
+            rects = list(self.map(lambda tracker: self.update_tracker(rgb, tracker),
+                                  [tracker for tracker, is_due in zip(self.trackers, due) if is_due]))
+            # Only the objects of the trackers not due for the update are not marked as disappeared
+            coast = [object_id for object_id, is_due in zip(self.tracker_ids, due) if not is_due]
 
         # Use the centroid tracker to associate the
         # (1) old object centroids with
         # (2) the newly computed object centroids
-        objects, bbox_dims = self.centroid_tracker.update(rects)
-        current_objects = []
-
-        # Loop over the tracked objects
-        for (object_id, centroid) in objects.items():
-            # Check to see if a trackable object exists for the current object ID
-            to = self.object_tracks.get(object_id, None)
-
-            # If there is no existing trackable object, create one
-            if to is None:
-                to = {
-                    "object_id": object_id,
-                    "centroids": [centroid],
-                    "bbox_dims": bbox_dims[object_id]
-                }
-            # Otherwise, there is a trackable object so we can update it
-            else:
-                to["centroids"].append(centroid)
-
-            current_objects.append(to)
-
-            # Store the trackable object in our dictionary
-            self.object_tracks[object_id] = to
-
-        return current_objects
+        # (the objects of the trackers not due for the update are not marked as disappeared)
+        objects, bbox_dims = self.centroid_tracker.update(rects, coast=coast)
+        if len(object_locations):
+            self.tracker_ids = self.centroid_tracker.rect_ids.tolist()
+        self.frame_idx += 1
+
+        return update_object_tracks(self.object_tracks, objects, bbox_dims, self.history, self.archive)
+
+    @staticmethod
+    def start_tracker(rgb, detection):
+        (start_x, start_y, end_x, end_y) = detection["box"].tolist()
+
+        # Construct a dlib rectangle object from the bounding box coordinates and
+        # then start the dlib correlation tracker
+        tracker = dlib.correlation_tracker()
+        rect = dlib.rectangle(start_x, start_y, end_x, end_y)
+        tracker.start_track(rgb, rect)
+
+        return tracker
+
+    @staticmethod
+    def update_tracker(rgb, tracker):
+        # Update the tracker and grab the updated position
+        tracker.update(rgb)
+        pos = tracker.get_position()
+
+        # Unpack the position object
+        start_x = int(pos.left())
+        start_y = int(pos.top())
+        end_x = int(pos.right())
+        end_y = int(pos.bottom())
+
+        return start_x, start_y, end_x, end_y
+
+    def close(self):
+        if self.executor:
+            self.executor.shutdown()
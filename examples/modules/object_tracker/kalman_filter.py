@@ -0,0 +1,80 @@
+import numpy as np
+
+
+class KalmanFilter:
+    """Constant velocity Kalman filter of many 2D positions.
+
+    The states (x, y, vx, vy) and covariances of all tracks are kept in arrays, so the prediction
+    and the correction are batched over the tracks. The time step is one frame.
+
+    :param float process_noise: variance of the acceleration [px^2/frame^4]
+    :param float measurement_noise: variance of the measured positions [px^2]
+    :param float velocity_variance: initial variance of the velocity [px^2/frame^2]
+    """
+    def __init__(self, process_noise=1.0, measurement_noise=10.0, velocity_variance=100.0):
+        self.F = np.eye(4)
+        self.F[0, 2] = self.F[1, 3] = 1
+
+        # Discrete white noise acceleration model
+        self.Q = np.zeros((4, 4))
+        self.Q[[0, 1], [0, 1]] = 0.25 * process_noise
+        self.Q[[0, 1, 2, 3], [2, 3, 0, 1]] = 0.5 * process_noise
+        self.Q[[2, 3], [2, 3]] = process_noise
+
+        self.R = np.eye(2) * measurement_noise
+        self.initial_P = np.diag([measurement_noise, measurement_noise, velocity_variance, velocity_variance])
+
+        self.x = np.empty((0, 4))
+        self.P = np.empty((0, 4, 4))
+
+    def __len__(self):
+        return len(self.x)
+
+    @property
+    def positions(self):
+        return self.x[:, :2]
+
+    def add(self, positions):
+        """Start the tracks at the positions (with zero velocity).
+
+        :param numpy.ndarray positions: (K, 2) positions
+        """
+        x = np.zeros((len(positions), 4))
+        x[:, :2] = positions
+        self.x = np.concatenate((self.x, x))
+        self.P = np.concatenate((self.P, np.broadcast_to(self.initial_P, (len(positions), 4, 4))))
+
+    def keep(self, mask):
+        """Keep the tracks selected by the mask.
+
+        :param numpy.ndarray mask: boolean mask of the tracks
+        """
+        self.x = self.x[mask]
+        self.P = self.P[mask]
+
+    def predict(self):
+        """Predict the states of all tracks in the next frame.
+
+        :returns: (N, 2) predicted positions
+        :rtype: numpy.ndarray
+        """
+        self.x = self.x @ self.F.T
+        self.P = self.F @ self.P @ self.F.T + self.Q
+
+        return self.positions
+
+    def update(self, rows, positions):
+        """Correct the states of the tracks with the measured positions.
+
+        :param numpy.ndarray rows: indexes of the measured tracks
+        :param numpy.ndarray positions: (K, 2) measured positions
+        """
+        x, P = self.x[rows], self.P[rows]
+
+        # The measurement matrix selects the position, so H P H^T and P H^T are slices of P
+        S = P[:, :2, :2] + self.R
+        K = P[:, :, :2] @ np.linalg.inv(S)
+        x = x + (K @ (positions - x[:, :2])[..., None])[..., 0]
+        P = P - K @ P[:, :2, :]
+
+        self.x[rows], self.P[rows] = x, P
@@ -1,14 +1,27 @@
 class ObjectTracker:
-    def __init__(self, conf):
+    def __init__(self, conf, archive=None):
+        history = conf.get("history", 64)
+        assignment = conf.get("assignment", "greedy")
+        index = conf.get("index", "auto")
+        kwargs = {
+            "motion": conf.get("motion"),
+            "appearance_interval": conf.get("appearance_interval", 1),
+            "workers": conf.get("workers", 1)
+        }
         if conf["tracker"] == "dlib":
             from .dlib_object_tracker import DlibObjectTracker
-            self.tracker = DlibObjectTracker(conf["max_disappeared"], conf["max_distance"])
+            self.tracker = DlibObjectTracker(conf["max_disappeared"], conf["max_distance"], history, archive,
+                                             assignment, index, **kwargs)
         elif conf["tracker"] == "opencv":
             from .opencv_object_tracker import OpencvObjectTracker
             self.tracker = OpencvObjectTracker(conf["max_disappeared"], conf["max_distance"],
-                                               conf["opencv"]["tracker_type"])
+                                               conf["opencv"]["tracker_type"], history, archive, assignment, index,
+                                               **kwargs)
         else:
             raise RuntimeError(f"ObjectCounter not initialized. Unknown tracker {conf['tracker']}!")
 
     def track(self, image, detected_object_locations):
         return self.tracker.track(image, detected_object_locations)
+
+    def close(self):
+        self.tracker.close()
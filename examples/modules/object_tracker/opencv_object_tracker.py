@@ -1,10 +1,14 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import cv2
 
 from .centroid_tracker import CentroidTracker
+from .track_history import update_object_tracks
 
 
 class OpencvObjectTracker:
-    def __init__(self, max_disappeared=20, max_distance=80, tracker_type="kcf"):
+    def __init__(self, max_disappeared=20, max_distance=80, tracker_type="kcf", history=64, archive=None,
+                 assignment="greedy", index="auto", motion=None, appearance_interval=1, workers=1):
         # Initialize the frame dimensions (we'll set them as soon as we read the first frame from the video)
         self.w = None
         self.h = None
@@ -23,79 +27,100 @@ class OpencvObjectTracker:
 
         # Instantiate our centroid tracker, then initialize a list to store each of our OpenCV correlation trackers,
         # followed by a dictionary to map each unique object ID to a TrackableObject
-        self.centroid_tracker = CentroidTracker(max_disappeared, max_distance)
+        self.centroid_tracker = CentroidTracker(max_disappeared, max_distance, assignment, index, motion=motion)
         self.trackers = []
         self.object_tracks = {}
 
+        # Object IDs of the correlation trackers (of the detections they were started on)
+        self.tracker_ids = []
+
+        # Number of the kept centroids of the object tracks and the optional sink of the tracks
+        # of the deregistered objects (evicted from the object tracks)
+        self.history = history
+        self.archive = archive
+
+        # Update every correlation tracker only every `appearance_interval` frames between the detections
+        # (staggered over the trackers), the objects without the update move by the motion model
+        self.appearance_interval = appearance_interval
+        self.frame_idx = 0
+
+        # Start and update the trackers concurrently on the shared (read only) frame with the pool of `workers`
+        # threads (OpenCV releases the GIL), the results are kept in the order of the trackers
+        self.executor = ThreadPoolExecutor(workers, thread_name_prefix="OpencvObjectTracker") if workers > 1 else None
+        self.map = self.executor.map if self.executor else map
+
     def track(self, frame, object_locations):
 
         # If the frame dimensions are empty, set them
         if self.w is None or self.h is None:
             (self.h, self.w) = frame.shape[:2]
 
-        # Initialize  our list of bounding box rectangles returned by either
+        # Our list of bounding box rectangles is returned by either
         # (1) our object detector or
         # (2) the correlation trackers
-        rects = []
 
         # Check to see if there are detected object locations from object detector to aid our tracker
-        if object_locations:
-            # Initialize our new set of object trackers
-            self.trackers = []
-            # Loop over the detections
-            for detection in object_locations:
-                (start_x, start_y, end_x, end_y) = detection[0:4]
-
-                # Grab the appropriate object tracker using our dictionary of OpenCV object tracker objects
-                tracker = self.OPENCV_OBJECT_TRACKERS[self.tracker_type]()
-                tracker.init(frame, (start_x, start_y, end_x - start_x, end_y - start_y))
-
-                # Add the tracker to our list of trackers so we can utilize it during skip frames
-                self.trackers.append(tracker)
+        if len(object_locations):
+            # Initialize our new set of object trackers, one for each detection
+            # (we'll utilize them during skip frames)
+            self.trackers = list(self.map(lambda detection: self.start_tracker(frame, detection), object_locations))
+            rects = object_locations["box"]
+            coast = False
         else:
-            # Loop over the trackers
-            for tracker in self.trackers:
-                # Update the tracker and grab the updated position
-                (success, box) = tracker.update(frame)
-
-                # Check to see if the tracking was a success
-                if success:
-                    (x, y, w, h) = [int(v) for v in box]
-
-                    # Unpack the position object
-                    start_x = int(x)
-                    start_y = int(y)
-                    end_x = int(x + w)
-                    end_y = int(y + h)
-
-                    # Add the bounding box coordinates to the rectangles list
-                    rects.append((start_x, start_y, end_x, end_y))
+            # Update the trackers due for the update, keep the successfully tracked positions
+            due = [i for i, tracker in enumerate(self.trackers)
+                   if tracker is not None and (self.frame_idx + i) % self.appearance_interval == 0]
+            results = list(self.map(lambda i: self.update_tracker(frame, self.trackers[i]), due))
+            rects = [rect for rect in results if rect]
+
+            # Drop the failed trackers, so their objects are marked as disappeared in every frame until
+            # the next detection, only the objects of the trackers not due for the update are not
+            due_set = set(due)
+            for i, rect in zip(due, results):
+                if rect is None:
+                    self.trackers[i] = None
+            coast = [object_id for i, (tracker, object_id) in enumerate(zip(self.trackers, self.tracker_ids))
+                     if tracker is not None and i not in due_set]
 
         # Use the centroid tracker to associate the
         # (1) old object centroids with
         # (2) the newly computed object centroids
-        objects, bbox_dims = self.centroid_tracker.update(rects)
-        current_objects = []
-
-        # Loop over the tracked objects
-        for (object_id, centroid) in objects.items():
-            # Check to see if a trackable object exists for the current object ID
-            to = self.object_tracks.get(object_id, None)
-
-            # If there is no existing trackable object, create one
-            if to is None:
-                to = {
-                    "object_id": object_id,
-                    "centroids": [centroid],
-                    "bbox_dims": bbox_dims[object_id],
-                }
-            # Otherwise, there is a trackable object so we can update it
-            else:
-                to["centroids"].append(centroid)
-
-            current_objects.append(to)
-
-            # Store the trackable object in our dictionary
-            self.object_tracks[object_id] = to
-
-        return current_objects
+        # (the objects of the trackers not due for the update are not marked as disappeared)
+        objects, bbox_dims = self.centroid_tracker.update(rects, coast=coast)
+        if len(object_locations):
+            self.tracker_ids = self.centroid_tracker.rect_ids.tolist()
+        self.frame_idx += 1
+
+        return update_object_tracks(self.object_tracks, objects, bbox_dims, self.history, self.archive)
+
+    def start_tracker(self, frame, detection):
+        (start_x, start_y, end_x, end_y) = detection["box"].tolist()
+
+        # Grab the appropriate object tracker using our dictionary of OpenCV object tracker objects
+        tracker = self.OPENCV_OBJECT_TRACKERS[self.tracker_type]()
+        tracker.init(frame, (start_x, start_y, end_x - start_x, end_y - start_y))
+
+        return tracker
+
+    @staticmethod
+    def update_tracker(frame, tracker):
+        # Update the tracker and grab the updated position
+        (success, box) = tracker.update(frame)
+
+        # Check to see if the tracking was a success
+        if not success:
+            return None
+
+        (x, y, w, h) = [int(v) for v in box]
+
+        # Unpack the position object
+        start_x = int(x)
+        start_y = int(y)
+        end_x = int(x + w)
+        end_y = int(y + h)
+
+        return start_x, start_y, end_x, end_y
+
+    def close(self):
+        if self.executor:
+            self.executor.shutdown()
@@ -0,0 +1,97 @@
+import numpy as np
+
+
+class TrackHistory:
+    """Fixed-length history of the object centroids.
+
+    The last `maxlen` centroids are kept in a (maxlen, 2) ring buffer with a head index, so the memory
+    of a track doesn't grow over time. Indexing and slicing work like on a list of centroids
+    ordered from the oldest to the newest one (e.g. `history[-1]`, `history[-31:]`).
+
+    :param int maxlen: number of kept centroids
+    """
+    def __init__(self, maxlen=64):
+        self.maxlen = maxlen
+        self.points = np.zeros((maxlen, 2), dtype=np.int32)
+        # Index of the next centroid and the total number of appended centroids
+        self.head = 0
+        self.count = 0
+
+    def append(self, centroid):
+        self.points[self.head] = centroid
+        self.head = (self.head + 1) % self.maxlen
+        self.count += 1
+
+    def __len__(self):
+        return min(self.count, self.maxlen)
+
+    def array(self):
+        """Returns the kept centroids ordered from the oldest one.
+
+        :rtype: numpy.ndarray
+        """
+        if self.count < self.maxlen:
+            return self.points[:self.head].copy()
+
+        return np.concatenate((self.points[self.head:], self.points[:self.head]))
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return self.array()[idx]
+
+        n = len(self)
+        if idx < 0:
+            idx += n
+        if not 0 <= idx < n:
+            raise IndexError("track history index out of range")
+
+        return self.points[(self.head - n + idx) % self.maxlen].copy()
+
+    def __iter__(self):
+        return iter(self.array())
+
+
+def update_object_tracks(object_tracks, objects, bbox_dims, history=64, archive=None):
+    """Update the tracks of the objects tracked by the centroid tracker.
+
+    Tracks of the objects deregistered by the centroid tracker are evicted from `object_tracks`
+    and handed to the optional archive sink.
+
+    :param dict object_tracks: tracks of the objects by object id
+    :param dict objects: centroids of the tracked objects by object id
+    :param dict bbox_dims: bounding box dimensions of the tracked objects by object id
+    :param int history: number of the kept centroids of the track
+    :param callable | None archive: sink called with the evicted tracks
+
+    :returns: tracks of the current objects
+    :rtype: list[dict]
+    """
+    current_objects = []
+
+    # Loop over the tracked objects
+    for (object_id, centroid) in objects.items():
+        # Check to see if a trackable object exists for the current object ID
+        to = object_tracks.get(object_id, None)
+
+        # If there is no existing trackable object, create one
+        if to is None:
+            to = {
+                "object_id": object_id,
+                "centroids": TrackHistory(history),
+                "bbox_dims": bbox_dims[object_id]
+            }
+
+            # Store the trackable object in our dictionary
+            object_tracks[object_id] = to
+
+        to["centroids"].append(centroid)
+        current_objects.append(to)
+
+    # Evict the tracks of the deregistered objects
+    if len(object_tracks) > len(objects):
+        for object_id in [object_id for object_id in object_tracks if object_id not in objects]:
+            to = object_tracks.pop(object_id)
+            if archive:
+                archive(to)
+
+    return current_objects
@@ -13,6 +13,6 @@ class CountObjectPipe:
         tracked_objects = data["tracked_objects"]
 
         # Count objects
-        data["crossed_in_out"], data["line"] = self.counter.count(tracked_objects)
+        data["crossed_in_out"], data["zones"] = self.counter.count(tracked_objects)
 
         return data
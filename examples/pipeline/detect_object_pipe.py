@@ -1,3 +1,13 @@
+import logging
+import queue
+import time
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event, Thread
+
+import numpy as np
+
+from modules.detections import make_detections
+from modules.motion_detector import MotionDetector
 from modules.object_detector import ObjectDetector
 
 
@@ -16,3 +26,283 @@ class DetectObjectPipe:
         data["object_locations"] = self.detector.detect(image)
 
         return data
+
+
+class DetectObjectBatchPipe:
+    """Detects the objects in the batches of the frames (iterator pipe, see `Pipeline.iter`).
+
+    The upstream data is read by a thread into a queue. A batch is collected from the queue until it has
+    `batch_size` frames or `max_latency` milliseconds passed since its first frame arrived, so the frames
+    of the live streams are not held back waiting for a full batch. The batch goes through the network
+    at once and the data is yielded in the order it arrived.
+
+    All upstream pipes (e.g. the video capture) run on the reader thread, so they must not use
+    thread-affine resources (e.g. OpenCV windows).
+
+    :param dict conf: object detector configuration (`batch_size` and `max_latency` [ms])
+    """
+    _end = object()
+
+    def __init__(self, conf):
+        self.detector = ObjectDetector(conf)
+        if not self.detector.batched:
+            raise RuntimeError(f"DetectObjectBatchPipe not initialized. "
+                               f"Batch detection is not supported by the {conf['model']} model!")
+        self.batch_size = conf.get("batch_size", 1)
+        self.max_latency = conf.get("max_latency", 50) / 1000
+
+        self.error = None
+
+    def __call__(self, iterable):
+        return self.detect(iterable)
+
+    def read(self, iterable, data_queue, stopped):
+        def put(item):
+            while not stopped.is_set():
+                try:
+                    data_queue.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        try:
+            for data in iterable:
+                if not put(data):
+                    return
+        except Exception as e:
+            self.error = e
+        put(self._end)
+
+    def batches(self, iterable):
+        data_queue = queue.Queue(2 * self.batch_size)
+        stopped = Event()
+        thread = Thread(target=self.read, args=(iterable, data_queue, stopped), name="DetectObjectBatchPipe",
+                        daemon=True)
+        thread.start()
+
+        try:
+            ended = False
+            while not ended:
+                data = data_queue.get()
+                if data is self._end:
+                    break
+
+                # Collect the batch until it's full or the latency budget of its first frame is spent
+                batch = [data]
+                deadline = time.perf_counter() + self.max_latency
+                while len(batch) < self.batch_size:
+                    timeout = deadline - time.perf_counter()
+                    try:
+                        data = data_queue.get(timeout=timeout) if timeout > 0 else data_queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if data is self._end:
+                        ended = True
+                        break
+                    batch.append(data)
+
+                yield batch
+        finally:
+            stopped.set()
+            thread.join(1.0)
+
+        if self.error:
+            raise self.error
+
+    def detect(self, iterable):
+        for batch in self.batches(iterable):
+            # Detect objects
+            locations = self.detector.detect_batch([data["image"] for data in batch])
+            for (data, object_locations) in zip(batch, locations):
+                data["object_locations"] = object_locations
+                yield data
+
+
+class DetectObjectAsyncPipe:
+    """Detects the objects on a worker thread while the pipeline goes on with the next frames.
+
+    A copy of the frame is handed to the worker whenever it's idle, so the detector runs as often as it can
+    (`frame_skip` of the detector is not used) and the inference latency is not paid in-line. The frames
+    without fresh detections get no object locations (tracker-only frames), the detections are passed
+    with the first frame after they arrive, along with the index of the frame they were computed on
+    (`object_locations_idx`, `TrackObjectPipe` moves them by the motion of the tracked objects since then).
+
+    :param dict conf: object detector configuration
+    """
+    def __init__(self, conf):
+        model = conf["model"]
+        self.detector = ObjectDetector({**conf, model: {**conf[model], "frame_skip": None}})
+        self.executor = ThreadPoolExecutor(1, thread_name_prefix="DetectObjectAsyncPipe")
+        self.future = None
+        self.future_idx = None
+
+    def __call__(self, data):
+        return self.detect(data)
+
+    def detect(self, data):
+        data["object_locations"] = make_detections([])
+        data["object_locations_idx"] = None
+
+        # Pass the detections of the finished frame
+        if self.future is not None and self.future.done():
+            data["object_locations"] = self.future.result()
+            data["object_locations_idx"] = self.future_idx
+            self.future = None
+
+        # Detect objects on the idle worker (the frame may be drawn on by the next pipes, so copy it)
+        if self.future is None:
+            self.future = self.executor.submit(self.detector.detect, data["image"].copy())
+            self.future_idx = data.get("idx")
+
+        return data
+
+    def close(self):
+        self.executor.shutdown()
+
+
+class DetectObjectGatedPipe:
+    """Detects the objects only when there is motion in the frame.
+
+    The motion detector decides on the frames due for the detection (every `frame_skip` frames) whether
+    the object detector needs to run:
+
+    - without motion the last detections are reused,
+    - when the motion regions are small (their union covers at most `max_roi_area` of the frame) the objects
+      are detected in the union of the regions only (padded by `roi_padding` pixels, not upscaled to the network
+      input width) and the last detections out of it are kept, unless the network input of the region would be
+      larger than the one of the whole frame (e.g. tall regions),
+    - otherwise the objects are detected in the whole frame.
+
+    The last detections are reused (or kept) at most `max_staleness` frames after the last detection
+    in the whole frame. The skipped detector calls and the estimated saved time are reported on close.
+
+    :param dict conf: object detector configuration with the `motionGate` section (motion detector options
+        and `max_staleness`, `max_roi_area`, `roi_padding`)
+    """
+    def __init__(self, conf):
+        self.logger = logging.getLogger(__name__)
+
+        model = conf["model"]
+        self.frame_skip = conf[model].get("frame_skip")
+        self.detector = ObjectDetector({**conf, model: {**conf[model], "frame_skip": None}})
+
+        gate_conf = dict(conf["motionGate"])
+        self.max_staleness = gate_conf.pop("max_staleness", 100)
+        self.max_roi_area = gate_conf.pop("max_roi_area", 0.25)
+        self.roi_padding = gate_conf.pop("roi_padding", 32)
+        self.motion_detector = MotionDetector(**gate_conf)
+
+        self.iteration = 0
+        self.last_locations = make_detections([])
+        self.last_full_iteration = None
+
+        # Number and time of the detector calls on the whole frames and on the motion regions,
+        # number of the skipped calls and the time of the motion detection
+        self.full_calls = 0
+        self.full_time = 0.0
+        self.roi_calls = 0
+        self.roi_time = 0.0
+        self.skipped = 0
+        self.motion_time = 0.0
+
+    def __call__(self, data):
+        return self.detect(data)
+
+    def roi(self, motion_locations, shape):
+        """Returns the padded union of the motion regions (grown over the overlapped last detections,
+        so they are detected again whole) if it's small enough or None"""
+        (h, w) = shape[:2]
+        locations = np.array(motion_locations)
+        start = np.maximum(locations[:, :2].min(axis=0) - self.roi_padding, 0)
+        end = np.minimum(locations[:, 2:4].max(axis=0) + self.roi_padding, (w, h))
+
+        boxes = self.last_locations["box"]
+        overlapped = boxes[self.overlaps(boxes, (*start, *end))]
+        if len(overlapped):
+            start = np.minimum(start, overlapped[:, :2].min(axis=0))
+            end = np.maximum(end, overlapped[:, 2:].max(axis=0))
+
+        if np.prod(end - start) > self.max_roi_area * w * h:
+            return None
+
+        # The region must be cheaper to detect than the whole frame
+        (roi_w, roi_h) = self.detector.input_size(*(end - start).tolist(), upscale=False)
+        (full_w, full_h) = self.detector.input_size(w, h)
+        if roi_w * roi_h >= full_w * full_h:
+            return None
+
+        return (*start.tolist(), *end.tolist())
+
+    @staticmethod
+    def overlaps(boxes, roi):
+        (x1, y1, x2, y2) = roi
+        return (boxes[:, 2] > x1) & (boxes[:, 0] < x2) & (boxes[:, 3] > y1) & (boxes[:, 1] < y2)
+
+    def detect(self, data):
+        image = data["image"]
+        locations = make_detections([])
+
+        if self.frame_skip is None or self.iteration % (self.frame_skip + 1) == 0:
+            start_time = time.perf_counter()
+            motion_locations = self.motion_detector.detect(image)
+            self.motion_time += time.perf_counter() - start_time
+
+            fresh = self.last_full_iteration is not None and \
+                self.iteration - self.last_full_iteration <= self.max_staleness
+            roi = self.roi(motion_locations, image.shape) if fresh and motion_locations else None
+
+            start_time = time.perf_counter()
+            if fresh and not motion_locations:
+                # Nothing moved, reuse the last detections (the next pipes may modify them)
+                locations = self.last_locations.copy()
+                self.skipped += 1
+            elif roi is not None:
+                # Detect objects in the motion region and keep the last detections out of it
+                (x1, y1, x2, y2) = roi
+                roi_locations = self.detector.detect(image[y1:y2, x1:x2], upscale=False)
+                roi_locations["box"] += (x1, y1, x1, y1)
+                outside = ~self.overlaps(self.last_locations["box"], roi)
+                locations = np.concatenate((self.last_locations[outside], roi_locations))
+                self.roi_calls += 1
+                self.roi_time += time.perf_counter() - start_time
+            else:
+                # Detect objects in the whole frame
+                locations = self.detector.detect(image)
+                self.last_full_iteration = self.iteration
+                self.full_calls += 1
+                self.full_time += time.perf_counter() - start_time
+            self.last_locations = locations
+
+        self.iteration += 1
+        data["object_locations"] = locations
+
+        return data
+
+    def stats(self):
+        """Returns the detector call counters and the time saved by the gate.
+
+        The saved time is estimated from the mean time of the detection in the whole frame,
+        less the time spent on the motion detection and the detection in the motion regions.
+
+        :rtype: dict
+        """
+        calls = self.full_calls + self.roi_calls + self.skipped
+        mean_full_time = self.full_time / self.full_calls if self.full_calls else 0.0
+        saved_time = (self.skipped + self.roi_calls) * mean_full_time - self.roi_time - self.motion_time
+
+        return {
+            "calls": calls,
+            "full_calls": self.full_calls,
+            "roi_calls": self.roi_calls,
+            "skipped": self.skipped,
+            "saved_time": saved_time
+        }
+
+    def close(self):
+        stats = self.stats()
+        if stats["calls"]:
+            self.logger.info(f"Object detector skipped {stats['skipped']} of {stats['calls']} calls "
+                             f"({stats['skipped'] / stats['calls']:.1%}), "
+                             f"{stats['roi_calls']} calls on the motion regions, "
+                             f"saved {stats['saved_time']:.3f} s")
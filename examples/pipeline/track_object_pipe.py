@@ -1,19 +1,76 @@
+import numpy as np
+
 from modules.object_tracker import ObjectTracker
 
 
 class TrackObjectPipe:
+    """Tracks the detected objects.
+
+    The detections computed on an earlier frame (`object_locations_idx`, see `DetectObjectAsyncPipe`) are
+    moved to the current frame before the trackers are restarted: every stale box is matched to the tracked
+    object whose centroid on the detected frame is inside of it (the nearest to the box center) and shifted
+    by the motion of the object since then. The unmatched boxes (e.g. new objects) are kept as they are.
 
+    :param dict conf: object tracker configuration
+    """
     def __init__(self, conf):
         self.tracker = ObjectTracker(conf)
+        self.tracked_objects = []
 
     def __call__(self, data):
         return self.detect(data)
 
+    def compensate(self, object_locations, lag, shape):
+        """Shift the detections by the motion of the tracked objects in the last `lag` frames.
+
+        :param numpy.ndarray object_locations: (N,) detections (see DETECTION_DTYPE)
+        :param int lag: number of the tracked frames since the frame of the detections
+        :param tuple shape: shape of the current frame
+
+        :returns: shifted detections
+        :rtype: numpy.ndarray
+        """
+        # Centroids of the objects tracked since the frame of the detections, then and now
+        tracks = [tracked_object["centroids"] for tracked_object in self.tracked_objects
+                  if len(tracked_object["centroids"]) > lag]
+        if not tracks or not len(object_locations):
+            return object_locations
+        past = np.array([centroids[-1 - lag] for centroids in tracks], dtype=np.float64)
+        motion = np.array([centroids[-1] for centroids in tracks], dtype=np.float64) - past
+
+        # Match the boxes to the nearest past centroids inside of them
+        boxes = object_locations["box"]
+        centers = (boxes[:, :2] + boxes[:, 2:]) / 2
+        distances = np.linalg.norm(centers[:, None] - past[None], axis=2)
+        inside = (past[None, :, 0] >= boxes[:, None, 0]) & (past[None, :, 0] <= boxes[:, None, 2]) & \
+                 (past[None, :, 1] >= boxes[:, None, 1]) & (past[None, :, 1] <= boxes[:, None, 3])
+        distances[~inside] = np.inf
+        nearest = distances.argmin(axis=1)
+        matched = np.isfinite(distances[np.arange(len(boxes)), nearest])
+
+        shift = np.where(matched[:, None], np.round(motion[nearest]), 0).astype(np.int32)
+        (h, w) = shape[:2]
+        object_locations = object_locations.copy()
+        object_locations["box"] = np.clip(boxes + np.tile(shift, 2), 0, (w, h, w, h))
+
+        return object_locations
+
     def detect(self, data):
         image = data["image"]
         object_locations = data["object_locations"]
 
+        # Move the detections of an earlier frame to the current one
+        object_locations_idx = data.get("object_locations_idx")
+        if object_locations_idx is not None and data.get("idx") is not None:
+            lag = data["idx"] - 1 - object_locations_idx
+            if lag > 0:
+                object_locations = self.compensate(object_locations, lag, image.shape)
+
         # Track objects
-        data["tracked_objects"] = self.tracker.track(image, object_locations)
+        self.tracked_objects = self.tracker.track(image, object_locations)
+        data["tracked_objects"] = self.tracked_objects
 
         return data
+
+    def close(self):
+        self.tracker.close()
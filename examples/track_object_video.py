@@ -5,7 +5,7 @@ from dvgutils.pipeline import CaptureVideoPipe, MetricsPipe, Pipeline, ShowImage
 
 from utils.vis import visualize_frame_info, visualize_tracked_object_locations
 from pipeline.track_object_pipe import TrackObjectPipe
-from pipeline.detect_object_pipe import DetectObjectPipe
+from pipeline.detect_object_pipe import DetectObjectPipe, DetectObjectAsyncPipe, DetectObjectGatedPipe
 
 
 def parse_args():
@@ -22,7 +22,7 @@ def parse_args():
     parser.add_argument("--no-progress", dest="progress", action="store_false",
                         help="don't display progress")
     parser.add_argument("--metrics", type=str,
-                        help="metrics file name")
+                        help="metrics file name (.npy for the binary format)")
     parser.add_argument("--fps", type=int,
                         help="output video fps")
 
@@ -65,7 +65,13 @@ def track_object(args):
 
     # Setup pipeline steps
     capture_video_pipe = CaptureVideoPipe(conf["videoCapture"])
-    object_detector_pipe = DetectObjectPipe(conf["objectDetector"])
+    # Detect objects in-line every frame_skip frames, on a worker whenever it is idle or only on motion
+    if conf["objectDetector"].get("asynchronous", False):
+        object_detector_pipe = DetectObjectAsyncPipe(conf["objectDetector"])
+    elif conf["objectDetector"].get("motionGate"):
+        object_detector_pipe = DetectObjectGatedPipe(conf["objectDetector"])
+    else:
+        object_detector_pipe = DetectObjectPipe(conf["objectDetector"])
     track_object_pipe = TrackObjectPipe(conf["objectTracker"])
     visualize_data_pipe = VisualizeDataPipe("vis_image")
     video_fps = args["fps"] if args["fps"] is not None else capture_video_pipe.video_capture.fps
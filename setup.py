@@ -25,7 +25,6 @@ setup(
     license="MIT",
     classifiers=[
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.6",
         "Programming Language :: Python :: 3.7",
         "Programming Language :: Python :: 3.8",
         "Environment :: Console",
@@ -34,5 +33,5 @@ setup(
         "Operating System :: OS Independent",
     ],
     scripts=["bin/dvg-utils"],
-    python_requires='>=3.6'
+    python_requires='>=3.7'
 )
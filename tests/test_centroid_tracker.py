@@ -0,0 +1,154 @@
+import itertools
+import os
+import sys
+
+import numpy as np
+import pytest
+from scipy.spatial import distance as dist
+
+import tests.config as config
+
+sys.path.insert(0, os.path.join(config.MAIN_DIR, "examples"))
+
+from modules.object_tracker.centroid_tracker import CentroidTracker  # noqa: E402
+
+
+class LegacyCentroidTracker:
+    """The original dict based tracker (greedy association, the new objects are registered in the order
+    of the detections)"""
+    def __init__(self, max_disappeared, max_distance):
+        self.next_object_id = 0
+        self.objects = {}
+        self.disappeared = {}
+        self.max_disappeared = max_disappeared
+        self.max_distance = max_distance
+
+    def register(self, centroid):
+        self.objects[self.next_object_id] = centroid
+        self.disappeared[self.next_object_id] = 0
+        self.next_object_id += 1
+
+    def deregister(self, object_id):
+        del self.objects[object_id]
+        del self.disappeared[object_id]
+
+    def update(self, rects):
+        if len(rects) == 0:
+            for object_id in list(self.disappeared):
+                self.disappeared[object_id] += 1
+                if self.disappeared[object_id] > self.max_disappeared:
+                    self.deregister(object_id)
+            return self.objects
+
+        input_centroids = ((rects[:, :2] + rects[:, 2:]) / 2).astype(int)
+        if len(self.objects) == 0:
+            for centroid in input_centroids:
+                self.register(centroid)
+            return self.objects
+
+        object_ids = list(self.objects)
+        d = dist.cdist(np.array(list(self.objects.values())), input_centroids)
+        rows = d.min(axis=1).argsort(kind="stable")
+        cols = d.argmin(axis=1)[rows]
+        used_rows, used_cols = set(), set()
+        for (row, col) in zip(rows, cols):
+            if row in used_rows or col in used_cols or d[row, col] > self.max_distance:
+                continue
+            self.objects[object_ids[row]] = input_centroids[col]
+            self.disappeared[object_ids[row]] = 0
+            used_rows.add(row)
+            used_cols.add(col)
+
+        if d.shape[0] >= d.shape[1]:
+            for row in sorted(set(range(d.shape[0])) - used_rows):
+                self.disappeared[object_ids[row]] += 1
+                if self.disappeared[object_ids[row]] > self.max_disappeared:
+                    self.deregister(object_ids[row])
+        else:
+            for col in sorted(set(range(d.shape[1])) - used_cols):
+                self.register(input_centroids[col])
+
+        return self.objects
+
+
+def random_walk(num_objects, num_frames, dropout, seed=0):
+    """Boxes of the objects walking randomly, each box is missing with the `dropout` probability"""
+    rng = np.random.RandomState(seed)
+    positions = rng.uniform(0, 2000, (num_objects, 2))
+    for _ in range(num_frames):
+        positions += rng.normal(0, 5, positions.shape)
+        visible = positions[rng.uniform(size=num_objects) >= dropout]
+        yield np.hstack((visible - 10, visible + 10)).astype(np.int64)
+
+
+def test_greedy_legacy():
+    tracker = CentroidTracker(max_disappeared=5, max_distance=40, assignment="greedy", index="dense")
+    legacy = LegacyCentroidTracker(max_disappeared=5, max_distance=40)
+    for rects in random_walk(200, 100, 0.1):
+        objects, _ = tracker.update(rects)
+        legacy_objects = legacy.update(rects)
+        assert list(objects) == list(legacy_objects)
+        assert all(np.array_equal(objects[object_id], legacy_objects[object_id]) for object_id in objects)
+
+
+def test_grid_index():
+    # Crowded objects (many in the same grid cells) and detections out of the grid of the objects
+    for assignment in ("greedy", "hungarian"):
+        for seed in range(5):
+            tracker = CentroidTracker(max_disappeared=3, max_distance=30, assignment=assignment, index="dense")
+            for rects in random_walk(300, 30, 0.2, seed):
+                rects = rects // (seed + 1) - 50 * seed
+                centroids = ((rects[:, :2] + rects[:, 2:]) / 2).astype(np.int64)
+                if len(tracker.ids) and len(centroids):
+                    d = tracker.distances(centroids)
+                    rows, cols = tracker.assign(d)
+                    grid_rows, grid_cols = tracker.assign_sparse(*tracker.neighbours(centroids), d.shape)
+                    if assignment == "greedy":
+                        assert sorted(zip(rows, cols)) == sorted(zip(grid_rows, grid_cols))
+                    else:
+                        # The optimal assignments may differ on ties of the total distance
+                        assert len(rows) == len(grid_rows)
+                        assert np.isclose(d[rows, cols].sum(), d[grid_rows, grid_cols].sum())
+                tracker.update(rects)
+
+
+def brute_force_assignment(d, max_distance):
+    """The most associated pairs within the max distance with the minimal total distance"""
+    best = (0, 0.0)
+    for matched in itertools.permutations(range(max(d.shape)), min(d.shape)):
+        if d.shape[0] <= d.shape[1]:
+            pairs = [(row, col) for row, col in enumerate(matched) if d[row, col] <= max_distance]
+        else:
+            pairs = [(row, col) for col, row in enumerate(matched) if d[row, col] <= max_distance]
+        key = (len(pairs), -sum(d[row, col] for row, col in pairs))
+        if key > best:
+            best = key
+
+    return best
+
+
+def test_hungarian_assignment():
+    rng = np.random.RandomState(0)
+    tracker = CentroidTracker(max_distance=30, assignment="hungarian")
+    for _ in range(200):
+        d = rng.uniform(0, 60, (rng.randint(1, 6), rng.randint(1, 6)))
+        expected = brute_force_assignment(d, tracker.max_distance)
+
+        rows, cols = tracker.assign(d)
+        assert (len(rows), -d[rows, cols].sum()) == pytest.approx(expected)
+
+        sparse_rows, sparse_cols = np.nonzero(d <= tracker.max_distance)
+        rows, cols = tracker.assign_sparse(sparse_rows, sparse_cols, d[sparse_rows, sparse_cols], d.shape)
+        assert (len(rows), -d[rows, cols].sum()) == pytest.approx(expected)
+
+
+def test_coast():
+    tracker = CentroidTracker(max_disappeared=2, max_distance=30)
+    tracker.update(np.array([[0, 0, 20, 20], [100, 100, 120, 120], [200, 200, 220, 220]]))
+    assert tracker.rect_ids.tolist() == [0, 1, 2]
+
+    # Only the object 1 is updated, the object 2 is not due for the update and the object 0 is lost
+    for _ in range(3):
+        tracker.update(np.array([[102, 100, 122, 120]]), coast=[2])
+        assert tracker.rect_ids.tolist() == [1]
+    assert tracker.disappeared == {1: 0, 2: 0}
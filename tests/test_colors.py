@@ -0,0 +1,33 @@
+import numpy as np
+
+from dvgutils import colors
+from dvgutils.colors import RGB, GREEN, distinct_colors
+
+
+def test_palette_names():
+    assert colors.get("green") == GREEN == RGB(0, 128, 0)
+    assert colors.get("green").bgr() == (0, 128, 0)
+    assert colors["red"].bgr() == (0, 0, 255)
+    assert colors.get("unknown") is None
+    assert "red" in colors
+    assert list(colors) == sorted(colors)
+
+
+def test_palette_ids():
+    assert colors.bgr.shape == (len(colors), 3)
+    assert colors.bgr.dtype == np.uint8
+    assert tuple(colors.bgr[colors.index["red"]]) == colors["red"].bgr()
+
+    ids = np.array([colors.index["red"], colors.index["blue"], colors.index["red"] + len(colors)])
+    assert np.array_equal(colors[ids], [colors["red"].bgr(), colors["blue"].bgr(), colors["red"].bgr()])
+
+
+def test_distinct_colors():
+    bgr = distinct_colors(np.arange(1000))
+    assert bgr.shape == (1000, 3)
+    assert bgr.dtype == np.uint8
+    # Deterministic
+    assert np.array_equal(bgr, distinct_colors(np.arange(1000)))
+    assert np.array_equal(bgr[7], distinct_colors(7))
+    # Consecutive ids get different colors
+    assert (np.abs(bgr[1:].astype(int) - bgr[:-1]).max(axis=1) > 30).all()
@@ -0,0 +1,40 @@
+import os
+import subprocess
+import sys
+
+import tests.config as config
+
+# Dependencies which must not be imported when importing the package or running the command-line tool help
+HEAVY_MODULES = {"cv2", "numpy", "yaml", "tqdm", "matplotlib"}
+
+
+def imported_modules(*args):
+    """Returns names of the modules imported by the python process (reported by python -X importtime)."""
+    env = {**os.environ, "PYTHONPATH": config.MAIN_DIR}
+    result = subprocess.run([sys.executable, "-X", "importtime", *args], cwd=config.MAIN_DIR, env=env,
+                            stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True)
+    assert result.returncode == 0, result.stderr
+
+    return {line.split("|")[-1].strip() for line in result.stderr.splitlines() if line.startswith("import time:")}
+
+
+def test_import_dvgutils():
+    modules = imported_modules("-c", "import dvgutils, dvgutils.modules, dvgutils.pipeline, dvgutils.commands")
+
+    assert "dvgutils" in modules
+    assert not modules & HEAVY_MODULES
+
+
+def test_dvg_utils_help():
+    modules = imported_modules(os.path.join(config.MAIN_DIR, "bin", "dvg-utils"), "--help")
+
+    assert not modules & HEAVY_MODULES
+
+
+def test_import_command_after_submodule():
+    # The command submodules are named after the commands, the package attribute must stay the command
+    import dvgutils.commands.plot_metrics
+    from dvgutils.commands import plot_metrics
+
+    assert callable(plot_metrics)
+    assert not isinstance(plot_metrics, type(dvgutils.commands))
@@ -0,0 +1,118 @@
+import math
+import time
+
+import numpy as np
+
+from dvgutils.commands.plot_metrics import load_chart
+from dvgutils.helpers.histogram import Histogram
+from dvgutils.modules import Metrics
+from dvgutils.modules.metrics import load_metrics
+
+
+def legacy_metrics(times):
+    rows = []
+    elapsed = 0.0
+    for i, iter_time in enumerate(times):
+        rows.append((iter_time, i / elapsed if elapsed else 0, elapsed / i if elapsed else 0))
+        elapsed += iter_time
+    return np.array(rows)
+
+
+def run(metrics, n):
+    metrics.start()
+    for _ in range(n):
+        time.sleep(0.0001)
+        metrics.update()
+    return metrics
+
+
+def test_metrics_get(tmp_path):
+    metrics = run(Metrics(chunk_size=16), 50)
+    rows = metrics.get()
+    assert len(metrics) == 50
+    assert rows.shape == (50, 3)
+    assert np.allclose(rows, legacy_metrics(rows[:, 0]))
+    assert math.isclose(rows[:, 0].sum(), metrics.elapsed())
+
+    filename = str(tmp_path / "metrics.txt")
+    metrics.save(filename)
+    assert np.allclose(np.loadtxt(filename), rows)
+
+
+def test_metrics_bounded():
+    metrics = run(Metrics(capacity=16), 50)
+    rows = metrics.get()
+    assert len(metrics) == 50
+    assert rows.shape == (16, 3)
+    assert metrics._chunks[0].shape == (16,)
+
+    # Statistics are kept over all iterations
+    assert metrics.max() >= rows[:, 0].max()
+    assert math.isclose(metrics.mean() * len(metrics), metrics.elapsed())
+    assert math.isclose(rows[-1, 1], 49 / (metrics.elapsed() - rows[-1, 0]))
+
+
+def test_metrics_statistics():
+    metrics = run(Metrics(window=10), 100)
+    times = metrics.times()
+    assert math.isclose(metrics.mean(), times.mean())
+    assert math.isclose(metrics.std(), times.std())
+    assert metrics.min() == times.min() and metrics.max() == times.max()
+    assert math.isclose(metrics.rolling_iter_per_sec(), 10 / times[-10:].sum())
+
+    summary = metrics.summary()
+    assert summary["iterations"] == 100
+    assert summary["min"] <= summary["p50"] <= summary["p95"] <= summary["p99"] <= summary["max"] * 1.02
+
+
+def test_histogram():
+    histogram = Histogram()
+    values = np.random.RandomState(0).lognormal(-4, 1, 10000)
+    for value in values:
+        histogram.add(value)
+
+    for q, estimate in zip((0.5, 0.95, 0.99), histogram.quantiles(0.5, 0.95, 0.99)):
+        assert abs(estimate / np.quantile(values, q) - 1) < 0.02
+    assert histogram.count == len(values)
+    assert math.isnan(Histogram().quantile(0.5))
+
+    vectorized = Histogram()
+    vectorized.add_array(values)
+    assert vectorized.counts == histogram.counts
+
+
+def test_metrics_log(tmp_path):
+    filename = str(tmp_path / "metrics.npy")
+    metrics = Metrics(chunk_size=8, log=filename).start()
+    for _ in range(21):
+        metrics.update()
+    metrics.flush()
+    assert np.array_equal(load_metrics(filename), metrics.times())
+
+    for _ in range(5):
+        metrics.update()
+    metrics.close()
+    assert np.array_equal(np.load(filename, mmap_mode="r"), metrics.times())
+
+    metrics.save(str(tmp_path / "saved.npy"))
+    assert np.array_equal(load_metrics(str(tmp_path / "saved.npy")), metrics.times())
+
+
+def test_load_chart(tmp_path):
+    metrics = run(Metrics(), 1000)
+    filename = str(tmp_path / "metrics.txt")
+    metrics.save(filename)
+    rows = metrics.get()
+    times = metrics.times()
+
+    for chart, column, scale in (("iter", 0, 1000), ("ips", 1, 1), ("spi", 2, 1000)):
+        for data in (times, load_metrics(filename)):
+            iterations, values, stats = load_chart(data, chart, points=100)
+            assert len(values) == 200
+            # Min/max decimation keeps the extremes at their iterations
+            assert np.allclose(values, rows[iterations - 1, column] * scale)
+            assert np.isclose(values.max(), rows[:, column].max() * scale)
+            assert np.isclose(stats["chart_mean"], rows[:, column].mean() * scale)
+            assert np.isclose(stats["mean"], times.mean())
+            assert stats["max"] == times.max()
+            assert stats["p95"] <= stats["p99"] <= stats["max"] * 1.02
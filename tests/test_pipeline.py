@@ -1,3 +1,4 @@
+import time
 from collections import deque
 
 from dvgutils.pipeline import Pipeline
@@ -143,4 +144,93 @@ class TestPipeline:
 
         captured = capsys.readouterr()
 
-        assert captured.out == "1\n1\n2\n2\n3\n3\n4\n4\n5\n5\n"
\ No newline at end of file
+        assert captured.out == "1\n1\n2\n2\n3\n3\n4\n4\n5\n5\n"
+
+    def test_pipeline_stats(self, capsys):
+        pipeline = Pipeline(GenerateNumbersPipe(10), stats=True)
+        pipeline.filter(IsMultipleOfPipe(factor=2))
+        pipeline.iter(BatchPipe(batch_size=2))
+        pipeline.map(PrintPipe(key="batch_no"))
+
+        pipeline.run()
+
+        assert capsys.readouterr().out == "1\n1\n2\n2\n"
+        snapshots = {snapshot.name: snapshot for snapshot in pipeline.snapshot()}
+        assert list(snapshots) == ["GenerateNumbersPipe", "IsMultipleOfPipe", "BatchPipe", "PrintPipe"]
+        assert snapshots["GenerateNumbersPipe"].frames_out == 10
+        assert (snapshots["IsMultipleOfPipe"].frames_in, snapshots["IsMultipleOfPipe"].frames_out) == (10, 5)
+        assert snapshots["BatchPipe"].frames_out == 4
+        assert (snapshots["PrintPipe"].frames_in, snapshots["PrintPipe"].frames_out) == (4, 4)
+        assert sum(snapshots["PrintPipe"].buckets) == 4
+
+    def test_metrics_exporter(self, tmp_path):
+        import urllib.request
+
+        from dvgutils.modules import Metrics, MetricsExporter
+
+        metrics = Metrics(window=5).start()
+        pipeline = Pipeline(GenerateNumbersPipe(10), stats=True)
+        pipeline.map(MovingAveragePipe())
+        pipeline.map(lambda data: metrics.update() or data)
+        pipeline.run()
+
+        textfile = str(tmp_path / "dvg.prom")
+        exporter = MetricsExporter(pipeline, metrics, port=0, textfile=textfile, interval=0.01).start()
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{exporter.port}/metrics") as response:
+                text = response.read().decode("utf-8")
+        finally:
+            exporter.close()
+
+        assert 'dvg_pipe_latency_seconds_bucket{pipe="MovingAveragePipe",le="+Inf"} 10' in text
+        assert 'dvg_pipe_frames_out_total{pipe="GenerateNumbersPipe"} 10' in text
+        assert "dvg_iterations_total 10" in text
+        assert "# TYPE dvg_fps gauge" in text
+        with open(textfile) as f:
+            assert f.read().splitlines()[:3] == text.splitlines()[:3]
+
+    def test_pipeline_profile(self, tmp_path):
+        def busy(data):
+            end_time = time.perf_counter() + 0.002
+            while time.perf_counter() < end_time:
+                pass
+            return data
+
+        profile = str(tmp_path / "profile.folded")
+        pipeline = Pipeline(GenerateNumbersPipe(100), profile=profile, profile_interval=0.001)
+        pipeline.map(MovingAveragePipe())
+        pipeline.map(busy)
+        pipeline.run()
+        pipeline.close()
+
+        pipe_samples = pipeline.profiler.pipe_samples()
+        assert pipe_samples.most_common(1)[0][0] == "busy"
+        with open(profile) as f:
+            lines = f.read().splitlines()
+        stack, count = lines[0].rsplit(" ", 1)
+        assert stack.startswith("MainThread;[busy];")
+        assert int(count) > 0
+
+    def test_pipeline_memory(self):
+        class LeakPipe:
+            def __init__(self):
+                self.history = []
+
+            def __call__(self, data):
+                time.sleep(0.001)
+                self.history.append(bytearray(10000))
+                return data
+
+        pipeline = Pipeline(GenerateNumbersPipe(300), memory=True, memory_interval=0.02)
+        pipeline.map(MovingAveragePipe())
+        pipeline.map(LeakPipe())
+        pipeline.run()
+        pipeline.close()
+
+        memory_tracker = pipeline.memory_tracker
+        first, last = memory_tracker.samples[0], memory_tracker.samples[-1]
+        assert last.pipes["LeakPipe"] - first.pipes["LeakPipe"] >= 300 * 10000
+        assert last.pipes["MovingAveragePipe"] < 10000
+        assert "LeakPipe" in memory_tracker.growing()
+        assert "MovingAveragePipe" not in memory_tracker.growing()
+        assert "Top 10 allocation sites by growth:" in memory_tracker.report()
@@ -0,0 +1,73 @@
+import os
+import subprocess
+import sys
+import time
+
+from dvgutils.helpers import timeit
+
+import tests.config as config
+
+
+@timeit
+def sleep(seconds):
+    time.sleep(seconds)
+    return seconds
+
+
+def test_timeit_aggregate():
+    timeit.reset()
+    with timeit.aggregate(log_report=False) as registry:
+        for _ in range(20):
+            assert sleep(0.001) == 0.001
+    assert timeit.get_mode() == "log"
+
+    stats = registry[f"{__name__}.sleep"]
+    assert stats.count == 20
+    assert 1e6 <= stats.min <= stats.quantile(0.5) <= stats.quantile(0.99) <= stats.max
+    assert stats.total >= 20 * 1e6
+
+    report = timeit.report()
+    assert report.splitlines()[1].startswith(f"{__name__}.sleep")
+
+    # Calls are not aggregated outside of the aggregate mode
+    sleep(0)
+    assert stats.count == 20
+
+
+def test_timeit_methods():
+    class First:
+        @timeit
+        def detect(self):
+            pass
+
+    class Second:
+        @timeit
+        def detect(self):
+            pass
+
+    with timeit.aggregate(log_report=False) as registry:
+        First().detect()
+        Second().detect()
+        Second().detect()
+
+    assert registry[f"{__name__}.{First.detect.__qualname__}"].count == 1
+    assert registry[f"{__name__}.{Second.detect.__qualname__}"].count == 2
+
+
+def test_timeit_stats_quantile():
+    stats = timeit.Stats("test")
+    for elapsed_ns in range(1, 100001):
+        stats.add(elapsed_ns)
+    for q in (0.5, 0.95, 0.99):
+        assert abs(stats.quantile(q) / (q * 100000) - 1) < 0.07
+
+
+def test_timeit_env():
+    code = ("from dvgutils.helpers import timeit\n"
+            "@timeit\n"
+            "def f(): pass\n"
+            "f(); f()\n"
+            "print(timeit.get_mode(), timeit.registry['__main__.f'].count)")
+    env = {**os.environ, "PYTHONPATH": config.MAIN_DIR, "DVG_TIMEIT": "aggregate"}
+    output = subprocess.run([sys.executable, "-c", code], env=env, stdout=subprocess.PIPE, check=True).stdout
+    assert output.decode().split() == ["aggregate", "2"]
@@ -1,7 +1,11 @@
 import cv2
 import os
+from concurrent.futures import ThreadPoolExecutor
 
-from dvgutils.vis import resize, rectangle_overlay, put_text
+import numpy as np
+
+from dvgutils.vis import resize, resize_batch, Resizer, rectangle_overlay, rectangle_overlays, put_text, TextCache, \
+    draw_boxes, draw_trails, draw_points, Layer
 from dvgutils import colors
 
 import tests.config as config
@@ -59,6 +63,54 @@ class TestVis:
         cv2.imwrite(os.path.join(output_path, "test_resize_vertical_with_padding_w_600_h_300_pad.png"), image_test)
         assert image_test.shape[:2] == (300, 600)
 
+    def test_resizer(self):
+        image_path = os.path.join(config.ASSETS_IMAGES_DIR, "friends", "friends_01.jpg")
+        image = cv2.imread(image_path)
+
+        resizer = Resizer(width=300, height=600, pad=True, pad_color=(255, 0, 0), buffers=2)
+        image_test_1 = resizer(image)
+        image_test_2 = resizer(image)
+        image_test_3 = resizer(image)
+        assert image_test_1.shape[:2] == (600, 300)
+        assert image_test_1 is not image_test_2
+        assert image_test_1 is image_test_3
+        assert np.array_equal(image_test_3, resize(image, width=300, height=600, pad=True, pad_color=(255, 0, 0)))
+        assert tuple(image_test_3[0, 0]) == (255, 0, 0)
+
+        # The same size - return original image
+        assert Resizer(width=image.shape[1])(image) is image
+
+    def test_resize_pad_square_and_alpha(self):
+        image_path = os.path.join(config.ASSETS_IMAGES_DIR, "friends", "friends_01.jpg")
+        image = cv2.imread(image_path)
+
+        # Square size - the image is stretched without padding
+        assert np.array_equal(resize(image, width=300, height=300, pad=True), resize(image, width=300, height=300))
+
+        # The pad color of an image with alpha channel
+        image = cv2.cvtColor(image, cv2.COLOR_BGR2BGRA)
+        image_test = resize(image, width=300, height=600, pad=True, pad_color=(255, 0, 0))
+        assert image_test.shape == (600, 300, 4)
+        assert tuple(image_test[0, 0]) == (255, 0, 0, 0)
+
+    def test_resize_batch(self):
+        image_path = os.path.join(config.ASSETS_IMAGES_DIR, "friends", "friends_01.jpg")
+        image = cv2.imread(image_path)
+        images = [image, cv2.flip(image, 1), cv2.flip(image, 0)]
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            batch = resize_batch(images, width=300, height=300, pad=True, executor=executor)
+        assert batch.shape == (3, 300, 300, 3)
+        assert batch.flags["C_CONTIGUOUS"]
+        for i, image_test in enumerate(images):
+            assert np.array_equal(batch[i], resize(image_test, width=300, height=300, pad=True))
+
+        batch = resize_batch(np.stack(images), width=300)
+        assert batch.shape == (3, 222, 300, 3)
+
+        blob = cv2.dnn.blobFromImages(batch, 1.0, (300, 222))
+        assert blob.shape == (3, 3, 222, 300)
+
     def test_rectangle_overlay(self):
         output_path = os.path.join(config.OUTPUT_DIR, "tests")
         os.makedirs(output_path, exist_ok=True)
@@ -71,6 +123,29 @@ class TestVis:
         cv2.imwrite(os.path.join(output_path, "test_rectangle_overlay.png"), image_overlay_red_a1)
         assert image_overlay_red_a1[200:500, 200:500, 2].sum() > image[200:500, 200:500, 2].sum()
 
+        # Compare with blending the full color image
+        roi = image[200:500, 200:500].copy()
+        rect = np.zeros(roi.shape, dtype=np.uint8)
+        rect[::] = colors.get("red").bgr()
+        assert np.array_equal(image_overlay_red_a1[200:500, 200:500], cv2.addWeighted(rect, 0.5, roi, 0.5, 0))
+
+    def test_rectangle_overlays(self):
+        image_path = os.path.join(config.ASSETS_IMAGES_DIR, "friends", "friends_01.jpg")
+        image = cv2.imread(image_path)
+
+        boxes = [(-10, -10, 100, 100), (50, 50, 200, 150), (300, 300, 2000, 2000), (10, 10, 5, 5)]
+        overlay_colors = [colors.get("red").bgr(), colors.get("green").bgr(), colors.get("blue").bgr(),
+                          colors.get("white").bgr()]
+        alphas = [0.5, 0.3, 0.8, 1.0]
+
+        image_test = image.copy()
+        rectangle_overlays(image_test, boxes, overlay_colors, alphas)
+
+        image_expected = image.copy()
+        for (x1, y1, x2, y2), color, alpha in zip(boxes, overlay_colors, alphas):
+            rectangle_overlay(image_expected, (x1, y1), (x2, y2), color, alpha)
+        assert np.array_equal(image_test, image_expected)
+
     def test_put_text(self):
         output_path = os.path.join(config.OUTPUT_DIR, "tests")
         os.makedirs(output_path, exist_ok=True)
@@ -192,3 +267,101 @@ class TestVis:
                       (pt2[0] - text_padding, pt2[1] - text_padding), colors.get("green").bgr(), 1)
         cv2.imwrite(os.path.join(output_path, "test_put_text_red_blue_br_pad.png"), image_test)
         assert text_org == (pt2[0], pt2[1])
+
+    def test_put_text_sprite(self):
+        image_path = os.path.join(config.ASSETS_IMAGES_DIR, "friends", "friends_01.jpg")
+        image = cv2.imread(image_path)
+        text_org = (500, 500)
+
+        for org_pos in ["tl", "tr", "bl", "br"]:
+            image_expected = image.copy()
+            pts_expected = put_text(image_expected, "Id 17", text_org, org_pos=org_pos,
+                                    bg_color=colors.get("green").bgr())
+            image_test = image.copy()
+            pts = put_text(image_test, "Id 17", text_org, org_pos=org_pos,
+                           bg_color=colors.get("green").bgr(), sprite=True)
+            assert pts == pts_expected
+            # Opaque labels are rendered exactly the same
+            assert np.array_equal(image_test, image_expected)
+
+        # Translucent labels differ only by rounding of the blending
+        image_expected = image.copy()
+        put_text(image_expected, "person 0.93", text_org, bg_color=colors.get("white").bgr(), bg_alpha=0.5)
+        image_test = image.copy()
+        put_text(image_test, "person 0.93", text_org, bg_color=colors.get("white").bgr(), bg_alpha=0.5,
+                 sprite=True)
+        assert np.abs(image_test.astype(int) - image_expected).max() <= 4
+
+    def test_text_cache(self):
+        text_cache = TextCache(maxsize=2)
+
+        size = text_cache.text_size("Id 1", cv2.FONT_HERSHEY_SIMPLEX, 0.5, 1)
+        assert size == cv2.getTextSize("Id 1", cv2.FONT_HERSHEY_SIMPLEX, 0.5, 1)
+        text_cache.text_size("Id 1", cv2.FONT_HERSHEY_SIMPLEX, 0.5, 1)
+        text_cache.text_size("Id 2", cv2.FONT_HERSHEY_SIMPLEX, 0.5, 1)
+        text_cache.text_size("Id 3", cv2.FONT_HERSHEY_SIMPLEX, 0.5, 1)
+        assert text_cache.info() == (1, 3, 2, 2)
+
+        # "Id 1" was evicted as the least recently used
+        text_cache.text_size("Id 1", cv2.FONT_HERSHEY_SIMPLEX, 0.5, 1)
+        assert text_cache.info() == (1, 4, 2, 2)
+
+        text_cache.clear()
+        assert text_cache.info() == (0, 0, 2, 0)
+
+    def test_draw_boxes(self):
+        image_path = os.path.join(config.ASSETS_IMAGES_DIR, "friends", "friends_01.jpg")
+        image = cv2.imread(image_path)
+        boxes = np.array([[10, 10, 100, 80], [200, 200, 300, 350], [250, 100, 400, 200]])
+        box_colors = np.array([colors.get("green").bgr(), colors.get("red").bgr(), colors.get("green").bgr()])
+
+        image_test = image.copy()
+        draw_boxes(image_test, boxes, box_colors, thickness=2)
+        image_expected = image.copy()
+        for (x1, y1, x2, y2), color in zip(boxes.tolist(), box_colors.tolist()):
+            cv2.rectangle(image_expected, (x1, y1), (x2, y2), color, 2)
+        assert np.array_equal(image_test, image_expected)
+
+        image_test = image.copy()
+        draw_boxes(image_test, boxes, box_colors, alpha=0.5, labels=["Id 1", "Id 2", "Id 3"])
+        assert not np.array_equal(image_test, image)
+
+    def test_draw_trails_and_points(self):
+        image_path = os.path.join(config.ASSETS_IMAGES_DIR, "friends", "friends_01.jpg")
+        image = cv2.imread(image_path)
+        trails = [np.array([[10, 10], [50, 60], [80, 20]]), np.array([[300, 300]]), [(100, 100), (200, 150)]]
+
+        image_test = image.copy()
+        draw_trails(image_test, trails, colors.get("red").bgr())
+        image_expected = image.copy()
+        for trail in trails:
+            for pt1, pt2 in zip(trail[:-1], trail[1:]):
+                cv2.line(image_expected, tuple(pt1), tuple(pt2), colors.get("red").bgr(), 2)
+        assert np.array_equal(image_test, image_expected)
+
+        image_test = image.copy()
+        draw_points(image_test, [trail[-1] for trail in trails], colors.get("green").bgr())
+        image_expected = image.copy()
+        for trail in trails:
+            cv2.circle(image_expected, tuple(trail[-1]), 4, colors.get("green").bgr(), -1)
+        assert np.array_equal(image_test, image_expected)
+
+    def test_layer(self):
+        image_path = os.path.join(config.ASSETS_IMAGES_DIR, "friends", "friends_01.jpg")
+        image = cv2.imread(image_path)
+
+        def render(vis_image, text, line):
+            cv2.line(vis_image, tuple(line[:2]), tuple(line[2:]), colors.get("yellow1").bgr(), 2)
+            put_text(vis_image, text, (0, 20), org_pos="bl", bg_color=colors.get("white").bgr(), bg_alpha=0.5)
+            rectangle_overlay(vis_image, (600, 300), (900, 500), colors.get("red").bgr(), 0.3)
+
+        layer = Layer(render)
+        for text in ["Crossed In: 1", "Crossed In: 1", "Crossed In: 2"]:
+            image_expected = image.copy()
+            render(image_expected, text, [10, 220, 290, 120])
+            image_test = image.copy()
+            layer.draw(image_test, text, [10, 220, 290, 120])
+            assert np.abs(image_test.astype(int) - image_expected).max() <= 4
+
+        # Layer is re-rendered only when its inputs change
+        assert layer.renders == 2